@@ -0,0 +1,80 @@
+"""
+Cerebellum 벤치마크: NumPy 백엔드 vs 스칼라 백엔드
+
+목적:
+- memory_dim별 compute_correction 틱당 시간 측정 (out= 사용, 메모리 없음/있음)
+- 스칼라 백엔드가 NumPy 백엔드보다 느려지는 교차 차원 확인
+  (cerebellum_engine.SCALAR_BACKEND_MAX_DIM 결정 근거)
+
+실행:
+    python benchmarks/benchmark_backend_crossover.py
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import numpy as np
+from cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig, SCALAR_BACKEND_MAX_DIM
+
+
+DIMS = (2, 3, 4, 5, 6, 8, 10, 12, 16, 24, 32)
+N_TICKS = 5000
+REPEATS = 5
+
+
+class ConstantMemory:
+    """항상 같은 기억을 돌려주는 메모리 (검색 비용 최소화)"""
+    def __init__(self, dim):
+        self.bias = np.full(dim, 0.001)
+
+    def retrieve(self, key, context=None):
+        return [{'bias': self.bias, 'confidence': 0.8}]
+
+
+def time_backend(dim, backend, memory=None):
+    """틱당 시간 (μs, 반복 중 최솟값)"""
+    rng = np.random.default_rng(dim)
+    states = rng.normal(0, 0.05, (N_TICKS, dim))
+    targets = states + rng.normal(0, 0.002, (N_TICKS, dim))
+    out = np.empty(dim)
+    best = float('inf')
+    for _ in range(REPEATS):
+        engine = CerebellumEngine(memory_dim=dim, config=CerebellumConfig(backend=backend), memory=memory)
+        start = time.perf_counter()
+        for t in range(N_TICKS):
+            engine.compute_correction(states[t], targets[t], dt=0.001, out=out)
+        best = min(best, (time.perf_counter() - start) / N_TICKS * 1e6)
+    return best
+
+
+def main():
+    print("=" * 70)
+    print("NumPy vs 스칼라 백엔드 (틱당 μs, out= 사용)")
+    print("=" * 70)
+    print(f"{'dim':>4} | {'numpy':>8} {'scalar':>8} {'배율':>6} | "
+          f"{'numpy+mem':>10} {'scalar+mem':>10} {'배율':>6}")
+
+    crossover = None
+    for dim in DIMS:
+        numpy_time = time_backend(dim, 'numpy')
+        scalar_time = time_backend(dim, 'scalar')
+        numpy_mem = time_backend(dim, 'numpy', ConstantMemory(dim))
+        scalar_mem = time_backend(dim, 'scalar', ConstantMemory(dim))
+        print(f"{dim:>4} | {numpy_time:>8.1f} {scalar_time:>8.1f} {numpy_time / scalar_time:>6.2f} | "
+              f"{numpy_mem:>10.1f} {scalar_mem:>10.1f} {numpy_mem / scalar_mem:>6.2f}")
+        if crossover is None and scalar_time >= numpy_time:
+            crossover = dim
+
+    print("-" * 70)
+    print(f"교차 차원 (메모리 없음): {crossover if crossover is not None else f'> {DIMS[-1]}'}")
+    print(f"현재 SCALAR_BACKEND_MAX_DIM = {SCALAR_BACKEND_MAX_DIM}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Cerebellum 벤치마크: 해마 메모리 백엔드 검색 시간
+
+목적:
+- 패키지 메모리 백엔드의 store/retrieve 시간 비교: 선형 검색(ArrayMemory, 비교 기준)과
+  색인 검색(GridMemory, TreeMemory)
+- 저장 개수 1e3 ~ 1e6, 균등 분포(5차원)와 군집 분포(12차원)
+
+실행:
+    python benchmarks/benchmark_memory_backends.py [최대 저장 개수]
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import numpy as np
+from cerebellum.array_memory import ArrayMemory
+from cerebellum.grid_memory import GridMemory
+from cerebellum.tree_memory import TreeMemory
+
+
+SIZES = (1000, 10000, 100000, 1000000)
+N_QUERIES = 200
+
+
+def uniform_keys(rng, n, dim=5):
+    """균등 분포 (밀도 일정하도록 범위를 n에 맞춰 확장)"""
+    half_width = 0.5 * (n / 1000) ** (1.0 / dim)
+    return rng.uniform(-half_width, half_width, (n, dim))
+
+
+def clustered_keys(rng, n, dim=12):
+    """군집 분포 (궤적 주변에 몰린 상태)"""
+    centers = rng.normal(0, 1.0, (16, dim))
+    return centers[rng.integers(0, 16, n)] + rng.normal(0, 0.05, (n, dim))
+
+
+def measure(memory, keys, queries, n_queries):
+    """(store μs, retrieve μs) - 조회는 질의 n_queries개 평균"""
+    value = np.zeros(keys.shape[1])
+    start = time.perf_counter()
+    for key in keys:
+        memory.store(key, value)
+    store_us = (time.perf_counter() - start) / len(keys) * 1e6
+    if isinstance(memory, TreeMemory):
+        memory.rebuild()  # 백그라운드 생성 완료 후 측정
+    start = time.perf_counter()
+    for query in queries[:n_queries]:
+        memory.retrieve(query)
+    retrieve_us = (time.perf_counter() - start) / n_queries * 1e6
+    return store_us, retrieve_us
+
+
+def run(name, make_keys, max_size):
+    print("\n" + "=" * 63)
+    print(f"{name}")
+    print("=" * 63)
+    print(f"{'N':>8} | {'ArrayMemory':>12} | {'GridMemory':>12} | {'TreeMemory':>12}")
+    print(f"{'':>8} | {'retrieve us':>12} | {'retrieve us':>12} | {'retrieve us':>12}")
+    print("-" * 63)
+    rng = np.random.default_rng(0)
+    for n in SIZES:
+        if n > max_size:
+            break
+        keys = make_keys(rng, n)
+        queries = keys[rng.integers(0, n, N_QUERIES)] + rng.normal(0, 0.01, (N_QUERIES, keys.shape[1]))
+        results = [
+            measure(ArrayMemory(), keys, queries, N_QUERIES),
+            measure(GridMemory(), keys, queries, N_QUERIES),
+        ]
+        tree = TreeMemory()
+        results.append(measure(tree, keys, queries, N_QUERIES))
+        tree.close()
+        print(f"{n:>8} | " + " | ".join(f"{retrieve:>12.1f}" for _, retrieve in results))
+        print(f"{'store':>8} | " + " | ".join(f"{store:>12.1f}" for store, _ in results))
+
+
+def main():
+    max_size = int(float(sys.argv[1])) if len(sys.argv) > 1 else SIZES[-1]
+    run("균등 분포, memory_dim=5", uniform_keys, max_size)
+    run("군집 분포, memory_dim=12", clustered_keys, max_size)
+
+
+if __name__ == "__main__":
+    main()
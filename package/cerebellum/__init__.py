@@ -3,10 +3,22 @@ Cerebellum Module
 소뇌(Cerebellum) 구조 - 기억을 즉각 행동으로 변환하는 계층
 
 구성 요소:
-- Predictive Feedforward: 다음 순간의 오차 예측
+- Predictive Feedforward: 다음 순간의 오차 예측 (속도/가속도 추정기 선택 가능)
 - Trial-to-Trial 보정: 반복 궤적의 미세 편차 제거
-- Variance 감소: 미세한 떨림 필터링
+- Variance 감소: 미세한 떨림 필터링 (이동 평균 또는 IIR 저주파 필터)
 - 기억 기반 적응: 해마의 기억을 즉각 행동으로 변환
+- Batch 엔진: N개 엔진을 (N, D) 배열로 한 번에 계산
+- 스냅샷/복원: 엔진 상태의 바이너리 직렬화 (웜 재시작, 핫 스탠바이)
+- 스칼라 백엔드: 저차원(memory_dim ≤ 8) 엔진의 NumPy 호출 오버헤드 제거
+- 엔진 레지스트리: 샤드별 잠금으로 여러 제어 스레드가 엔진을 공유
+- 배열 메모리: 연속 배열 기반 최근접 이웃 해마 메모리 (벡터화 검색)
+- 격자 메모리: 해시 격자 색인으로 반경 안 이웃 셀만 검색
+- 트리 메모리: KD-tree + 삽입 버퍼, 백그라운드 재생성
+- 용량 제한 메모리: LRU/낮은 confidence/오래된 순 퇴출, 근접 기억 통합
+- 일괄 기억 검색: retrieve_many(keys (N, D)) → (N, D) bias, (N,) 신뢰도 (미적중 nan, 엔진이 우선 사용)
+- 파일 매핑 메모리: np.memmap 기반 저장 파일, 복사 없는 지연 열기, 다른 프로세스용 일관된 스냅샷
+- 맥락 분할 메모리: 맥락(도구, 모드, 고도 구간 등)별 색인, 이웃 분할 대체, 맥락 일치도 반환
+- 맥락 ID 등록부: 맥락 dict/양자화 값을 정수 ID로 한 번만 변환, compute_correction(context=ID)
 
 Author: GNJz
 Created: 2026-01-20
@@ -15,6 +27,27 @@ License: MIT License
 """
 
 from .cerebellum_engine import CerebellumEngine, CerebellumConfig, create_cerebellum_engine
+from .batch_engine import BatchCerebellumEngine
+from .instrumentation import StageProfiler, LatencyHistogram
+from .prefetch import MemoryPrefetcher
+from .memory_cache import MemoryBiasCache
+from .circuit_breaker import CircuitBreaker
+from .filters import VARIANCE_FILTERS
+from .estimators import (
+    DERIVATIVE_ESTIMATORS,
+    FiniteDifferenceEstimator,
+    AlphaBetaEstimator,
+    SavitzkyGolayEstimator,
+)
+from .snapshot import SNAPSHOT_VERSION
+from .registry import EngineRegistry
+from .array_memory import ArrayMemory
+from .grid_memory import GridMemory
+from .tree_memory import TreeMemory
+from .bounded_memory import BoundedMemory, EVICTION_POLICIES
+from .mapped_memory import MappedMemory
+from .context_memory import ContextMemory
+from .context_registry import ContextRegistry, NO_CONTEXT
 
 __version__ = '0.5.0-alpha'
 
@@ -22,5 +55,27 @@ __all__ = [
     'CerebellumEngine',
     'CerebellumConfig',
     'create_cerebellum_engine',
+    'BatchCerebellumEngine',
+    'StageProfiler',
+    'LatencyHistogram',
+    'MemoryPrefetcher',
+    'MemoryBiasCache',
+    'CircuitBreaker',
+    'VARIANCE_FILTERS',
+    'DERIVATIVE_ESTIMATORS',
+    'FiniteDifferenceEstimator',
+    'AlphaBetaEstimator',
+    'SavitzkyGolayEstimator',
+    'SNAPSHOT_VERSION',
+    'EngineRegistry',
+    'ArrayMemory',
+    'GridMemory',
+    'TreeMemory',
+    'BoundedMemory',
+    'MappedMemory',
+    'ContextMemory',
+    'ContextRegistry',
+    'NO_CONTEXT',
+    'EVICTION_POLICIES',
 ]
 
@@ -0,0 +1,340 @@
+"""
+Array Memory
+연속 NumPy 배열 기반 최근접 이웃 해마 메모리
+
+================================================================================
+핵심 개념
+================================================================================
+예제·시나리오의 MockMemory는 dict를 Python 루프로 훑으며 항목마다
+np.array(stored_key)와 np.linalg.norm을 호출합니다 (저장 N개 → 틱당 O(N) Python 작업).
+
+ArrayMemory는 키·bias·confidence를 크기가 두 배씩 늘어나는 연속 배열에 보관하고
+검색마다 벡터화된 거리 계산 한 번으로 최근접 항목을 찾습니다.
+
+   keys        (capacity, D)   ─┐
+   biases      (capacity, D_b)  ├─ 앞의 size행만 유효
+   confidences (capacity,)     ─┘
+   _rows       {tuple(key): 행}   같은 키 재저장 시 덮어쓰기 (dict 의미 유지)
+
+검색 계약 (MockMemory와 동일):
+   d* = min ||key - k_i||,  d* < radius이면
+   [{'bias': b_i, 'confidence': c_i / (1 + d*)}], 아니면 []
+
+일괄 검색 retrieve_many(keys (N, D)) -> (biases (N, D_b), confidences (N,)):
+   행마다 retrieve와 같은 결과, 반경 안에 없는 행은 bias 0, confidence nan
+   (confidence 0으로 저장된 항목도 적중이므로 미적중은 nan으로 구분)
+   CerebellumEngine(오프라인 모드)과 BatchCerebellumEngine이 있으면 우선 사용
+
+store/remove마다 version이 증가하므로 MemoryBiasCache가 자동으로 무효화됩니다.
+
+스레드 안전:
+   store/remove/clear/검색은 인스턴스 잠금(RLock, @synchronized) 안에서 실행되므로
+   여러 엔진(EngineRegistry.step_all, MemoryPrefetcher)이 한 메모리를 공유하고
+   다른 스레드가 store해도 검색이 중간 상태를 보지 않습니다.
+   검색용 작업 버퍼(diff, distances)는 스레드별입니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import functools
+import threading
+import numpy as np
+
+
+def synchronized(method: Callable) -> Callable:
+    """인스턴스 잠금(self._lock) 안에서 실행하는 메서드 (하위 클래스 재정의에도 사용)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ArrayMemory:
+    """
+    배열 기반 최근접 이웃 메모리 (retrieve / store 계약은 MockMemory와 동일)
+    """
+
+    def __init__(self, radius: float = 0.1, initial_capacity: int = 1024):
+        """
+        Args:
+            radius: 검색 반경 (최근접 거리가 이 값 미만일 때만 반환)
+            initial_capacity: 초기 배열 행 수 (가득 차면 두 배로 확장)
+        """
+        self.radius = radius
+        self.initial_capacity = max(1, int(initial_capacity))
+        self.version = 0  # store/remove마다 증가 (MemoryBiasCache 무효화용)
+
+        self.size = 0
+        self._keys: Optional[np.ndarray] = None  # 첫 store에서 차원 결정
+        self._biases: Optional[np.ndarray] = None
+        self._confidences = np.empty(0)
+        self._rows: Dict[Tuple[float, ...], int] = {}
+        self._lock = threading.RLock()  # 저장/검색 직렬화 (재정의한 메서드가 super()를 불러도 재진입)
+
+        # 검색용 작업 버퍼 (스레드별, 용량과 같이 확장 → 검색마다 할당 없음)
+        self._scratch_local = threading.local()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def capacity(self) -> int:
+        """현재 배열 행 수"""
+        return len(self._confidences)
+
+    @property
+    def keys(self) -> np.ndarray:
+        """저장된 키 (size, D) (읽기 전용 뷰)"""
+        return self._view(self._keys)
+
+    @property
+    def biases(self) -> np.ndarray:
+        """저장된 bias (size, D_b) (읽기 전용 뷰)"""
+        return self._view(self._biases)
+
+    @property
+    def confidences(self) -> np.ndarray:
+        """저장된 confidence (size,) (읽기 전용 뷰)"""
+        return self._view(self._confidences)
+
+    def _view(self, array: Optional[np.ndarray]) -> np.ndarray:
+        if array is None:
+            return np.empty((0, 0))
+        view = array[:self.size]
+        view.flags.writeable = False
+        return view
+
+    def _allocate(self, key: np.ndarray, value: np.ndarray) -> None:
+        """첫 store: 키/bias 차원으로 배열 생성"""
+        capacity = self.initial_capacity
+        self._keys = np.empty((capacity, key.shape[0]))
+        self._biases = np.empty((capacity, value.shape[0]))
+        self._confidences = np.empty(capacity)
+
+    def _next_capacity(self) -> int:
+        """확장할 용량 (두 배)"""
+        return 2 * self.capacity
+
+    def _grow(self) -> None:
+        """용량 확장 (기존 행 복사)"""
+        capacity = self._next_capacity()
+        for name in ('_keys', '_biases', '_confidences'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:])
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    @synchronized
+    def store(
+        self,
+        key: np.ndarray,
+        value: np.ndarray,
+        confidence: float = 0.9,
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        기억 저장 (같은 키가 있으면 덮어쓰기)
+
+        Args:
+            key: 상태 (저장 키)
+            value: bias 값
+            confidence: 신뢰도 [0.0, 1.0]
+            context: 맥락 정보 (사용하지 않음)
+        """
+        key = np.asarray(key, dtype=float).ravel()
+        value = np.asarray(value, dtype=float).ravel()
+        if self._keys is None:
+            self._allocate(key, value)
+
+        row_key = tuple(key.tolist())
+        row = self._rows.get(row_key)
+        if row is None:
+            if self.size == self.capacity:
+                self._grow()
+            row = self.size
+            self._rows[row_key] = row
+            self.size += 1
+            self._keys[row] = key
+            self._on_insert(row)
+        self._biases[row] = value
+        self._confidences[row] = confidence
+        self.version += 1
+
+    @synchronized
+    def remove(self, key: np.ndarray) -> bool:
+        """
+        기억 삭제 (마지막 행을 빈 자리로 옮겨 배열을 연속으로 유지)
+
+        Args:
+            key: 저장할 때 사용한 키
+
+        Returns:
+            삭제 여부 (없는 키면 False)
+        """
+        row = self._rows.pop(tuple(np.asarray(key, dtype=float).ravel().tolist()), None)
+        if row is None:
+            return False
+        self._on_remove(row)
+        last = self.size - 1
+        if row != last:
+            self._keys[row] = self._keys[last]
+            self._biases[row] = self._biases[last]
+            self._confidences[row] = self._confidences[last]
+            self._rows[tuple(self._keys[row].tolist())] = row
+            self._on_move(last, row)
+        self.size = last
+        self.version += 1
+        return True
+
+    # 하위 클래스(색인 메모리)용 훅: 행이 추가/삭제/이동될 때 색인 갱신
+    def _on_insert(self, row: int) -> None:
+        pass
+
+    def _on_remove(self, row: int) -> None:
+        pass
+
+    def _on_move(self, old_row: int, new_row: int) -> None:
+        pass
+
+    def _scratch(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        현재 스레드의 검색용 작업 버퍼
+
+        Args:
+            n: 필요한 행 수
+
+        Returns:
+            (diff (n, D), distances (n,)) 뷰
+        """
+        local = self._scratch_local
+        diff = getattr(local, 'diff', None)
+        dim = self._keys.shape[1]
+        if diff is None or len(diff) < n or diff.shape[1] != dim:
+            rows = max(n, self.capacity)
+            local.diff = diff = np.empty((rows, dim))
+            local.distances = np.empty(rows)
+        return diff[:n], local.distances[:n]
+
+    @synchronized
+    def nearest(self, key: np.ndarray) -> Tuple[int, float]:
+        """
+        최근접 항목
+
+        Returns:
+            (행 번호, 거리) - 비어 있으면 (-1, inf)
+        """
+        n = self.size
+        if n == 0:
+            return -1, float('inf')
+        diff, distances = self._scratch(n)
+        np.subtract(self._keys[:n], key, out=diff)
+        np.einsum('ij,ij->i', diff, diff, out=distances)
+        row = int(distances.argmin())
+        return row, float(np.sqrt(distances[row]))
+
+    @synchronized
+    def retrieve(self, key: np.ndarray, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        기억 검색 (반경 안의 최근접 항목, 거리에 따라 confidence 감소)
+
+        Args:
+            key: 현재 상태 (검색 키)
+            context: 맥락 정보 (사용하지 않음)
+
+        Returns:
+            memories: [{'bias': ..., 'confidence': ...}] 또는 []
+        """
+        row, distance = self.nearest(key)
+        if row < 0 or distance >= self.radius:
+            return []
+        return [{
+            'bias': self._biases[row].copy(),
+            'confidence': float(self._confidences[row]) * (1.0 / (1.0 + distance)),
+        }]
+
+    @synchronized
+    def nearest_many(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 키의 최근접 항목
+
+        ||k - q||² = ||k||² - 2·k·q + ||q||²를 행렬 곱 한 번으로 구해 후보를 고르고,
+        반올림 오차 범위 안에서 겹치는 후보만 nearest와 같은 방식으로 다시 계산합니다
+        (결과 행·거리는 키별 nearest와 동일).
+
+        Args:
+            keys: 질의 키 (N, D)
+
+        Returns:
+            (행 번호 (N,), 거리 (N,)) - 비어 있으면 -1, inf
+        """
+        n_keys, n = len(keys), self.size
+        rows = np.full(n_keys, -1)
+        distances = np.full(n_keys, np.inf)
+        if n == 0 or n_keys == 0:
+            return rows, distances
+        stored = self._keys[:n]
+        stored_squared = np.einsum('ij,ij->i', stored, stored)
+        key_squared = np.einsum('ij,ij->i', keys, keys)
+        # 전개식의 반올림 오차 한계 (항 크기에 비례)
+        tolerance = 1e-9 * (stored_squared.max() + key_squared + 1.0)
+        chunk = max(1, 4_000_000 // n)  # (chunk, n) 거리 행렬 크기 제한
+        for start in range(0, n_keys, chunk):
+            block = slice(start, start + chunk)
+            approx = stored_squared - 2.0 * (keys[block] @ stored.T)
+            best = approx.argmin(axis=1)
+            best_approx = approx[np.arange(len(best)), best]
+            n_close = np.count_nonzero(approx <= (best_approx + tolerance[block])[:, None], axis=1)
+            rows[block] = best
+            for i in np.flatnonzero(n_close > 1):
+                # 거의 같은 거리의 후보가 여럿: 정확한 거리로 다시 비교 (같으면 앞 행)
+                candidates = np.flatnonzero(approx[i] <= best_approx[i] + tolerance[start + i])
+                diff = stored[candidates] - keys[start + i]
+                rows[start + i] = candidates[np.einsum('ij,ij->i', diff, diff).argmin()]
+        diff = stored[rows] - keys
+        distances[:] = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        return rows, distances
+
+    @synchronized
+    def retrieve_many(
+        self,
+        keys: np.ndarray,
+        contexts: Optional[Sequence[Optional[Dict[str, Any]]]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        일괄 기억 검색 (행마다 retrieve와 같은 결과)
+
+        Args:
+            keys: 질의 키 (N, D)
+            contexts: 행별 맥락 정보 (사용하지 않음)
+
+        Returns:
+            (biases, confidences): (N, D_b) bias와 (N,) 신뢰도 (반경 밖 행은 bias 0, 신뢰도 nan)
+        """
+        keys = np.asarray(keys, dtype=float).reshape(len(keys), -1)
+        bias_dim = self._biases.shape[1] if self._biases is not None else keys.shape[1]
+        biases = np.zeros((len(keys), bias_dim))
+        confidences = np.full(len(keys), np.nan)
+        rows, distances = self.nearest_many(keys)
+        found = np.flatnonzero((rows >= 0) & (distances < self.radius))
+        if len(found):
+            hit_rows = rows[found]
+            biases[found] = self._biases[hit_rows]
+            confidences[found] = self._confidences[hit_rows] * (1.0 / (1.0 + distances[found]))
+            self._on_hits(hit_rows)
+        return biases, confidences
+
+    def _on_hits(self, rows: np.ndarray) -> None:
+        """retrieve_many에서 찾은 행 (BoundedMemory LRU 갱신용)"""
+        pass
+
+    @synchronized
+    def clear(self) -> None:
+        """모든 기억 삭제 (배열 용량은 유지)"""
+        self.size = 0
+        self._rows.clear()
+        self.version += 1
@@ -0,0 +1,437 @@
+"""
+Batch Cerebellum Engine
+여러 개의 소뇌 엔진을 (N, D) 배열 하나로 묶어 한 번에 보정값을 계산하는 엔진
+
+================================================================================
+핵심 개념
+================================================================================
+축 그룹·스핀들·로봇마다 CerebellumEngine을 하나씩 두면, 5차원 벡터 연산마다
+Python/NumPy 호출 오버헤드를 N번 지불하게 됩니다.
+
+BatchCerebellumEngine은 모든 상태를 (N, D) 배열로 보관합니다.
+- 오차 링 버퍼: (N, W_max, D) + 행별 누적 합 (N, D)
+- prev_state / prev_velocity / filtered_error: (N, D) (틱마다 제자리 갱신, 보관하려면 복사)
+- IIR 저주파 필터 상태: (N, 2, D) (행별 variance_filter)
+- 설정값: 행별 CompiledCorrection의 융합 계수 (N, 5)와 bias 계수 (N, 1)
+- 메모리 장애 회로 차단기: 행별 CircuitBreaker (memory_breakers, 시간 단위는 tick_count)
+
+보정 수식은 CerebellumEngine과 같은 CompiledCorrection 계수로 평가하므로
+(u_cb = c_e·e + c_v·v + c_a·a + c_f·ē + b_scaled, 행별 계수)
+N개의 독립 CerebellumEngine과 수치적으로 같은 결과를 냅니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Dict, Any, Optional, List, Sequence, Union
+import numpy as np
+
+from .cerebellum_engine import CerebellumConfig, CompiledCorrection
+from .circuit_breaker import CircuitBreaker
+from .context_registry import ContextRegistry, context_weight, is_context_id, memory_context
+from .memory_results import memory_result, memory_results
+from .filters import VARIANCE_FILTERS, first_order_alpha, butterworth2_coefficients
+
+
+class BatchCerebellumEngine:
+    """
+    배치 소뇌 엔진
+
+    N개의 소뇌 엔진 상태를 (N, D) 배열로 보관하고 compute_correction을
+    한 번의 벡터화 연산으로 계산합니다.
+    """
+
+    def __init__(
+        self,
+        n_engines: int,
+        memory_dim: int = 5,
+        configs: Optional[Union[CerebellumConfig, Sequence[CerebellumConfig]]] = None,
+        memory: Optional[Any] = None
+    ):
+        """
+        배치 소뇌 엔진 초기화
+
+        Args:
+            n_engines: 엔진(행) 개수 N
+            memory_dim: 메모리 차원 D
+            configs: 공통 설정 하나 또는 행별 설정 N개 (None이면 기본값)
+            memory: 공통 해마 메모리 하나 또는 행별 메모리 N개 (None 허용)
+        """
+        self.n_engines = n_engines
+        self.memory_dim = memory_dim
+
+        if configs is None or isinstance(configs, CerebellumConfig):
+            configs = [configs or CerebellumConfig()] * n_engines
+        if len(configs) != n_engines:
+            raise ValueError(f"configs 길이({len(configs)})가 n_engines({n_engines})와 다릅니다")
+        self.configs: List[CerebellumConfig] = list(configs)
+
+        self.memory = memory
+        self.context_registry: Optional[ContextRegistry] = None  # 정수 맥락 ID용
+
+        # 행별 융합 보정 계수 (CerebellumEngine과 같은 CompiledCorrection, 설정 검증 포함)
+        kernels = [CompiledCorrection.from_config(c) for c in self.configs]
+        self._coefficients = np.array([k.coefficients[:4] for k in kernels]).reshape(n_engines, 4, 1)
+        self._bias_coef = np.array([k.bias_coef for k in kernels], dtype=float)
+        self._memory_bias_coef = np.array([k.memory_bias_coef for k in kernels], dtype=float)
+        self._min_confidence = np.array([k.min_confidence for k in kernels], dtype=float)
+        self._max_correction_norm = np.array([k.max_correction_norm for k in kernels], dtype=float)
+        self._context_weight_enabled = np.array([k.context_weight_enabled for k in kernels], dtype=bool)
+
+        # 오차 링 버퍼 (행별 윈도우 크기)
+        self._variance_window = np.array(
+            [max(1, int(c.variance_window)) for c in self.configs], dtype=np.intp
+        )
+        max_window = int(self._variance_window.max()) if n_engines > 0 else 1
+        self._error_ring = np.zeros((n_engines, max_window, memory_dim))
+        self._error_sum = np.zeros((n_engines, memory_dim))
+        self._ring_index = np.zeros(n_engines, dtype=np.intp)
+        self._ring_count = np.zeros(n_engines, dtype=np.intp)
+        self._rows = np.arange(n_engines)
+
+        # 이전 상태 (예측용) - 유효 여부는 마스크로 관리
+        self.prev_state = np.zeros((n_engines, memory_dim))
+        self.prev_velocity = np.zeros((n_engines, memory_dim))
+        self._has_prev_state = np.zeros(n_engines, dtype=bool)
+        self._has_prev_velocity = np.zeros(n_engines, dtype=bool)
+
+        # 저주파 필터 상태
+        self.filtered_error = np.zeros((n_engines, memory_dim))
+
+        # ⭐ v0.7: 행별 IIR 필터 (0: 이동 평균, 1: iir1, 2: iir2)
+        for c in self.configs:
+            if c.memory_update_interval != 1 or c.variance_update_interval != 1:
+                raise ValueError("BatchCerebellumEngine은 단계별 갱신 주기(다중 시간 스케일)를 지원하지 않습니다")
+            if c.derivative_estimator != 'finite_difference':
+                raise ValueError(
+                    f"BatchCerebellumEngine은 유한 차분 속도 추정만 지원합니다: {c.derivative_estimator!r}"
+                )
+        self._filter_mode = np.array(
+            [VARIANCE_FILTERS.index(c.variance_filter) for c in self.configs], dtype=np.intp
+        )
+        self._low_pass_cutoff = np.array([c.low_pass_cutoff for c in self.configs], dtype=float)
+        self._iir_state = np.zeros((n_engines, 2, memory_dim))
+        self._iir_initialized = np.zeros(n_engines, dtype=bool)
+        # 행별 계수 캐시 (dt 또는 low_pass_cutoff가 바뀐 행만 다시 계산, NaN = 미계산)
+        self._iir_dt = np.full(n_engines, np.nan)
+        self._iir_cutoff = np.full(n_engines, np.nan)
+        self._iir_alpha = np.ones(n_engines)
+        self._iir_biquad = np.zeros((5, n_engines))
+
+        # 행별 메모리 장애 회로 차단기 (CerebellumEngine.memory_breaker와 같은 규칙)
+        self.memory_breakers: List[CircuitBreaker] = [
+            CircuitBreaker(
+                failure_threshold=c.memory_failure_threshold,
+                cooldown=c.memory_breaker_cooldown,
+                backoff_factor=c.memory_breaker_backoff,
+                max_cooldown=c.memory_breaker_max_cooldown
+            )
+            for c in self.configs
+        ]
+        self.tick_count = 0  # 차단기 시간 (compute_correction마다 증가, reset에서 유지)
+
+    def set_memory(self, memory: Any) -> None:
+        """
+        해마 메모리 설정
+
+        Args:
+            memory: 공통 메모리 하나 또는 행별 메모리 N개
+        """
+        self.memory = memory
+
+    def set_context_registry(self, registry: Optional[ContextRegistry]) -> None:
+        """
+        맥락 ID 등록부 설정 (contexts에 정수 맥락 ID 사용)
+
+        Args:
+            registry: ContextRegistry (None이면 해제)
+        """
+        self.context_registry = registry
+
+    def compute_correction(
+        self,
+        current_state: np.ndarray,
+        target_state: np.ndarray,
+        velocity: Optional[np.ndarray] = None,
+        acceleration: Optional[np.ndarray] = None,
+        contexts: Optional[Union[Dict[str, Any], int, Sequence[Optional[Union[Dict[str, Any], int]]]]] = None,
+        dt: Union[float, np.ndarray] = 0.001
+    ) -> np.ndarray:
+        """
+        N개 엔진의 소뇌 보정값을 한 번에 계산
+
+        Args:
+            current_state: 현재 상태 (N, D)
+            target_state: 목표 상태 (N, D)
+            velocity: 현재 속도 (N, D) (None이면 계산)
+            acceleration: 현재 가속도 (N, D) (None이면 계산)
+            contexts: 공통 맥락 하나 또는 행별 맥락 N개 (dict 또는 ContextRegistry 맥락 ID)
+            dt: 시간 간격 (스칼라 또는 (N,))
+
+        Returns:
+            corrections: 소뇌 보정값 (N, D)
+        """
+        current_state = np.asarray(current_state, dtype=float)
+        target_state = np.asarray(target_state, dtype=float)
+        dt_column = np.broadcast_to(np.asarray(dt, dtype=float), (self.n_engines,)).reshape(-1, 1)
+
+        # 현재 오차 계산
+        current_error = target_state - current_state
+
+        # 상태 기록 업데이트
+        self._push_history(current_error)
+
+        # 속도/가속도 계산 (제공되지 않은 경우)
+        if velocity is None:
+            velocity = self._estimate_velocity(current_state, dt_column)
+        if acceleration is None:
+            acceleration = self._estimate_acceleration(velocity, dt_column)
+
+        # 1. 해마에서 기억 검색 (행별)
+        context_list = self._expand_contexts(contexts)
+        memory_bias, confidence, match = self._get_memory_bias(current_state, context_list)
+
+        # Confidence 기반 adaptive gain, Context 가중치 → b_scaled
+        adaptive_gain = np.clip(confidence, self._min_confidence, 1.0)
+        context_weight = self._compute_context_weight(context_list, match)
+        bias_scale = self._bias_coef + self._memory_bias_coef * adaptive_gain * context_weight
+        scaled_bias = memory_bias * bias_scale.reshape(-1, 1)
+
+        # 4. Variance 감소용 저주파 필터 (ē)
+        self._update_filtered_error(current_error, dt_column)
+
+        # 2~6. 융합 커널 (CerebellumEngine과 같은 계수, 행별)
+        c = self._coefficients
+        total_correction = (
+            c[:, 0] * current_error +
+            c[:, 1] * velocity +
+            c[:, 2] * acceleration +
+            c[:, 3] * self.filtered_error +
+            scaled_bias
+        )
+
+        # 행별 saturation
+        total_correction = self._saturate_correction(total_correction)
+
+        # 이전 상태 업데이트
+        self.prev_state[...] = current_state
+        self.prev_velocity[...] = velocity
+        self._has_prev_state[:] = True
+        self._has_prev_velocity[:] = True
+        self.tick_count += 1
+
+        return total_correction
+
+    def _expand_contexts(self, contexts) -> List[Optional[Dict[str, Any]]]:
+        """공통 맥락/행별 맥락을 길이 N 리스트로 정규화"""
+        if contexts is None or isinstance(contexts, dict) or is_context_id(contexts):
+            return [contexts] * self.n_engines
+        if len(contexts) != self.n_engines:
+            raise ValueError(f"contexts 길이({len(contexts)})가 n_engines({self.n_engines})와 다릅니다")
+        return list(contexts)
+
+    def _memory_for_row(self, row: int) -> Optional[Any]:
+        """행에 연결된 해마 메모리"""
+        if isinstance(self.memory, (list, tuple)):
+            return self.memory[row]
+        return self.memory
+
+    def _push_history(self, current_error: np.ndarray) -> None:
+        """행별 링 버퍼에 오차 기록 (누적 합 유지)"""
+        rows = self._rows
+        idx = self._ring_index
+        full = self._ring_count == self._variance_window
+
+        self._error_sum[full] -= self._error_ring[rows[full], idx[full]]
+        self._error_ring[rows, idx] = current_error
+        self._error_sum += self._error_ring[rows, idx]
+        np.minimum(self._ring_count + 1, self._variance_window, out=self._ring_count)
+
+        idx += 1
+        wrapped = idx == self._variance_window
+        if wrapped.any():
+            idx[wrapped] = 0
+            self._error_sum[wrapped] = self._error_ring[wrapped].sum(axis=1)
+
+    def _update_filtered_error(self, current_error: np.ndarray, dt: np.ndarray) -> None:
+        """행별 저주파 필터(이동 평균 또는 IIR) 갱신 → filtered_error"""
+        full = (self._ring_count >= self._variance_window) & (self._filter_mode == 0)
+        self.filtered_error[...] = current_error
+        self.filtered_error[full] = self._error_sum[full] / self._variance_window[full, None]
+        self._update_iir_filter(current_error, dt[:, 0])
+
+    def _update_iir_filter(self, current_error: np.ndarray, dt: np.ndarray) -> None:
+        """IIR 행의 filtered_error 갱신 (CerebellumEngine._update_iir_filter와 같은 수식)"""
+        for mode in (1, 2):
+            rows = np.flatnonzero(self._filter_mode == mode)
+            if rows.size == 0:
+                continue
+            x = current_error[rows]
+            z1 = self._iir_state[rows, 0]
+            z2 = self._iir_state[rows, 1]
+            fresh = ~self._iir_initialized[rows]
+            self._refresh_iir_coefficients(rows, dt, mode)
+
+            if mode == 1:
+                alpha = self._iir_alpha[rows].reshape(-1, 1)
+                y = z1 + alpha * (x - z1)
+                y[fresh] = x[fresh]
+                self._iir_state[rows, 0] = y
+            else:
+                b0, b1, b2, a1, a2 = self._iir_biquad[:, rows, None]
+                # 첫 스텝: 정상 상태 (y = x)
+                z1[fresh] = x[fresh] * (1.0 - b0[fresh])
+                z2[fresh] = x[fresh] * (b2[fresh] - a2[fresh])
+                y = x * b0 + z1
+                self._iir_state[rows, 0] = x * b1 - y * a1 + z2
+                self._iir_state[rows, 1] = x * b2 - y * a2
+
+            self._iir_initialized[rows] = True
+            self.filtered_error[rows] = y
+
+    def _refresh_iir_coefficients(self, rows: np.ndarray, dt: np.ndarray, mode: int) -> None:
+        """dt 또는 low_pass_cutoff가 직전 계산과 다른 행만 IIR 계수 재계산"""
+        cutoff = self._low_pass_cutoff
+        stale = rows[(dt[rows] != self._iir_dt[rows]) | (cutoff[rows] != self._iir_cutoff[rows])]
+        if stale.size == 0:
+            return
+        if mode == 1:
+            self._iir_alpha[stale] = first_order_alpha(cutoff[stale], dt[stale])
+        else:
+            self._iir_biquad[:, stale] = butterworth2_coefficients(cutoff[stale], dt[stale])
+        self._iir_dt[stale] = dt[stale]
+        self._iir_cutoff[stale] = cutoff[stale]
+
+    def _get_memory_bias(
+        self,
+        current_state: np.ndarray,
+        contexts: List[Optional[Dict[str, Any]]]
+    ) -> tuple:
+        """
+        행별 해마 메모리 검색
+
+        Returns:
+            (memory_bias, confidence, match): (N, D) bias, (N,) 신뢰도,
+            (N,) 맥락 일치도 (메모리가 주지 않으면 nan)
+        """
+        memory_bias = np.zeros((self.n_engines, self.memory_dim))
+        confidence = np.zeros(self.n_engines)
+        match = np.full(self.n_engines, np.nan)
+
+        now = self.tick_count
+
+        # 공유 메모리에 retrieve_many가 있으면 차단되지 않은 행을 한 번에 검색
+        retrieve_many = getattr(self.memory, 'retrieve_many', None)
+        if retrieve_many is not None and not isinstance(self.memory, (list, tuple)):
+            rows = np.array([row for row in range(self.n_engines) if self.memory_breakers[row].allow(now)],
+                            dtype=np.intp)
+            if len(rows) == 0:
+                return memory_bias, confidence, match
+            try:
+                result = retrieve_many(
+                    current_state[rows],
+                    [memory_context(contexts[row], self.context_registry, self.memory) for row in rows]
+                )
+            except Exception as e:
+                for row in rows:
+                    self.memory_breakers[row].record_failure(now, e)
+                return memory_bias, confidence, match
+            for row in rows:
+                self.memory_breakers[row].record_success()
+            # 행별 retrieve 경로와 같은 해석 (confidence 0인 적중도 min_confidence로 적용)
+            memory_bias[rows], confidence[rows], match[rows] = memory_results(
+                result, self.memory_dim, self._min_confidence[rows]
+            )
+            return memory_bias, confidence, match
+
+        for row in range(self.n_engines):
+            memory = self._memory_for_row(row)
+            if memory is None:
+                continue
+            breaker = self.memory_breakers[row]
+            if not breaker.allow(now):
+                continue  # 차단 중: 메모리 없이 동작
+            try:
+                memories = memory.retrieve(
+                    current_state[row], memory_context(contexts[row], self.context_registry, memory)
+                )
+                bias, confidence[row], row_match = memory_result(memories, self._min_confidence[row])
+                if bias is not None:
+                    memory_bias[row] = bias
+                if row_match is not None:
+                    match[row] = row_match
+            except Exception as e:
+                # 오류 발생 시 0 벡터 (행의 회로 차단기에 기록)
+                memory_bias[row] = 0.0
+                confidence[row] = 0.0
+                match[row] = np.nan
+                breaker.record_failure(now, e)
+                continue
+            breaker.record_success()
+
+        return memory_bias, confidence, match
+
+    def _compute_context_weight(
+        self,
+        contexts: List[Optional[Dict[str, Any]]],
+        match: np.ndarray
+    ) -> np.ndarray:
+        """행별 Context 가중치 (CerebellumEngine과 동일한 규칙: 메모리가 준 일치도 우선)"""
+        weights = np.ones(self.n_engines)
+        for row in np.flatnonzero(self._context_weight_enabled):
+            context = contexts[row]
+            if not np.isnan(match[row]):
+                weights[row] = match[row]
+            elif is_context_id(context):
+                if self.context_registry is None:
+                    raise ValueError("정수 맥락 ID를 쓰려면 set_context_registry()로 등록부를 설정해야 합니다")
+                weights[row] = self.context_registry.weight(context)
+            else:
+                weights[row] = context_weight(context)
+        return weights
+
+    def _saturate_correction(self, correction: np.ndarray) -> np.ndarray:
+        """행별 L2 norm 기반 saturation"""
+        correction_norm = np.linalg.norm(correction, axis=1)
+        over = correction_norm > self._max_correction_norm
+        if over.any():
+            eps = 1e-8
+            scale = self._max_correction_norm[over] / (correction_norm[over] + eps)
+            correction[over] = correction[over] * scale[:, None]
+        return correction
+
+    def _estimate_velocity(self, current_state: np.ndarray, dt: np.ndarray) -> np.ndarray:
+        """행별 속도 추정 (이전 상태가 없거나 dt <= 0이면 0)"""
+        valid = self._has_prev_state & (dt[:, 0] > 0)
+        velocity = np.zeros((self.n_engines, self.memory_dim))
+        velocity[valid] = (current_state[valid] - self.prev_state[valid]) / dt[valid]
+        return velocity
+
+    def _estimate_acceleration(self, velocity: np.ndarray, dt: np.ndarray) -> np.ndarray:
+        """행별 가속도 추정 (이전 속도가 없거나 dt <= 0이면 0)"""
+        valid = self._has_prev_velocity & (dt[:, 0] > 0)
+        acceleration = np.zeros((self.n_engines, self.memory_dim))
+        acceleration[valid] = (velocity[valid] - self.prev_velocity[valid]) / dt[valid]
+        return acceleration
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> None:
+        """
+        배치 소뇌 엔진 리셋
+
+        Args:
+            mask: 리셋할 행 (bool 마스크 또는 인덱스 배열, None이면 전체)
+        """
+        rows = self._rows if mask is None else self._rows[mask]
+        self._error_ring[rows] = 0.0
+        self._error_sum[rows] = 0.0
+        self._ring_index[rows] = 0
+        self._ring_count[rows] = 0
+        self.prev_state[rows] = 0.0
+        self.prev_velocity[rows] = 0.0
+        self._has_prev_state[rows] = False
+        self._has_prev_velocity[rows] = False
+        self.filtered_error[rows] = 0.0
+        self._iir_state[rows] = 0.0
+        self._iir_initialized[rows] = False
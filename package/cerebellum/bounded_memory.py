@@ -0,0 +1,216 @@
+"""
+Bounded Memory
+최대 항목 수가 정해진 해마 메모리 (퇴출 정책 + 근접 기억 통합)
+
+================================================================================
+핵심 개념
+================================================================================
+learn_hovering처럼 안정 구간마다 store를 호출하면 저장 개수가 끝없이 늘고,
+검색 비용과 메모리 사용량도 함께 늘어납니다. BoundedMemory는 두 가지로 크기를
+제한합니다.
+
+1. 통합 (consolidation_radius > 0)
+   새 키에서 consolidation_radius 안에 기존 항목이 있으면 새 항목을 만들지 않고
+   confidence를 가중치로 합칩니다.
+      W' = W + c_new
+      k' = k + (c_new / W')·(k_new - k)
+      b' = b + (c_new / W')·(b_new - b)
+      c' = max(c, c_new)
+   (W: 지금까지 합쳐진 confidence 합)
+
+2. 퇴출 (항목 수 = max_entries일 때 새 항목을 넣으면)
+   'lru'               : 가장 오래 검색/갱신되지 않은 항목
+   'lowest_confidence' : confidence가 가장 낮은 항목
+   'oldest'            : 가장 먼저 삽입된 항목
+
+저장 배열은 max_entries를 넘지 않으므로 검색 시간과 메모리가 일정 수준에서 멈춥니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .array_memory import ArrayMemory, synchronized
+
+
+# BoundedMemory.eviction 값
+EVICTION_POLICIES = ('lru', 'lowest_confidence', 'oldest')
+
+
+class BoundedMemory(ArrayMemory):
+    """
+    용량 제한 메모리 (retrieve / store 계약은 ArrayMemory와 동일)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        eviction: str = 'lru',
+        consolidation_radius: float = 0.0,
+        radius: float = 0.1,
+        initial_capacity: int = 1024
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            eviction: 퇴출 정책 (EVICTION_POLICIES)
+            consolidation_radius: 이 거리 안의 기존 항목과 통합 (0이면 통합 안 함)
+            radius: 검색 반경
+            initial_capacity: 초기 배열 행 수 (max_entries를 넘지 않음)
+        """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"eviction은 {EVICTION_POLICIES} 중 하나여야 합니다: {eviction!r}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+        super().__init__(radius=radius, initial_capacity=min(initial_capacity, max_entries))
+        self.max_entries = max_entries
+        self.eviction = eviction
+        self.consolidation_radius = consolidation_radius
+
+        # 행별 메타데이터 (행 이동 시 함께 이동)
+        self._inserted_at = np.empty(0)  # 삽입 시각
+        self._last_used = np.empty(0)  # 마지막 검색/갱신 시각
+        self._weights = np.empty(0)  # 통합된 confidence 합 W
+        self._clock = 0
+
+        # 통계
+        self.evictions = 0
+        self.merges = 0
+
+    def _allocate(self, key: np.ndarray, value: np.ndarray) -> None:
+        super()._allocate(key, value)
+        self._inserted_at = np.empty(self.capacity)
+        self._last_used = np.empty(self.capacity)
+        self._weights = np.empty(self.capacity)
+
+    def _next_capacity(self) -> int:
+        return min(2 * self.capacity, self.max_entries)
+
+    def _grow(self) -> None:
+        super()._grow()
+        for name in ('_inserted_at', '_last_used', '_weights'):
+            old = getattr(self, name)
+            new = np.empty(self.capacity)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def _on_insert(self, row: int) -> None:
+        self._inserted_at[row] = self._clock
+        self._weights[row] = 0.0
+
+    def _on_move(self, old_row: int, new_row: int) -> None:
+        self._inserted_at[new_row] = self._inserted_at[old_row]
+        self._last_used[new_row] = self._last_used[old_row]
+        self._weights[new_row] = self._weights[old_row]
+
+    def _victim(self) -> int:
+        """퇴출할 행"""
+        n = self.size
+        if self.eviction == 'lru':
+            return int(self._last_used[:n].argmin())
+        if self.eviction == 'oldest':
+            return int(self._inserted_at[:n].argmin())
+        return int(self._confidences[:n].argmin())
+
+    @synchronized
+    def store(
+        self,
+        key: np.ndarray,
+        value: np.ndarray,
+        confidence: float = 0.9,
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        기억 저장 (근접 항목과 통합하거나, 가득 찼으면 퇴출 후 삽입)
+
+        Args:
+            key: 상태 (저장 키)
+            value: bias 값
+            confidence: 신뢰도 [0.0, 1.0]
+            context: 맥락 정보 (사용하지 않음)
+        """
+        key = np.asarray(key, dtype=float).ravel()
+        value = np.asarray(value, dtype=float).ravel()
+        self._clock += 1
+
+        if self.consolidation_radius > 0 and self.size > 0:
+            row, distance = self.nearest(key)
+            if distance < self.consolidation_radius:
+                self._merge(row, key, value, confidence)
+                return
+
+        row = self._rows.get(tuple(key.tolist()))
+        if row is None and self.size >= self.max_entries:
+            self.remove(self._keys[self._victim()].copy())
+            self.evictions += 1
+        super().store(key, value, confidence, context)
+        row = self._rows[tuple(key.tolist())]
+        self._last_used[row] = self._clock
+        self._weights[row] = confidence
+
+    def _merge(self, row: int, key: np.ndarray, value: np.ndarray, confidence: float) -> None:
+        """기존 항목과 confidence 가중 평균으로 통합"""
+        weight = self._weights[row] + confidence
+        fraction = confidence / weight if weight > 0 else 1.0
+        old_key = tuple(self._keys[row].tolist())
+        self._keys[row] += fraction * (key - self._keys[row])
+        new_key = tuple(self._keys[row].tolist())
+        if new_key != old_key:
+            del self._rows[old_key]
+            if new_key in self._rows:
+                # 통합된 키가 다른 항목과 정확히 겹치면 키를 옮기지 않음
+                self._keys[row] = old_key
+                new_key = old_key
+            self._rows[new_key] = row
+        self._biases[row] += fraction * (value - self._biases[row])
+        self._confidences[row] = max(self._confidences[row], confidence)
+        self._weights[row] = weight
+        self._last_used[row] = self._clock
+        self.merges += 1
+        self.version += 1
+
+    @synchronized
+    def retrieve(self, key: np.ndarray, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """기억 검색 (찾은 항목의 LRU 시각 갱신)"""
+        self._clock += 1
+        row, distance = self.nearest(key)
+        if row < 0 or distance >= self.radius:
+            return []
+        self._last_used[row] = self._clock
+        return [{
+            'bias': self._biases[row].copy(),
+            'confidence': float(self._confidences[row]) * (1.0 / (1.0 + distance)),
+        }]
+
+    @synchronized
+    def retrieve_many(
+        self,
+        keys: np.ndarray,
+        contexts: Optional[Sequence[Optional[Dict[str, Any]]]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """일괄 기억 검색 (찾은 항목의 LRU 시각 갱신)"""
+        self._clock += 1
+        return super().retrieve_many(keys, contexts)
+
+    def _on_hits(self, rows: np.ndarray) -> None:
+        self._last_used[rows] = self._clock
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        용량/퇴출/통합 통계
+
+        Returns:
+            entries, max_entries, capacity, evictions, merges, eviction
+        """
+        return {
+            'entries': self.size,
+            'max_entries': self.max_entries,
+            'capacity': self.capacity,
+            'evictions': self.evictions,
+            'merges': self.merges,
+            'eviction': self.eviction,
+        }
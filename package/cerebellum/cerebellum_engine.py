@@ -15,6 +15,7 @@ Cerebellum Engine
 1. Predictive Feedforward (예측 피드포워드)
    수식: e_pred(t+Δt) = e(t) + v(t)·Δt + ½a(t)·(Δt)²
    의미: 다음 순간의 오차를 미리 예측하여 사전 보정
+   v(t), a(t): 유한 차분 또는 (v0.7) alpha-beta(-gamma)/Savitzky-Golay 추정기
    생물학적 대응: 소뇌의 Internal Model (내부 모델)
 
 2. Trial-to-Trial 보정 (회차 학습)
@@ -26,6 +27,7 @@ Cerebellum Engine
 3. Variance 감소 (떨림 필터링)
    수식: high_freq_noise = e(t) - filtered_error
          variance_correction = -high_freq_noise · α_variance
+         filtered_error: 이동 평균 또는 (v0.7) low_pass_cutoff 기반 1차/2차 IIR
    의미: 고주파 노이즈(떨림) 제거, 저주파 의도적 움직임 유지
    생물학적 대응: 소뇌의 Tremor Suppression
 
@@ -43,6 +45,27 @@ Cerebellum Engine
              u_cb = u_cb · (max_norm / ||u_cb||)
    의미: 과도한 보정 신호 방지, 안정성 확보
 
+7. 융합 선형 보정 커널 (Fused Kernel) - v0.7
+   수식: u_cb = c_e·e + c_v·v + c_a·a + c_f·ē + (c_b + c_m·g·w_ctx)·b_hip
+         c_e = -w·(α_ff + α_trial + α_var)     c_v = -w·α_ff·Δt_pred
+         c_a = -½·w·α_ff·Δt_pred²              c_f =  w·α_var
+         c_b =  w·α_trial                       c_m = -w·α_memory
+   의미: 1~5의 보정 항은 기억 bias·신뢰도·맥락 가중치가 정해지면 선형 결합이므로
+         설정에서 계수를 한 번 계산해 두고 매 틱 한 번의 내적으로 평가
+
+8. 다중 시간 스케일 (Multi-rate) - v0.7
+   수식: 단계 s는 tick_count mod N_s = 0인 틱에만 갱신, 사이 틱은 마지막 출력 재사용
+         (Feedforward/Trial은 매 틱, 기억 N_memory, Variance 필터 N_variance)
+   의미: 천천히 변하는 기억 기반 적응은 낮은 주기로, 예측은 매 틱 실행
+
+9. 저차원 스칼라 백엔드 - v0.7
+   memory_dim ≤ SCALAR_BACKEND_MAX_DIM이면 (backend='auto') 1~7을 Python float
+   루프로 계산하고 틱 사이 상태를 리스트로 보관 (NumPy 호출 오버헤드 제거).
+   NumPy 버퍼는 error_history, snapshot() 등이 읽을 때만 동기화
+   스칼라 경로는 틱마다 Python float/리스트를 할당하므로, 'auto'는 out=을 받은
+   호출에서 NumPy 경로를 사용합니다 (할당 없는 경로 유지, 4번 항목 참고).
+   backend='scalar'를 명시하면 out=이 있어도 스칼라 경로 (할당 있음)
+
 ================================================================================
 버전 이력
 ================================================================================
@@ -56,15 +79,35 @@ Made in GNJz
 License: MIT License
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Union
+import math
+import threading
+import time
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .instrumentation import StageProfiler
+from .prefetch import MemoryPrefetcher
+from .memory_cache import MemoryBiasCache
+from .context_registry import ContextRegistry, context_weight, is_context_id, memory_context
+from .memory_results import memory_result, memory_results
+from .circuit_breaker import CircuitBreaker
+from .filters import VARIANCE_FILTERS, first_order_alpha, butterworth2_coefficients
+from .estimators import DERIVATIVE_ESTIMATORS, DerivativeEstimator, create_derivative_estimator
+from .snapshot import encode_snapshot, decode_snapshot
+from .scalar_backend import ScalarState
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace, asdict
 
 
-@dataclass
+@dataclass(frozen=True)
 class CerebellumConfig:
-    """소뇌 설정"""
+    """
+    소뇌 설정 (⭐ v0.7: 불변)
+    
+    엔진은 설정에서 융합 커널(CompiledCorrection)을 미리 계산하므로 필드를 제자리에서
+    바꾸면 반영되지 않습니다. 그래서 필드 대입은 FrozenInstanceError를 내고,
+    변경은 engine.update_config(...)(또는 dataclasses.replace 결과를 engine.config에 대입)로 합니다.
+    """
     # Predictive Feedforward
     feedforward_gain: float = 0.5  # 피드포워드 gain
     prediction_horizon: float = 0.01  # 예측 시간 (초)
@@ -76,6 +119,7 @@ class CerebellumConfig:
     variance_gain: float = 0.2  # Variance 감소 gain
     low_pass_cutoff: float = 10.0  # 저주파 필터 차단 주파수 (Hz)
     variance_window: int = 5  # 분산 계산 윈도우 크기
+    variance_filter: str = 'moving_average'  # ⭐ v0.7: 'moving_average' | 'iir1' | 'iir2'
     
     # 기억 기반 적응
     memory_gain: float = 0.4  # 기억 기반 보정 gain
@@ -87,6 +131,119 @@ class CerebellumConfig:
     max_correction_norm: float = 10.0  # 최대 보정 신호 크기 (saturation)
     min_confidence: float = 0.1  # 최소 신뢰도 (confidence 기반 gain)
     context_weight_enabled: bool = True  # Context 가중치 사용 여부
+    
+    # ⭐ v0.7 추가: 속도/가속도 추정기 (velocity/acceleration을 넘기지 않은 경우)
+    derivative_estimator: str = 'finite_difference'  # 'finite_difference' | 'alpha_beta' | 'alpha_beta_gamma' | 'savitzky_golay'
+    estimator_alpha: float = 0.5  # Alpha-Beta 위치 gain
+    estimator_beta: float = 0.1  # Alpha-Beta 속도 gain
+    estimator_gamma: float = 0.01  # Alpha-Beta-Gamma 가속도 gain
+    savgol_window: int = 7  # Savitzky-Golay 윈도우 크기
+    savgol_order: int = 2  # Savitzky-Golay 다항식 차수
+    
+    # ⭐ v0.7 추가: 계산 백엔드 ('auto': memory_dim ≤ SCALAR_BACKEND_MAX_DIM이면 'scalar',
+    # 단 out=을 넘긴 호출은 할당 없는 NumPy 경로)
+    backend: str = 'auto'  # 'auto' | 'numpy' | 'scalar'
+    
+    # ⭐ v0.7 추가: 다중 시간 스케일 (단계별 갱신 주기, 틱 단위)
+    memory_update_interval: int = 1  # 기억 검색 주기 (사이 틱은 마지막 결과 재사용)
+    variance_update_interval: int = 1  # Variance 필터 주기 (사이 틱은 마지막 ē 재사용)
+    
+    # ⭐ v0.7 추가: 실시간 데드라인 (기억 검색 시간 예산)
+    memory_deadline: Optional[float] = None  # 기억 검색 시간 예산 (초, None이면 비활성)
+    deadline_fallback: str = 'last'  # 예산 초과 시 대체값 ('last': 마지막 기억, 'zero': 0 벡터)
+    deadline_probe_interval: int = 50  # 검색을 건너뛴 뒤 다시 측정하기까지의 틱 수
+    
+    # ⭐ v0.7 추가: 메모리 장애 회로 차단기
+    memory_failure_threshold: int = 5  # 차단까지의 연속 실패 횟수
+    memory_breaker_cooldown: int = 100  # 차단 후 시험 검색까지의 대기 (틱)
+    memory_breaker_backoff: float = 2.0  # 시험 검색 실패 시 cooldown 배수
+    memory_breaker_max_cooldown: int = 10000  # cooldown 상한 (틱)
+
+
+DEADLINE_FALLBACKS = ('last', 'zero')
+
+BACKENDS = ('auto', 'numpy', 'scalar')
+
+# 'auto' 백엔드가 스칼라 경로를 고르는 최대 차원 (benchmarks/benchmark_backend_crossover.py)
+SCALAR_BACKEND_MAX_DIM = 8
+
+# 바뀌면 추정기를 새로 만드는 설정 필드
+ESTIMATOR_FIELDS = (
+    'derivative_estimator', 'estimator_alpha', 'estimator_beta', 'estimator_gamma',
+    'savgol_window', 'savgol_order',
+)
+
+
+@dataclass(frozen=True)
+class CompiledCorrection:
+    """
+    CerebellumConfig에서 미리 계산한 융합 보정 계수 (v0.7)
+    
+    입력 스택 [e, v, a, ē, b_scaled] (5, D)에 coefficients (5,)를 내적하면
+    통합 보정값이 됩니다. b_scaled = b_hip · (bias_coef + memory_bias_coef · g · w_ctx)
+    보정 수식(모듈 설명 1~7)의 유일한 구현입니다 (NumPy/스칼라/오프라인 경로 공통).
+    """
+    coefficients: np.ndarray  # [c_e, c_v, c_a, c_f, 1.0] (읽기 전용)
+    scalar_coefficients: tuple  # coefficients의 Python float 튜플 (스칼라 백엔드용)
+    bias_coef: float  # c_b = w·α_trial
+    memory_bias_coef: float  # c_m = -w·α_memory
+    min_confidence: float
+    max_correction_norm: float
+    context_weight_enabled: bool
+    variance_filter: str
+    low_pass_cutoff: float
+    memory_interval: int  # 기억 단계 갱신 주기 (틱)
+    variance_interval: int  # Variance 단계 갱신 주기 (틱)
+    memory_deadline_ns: Optional[int]  # None이면 데드라인 비활성
+    fallback_last: bool
+    deadline_probe_interval: int
+    
+    @classmethod
+    def from_config(cls, config: CerebellumConfig) -> 'CompiledCorrection':
+        """설정으로부터 융합 계수 계산"""
+        if config.variance_filter not in VARIANCE_FILTERS:
+            raise ValueError(
+                f"variance_filter는 {VARIANCE_FILTERS} 중 하나여야 합니다: {config.variance_filter!r}"
+            )
+        if config.derivative_estimator not in DERIVATIVE_ESTIMATORS:
+            raise ValueError(
+                f"derivative_estimator는 {DERIVATIVE_ESTIMATORS} 중 하나여야 합니다: "
+                f"{config.derivative_estimator!r}"
+            )
+        if config.backend not in BACKENDS:
+            raise ValueError(f"backend는 {BACKENDS} 중 하나여야 합니다: {config.backend!r}")
+        if config.deadline_fallback not in DEADLINE_FALLBACKS:
+            raise ValueError(
+                f"deadline_fallback은 {DEADLINE_FALLBACKS} 중 하나여야 합니다: {config.deadline_fallback!r}"
+            )
+        w = config.correction_weight
+        h = config.prediction_horizon
+        coefficients = np.array([
+            -w * (config.feedforward_gain + config.trial_gain + config.variance_gain),
+            -w * config.feedforward_gain * h,
+            -0.5 * w * config.feedforward_gain * h ** 2,
+            w * config.variance_gain,
+            1.0,
+        ])
+        coefficients.flags.writeable = False
+        return cls(
+            coefficients=coefficients,
+            scalar_coefficients=tuple(coefficients.tolist()),
+            bias_coef=w * config.trial_gain,
+            memory_bias_coef=-w * config.memory_gain,
+            min_confidence=config.min_confidence,
+            max_correction_norm=config.max_correction_norm,
+            context_weight_enabled=config.context_weight_enabled,
+            variance_filter=config.variance_filter,
+            low_pass_cutoff=config.low_pass_cutoff,
+            memory_interval=max(1, int(config.memory_update_interval)),
+            variance_interval=max(1, int(config.variance_update_interval)),
+            memory_deadline_ns=(
+                None if config.memory_deadline is None else int(config.memory_deadline * 1e9)
+            ),
+            fallback_last=config.deadline_fallback == 'last',
+            deadline_probe_interval=max(1, int(config.deadline_probe_interval))
+        )
 
 
 class CerebellumEngine:
@@ -105,6 +262,9 @@ class CerebellumEngine:
     2. Trial-to-Trial 보정: 반복 궤적의 미세 편차 제거
     3. Variance 감소: 미세한 떨림 필터링
     4. 기억 기반 적응: 해마의 기억을 즉각 행동으로 변환
+    
+    ⭐ v0.7: prev_state, prev_velocity, filtered_error는 읽을 때마다 복사본을
+    반환합니다 (내부 버퍼는 틱마다 제자리에서 갱신되므로 보관한 값은 바뀌지 않음).
     """
     
     def __init__(
@@ -122,21 +282,348 @@ class CerebellumEngine:
             memory: 해마 메모리 인스턴스 (None이면 나중에 설정)
         """
         self.memory_dim = memory_dim
-        self.config = config or CerebellumConfig()
+        self._config = config or CerebellumConfig()
         self.memory = memory
         
+        # ⭐ v0.7: 맥락 ID 등록부 (compute_correction에 정수 맥락 ID를 쓸 때)
+        self.context_registry: Optional[ContextRegistry] = None
+        
+        # ⭐ v0.7: 스칼라 백엔드 상태 (None이면 NumPy 버퍼가 최신)
+        self._scalar: Optional[ScalarState] = None
+        
+        # ⭐ v0.7: 융합 커널 입력 스택 [e, v, a, ē, b_scaled] (5, D)
+        self._kernel_inputs = np.zeros((5, memory_dim))
+        (self._error_buffer,
+         self._velocity_buffer,
+         self._acceleration_buffer,
+         self._filtered_buffer,
+         self._scaled_bias_buffer) = self._kernel_inputs
+        self._kernel = CompiledCorrection.from_config(self._config)
+        
         # 상태 기록 (Variance 감소용)
-        self.error_history: deque = deque(maxlen=self.config.variance_window)
-        self.state_history: deque = deque(maxlen=self.config.variance_window)
+        # ⭐ v0.7: 사전 할당 링 버퍼 + 누적 합 (틱마다 O(D), 할당 없음)
+        self._allocate_history(max(1, int(self._config.variance_window)))
         
         # 이전 상태 (예측용)
         self.prev_state: Optional[np.ndarray] = None
         self.prev_velocity: Optional[np.ndarray] = None
         self.prev_time: float = 0.0
         
+        # ⭐ v0.7: 계산 백엔드 ('numpy' 또는 작은 차원용 'scalar')
+        self.backend = self._select_backend(self._config)
+        
+        # ⭐ v0.7: 속도/가속도 추정기 (None이면 유한 차분, 이전 상태 기반)
+        self.estimator: Optional[DerivativeEstimator] = self._create_estimator(self._config)
+        
+        # ⭐ v0.7: 틱 카운터 (compute_correction 호출 횟수, 결정적)
+        self.tick_count: int = 0
+        
+        # ⭐ v0.7: 다중 시간 스케일 - True면 주기와 관계없이 다음 틱에 단계 갱신
+        self._memory_stale = True
+        self._variance_stale = True
+        
+        # ⭐ v0.7: 재사용 스크래치 버퍼 (정상 상태 틱에서 할당 없음)
+        self._prev_state_buffer = np.zeros(memory_dim)
+        self._prev_velocity_buffer = np.zeros(memory_dim)
+        self._filter_scratch = np.zeros(memory_dim)
+        self._zero_bias = np.zeros(memory_dim)
+        self._zero_bias.flags.writeable = False
+        
+        # ⭐ v0.7: IIR 저주파 필터 상태 (계수는 dt가 바뀔 때만 다시 계산)
+        self._iir_state = np.zeros((2, memory_dim))  # iir1: [y, -], iir2: [z1, z2]
+        self._iir_initialized = False
+        self._iir_dt: Optional[float] = None
+        self._iir_alpha = 1.0
+        self._iir_biquad = (1.0, 0.0, 0.0, 0.0, 0.0)
+        
+        # ⭐ v0.7: 단계별 지연 시간 계측 (None이면 비활성)
+        self.profiler: Optional[StageProfiler] = None
+        
+        # ⭐ v0.7: 데드라인 모드 상태 (마지막 기억, 검색 지연 추정치, 카운터)
+        self._last_bias_buffer = np.zeros(memory_dim)
+        self._last_confidence = 0.0
+        self._last_match: Optional[float] = None  # 마지막 기억의 맥락 일치도
+        self._memory_latency_ns = 0  # 빠른 상승/느린 감쇠 추정치
+        self._deadline_skips = 0  # 연속으로 건너뛴 틱 수
+        self._deadline_ticks = 0
+        self._degraded_ticks = 0
+        self._deadline_overruns = 0
+        
+        # ⭐ v0.7: 비동기 기억 prefetch (None이면 동기 검색)
+        self.prefetcher: Optional[MemoryPrefetcher] = None
+        # 캐시(LRU 순서)와 회로 차단기 상태 보호 (prefetch 스레드와 제어 스레드가 공유,
+        # 메모리 retrieve 자체는 잠그지 않음)
+        self._memory_lock = threading.Lock()
+        self.last_memory_staleness: Optional[int] = None
+        
+        # ⭐ v0.7: 기억 검색 캐시 (None이면 비활성)
+        self.memory_cache: Optional[MemoryBiasCache] = None
+        
+        # ⭐ v0.7: 메모리 장애 회로 차단기 (get_stats()로 상태 조회)
+        self.memory_breaker = CircuitBreaker(
+            failure_threshold=self._config.memory_failure_threshold,
+            cooldown=self._config.memory_breaker_cooldown,
+            backoff_factor=self._config.memory_breaker_backoff,
+            max_cooldown=self._config.memory_breaker_max_cooldown
+        )
+        
         # 저주파 필터 상태 (Variance 감소용)
         self.filtered_error: Optional[np.ndarray] = None
     
+    @property
+    def config(self) -> CerebellumConfig:
+        """소뇌 설정 (불변, 변경은 update_config() 또는 새 설정 대입)"""
+        return self._config
+    
+    @config.setter
+    def config(self, config: CerebellumConfig) -> None:
+        """
+        설정 교체 (v0.7)
+        
+        융합 커널을 먼저 완성한 뒤 참조 하나로 교체하므로, 제어 루프는 항상
+        이전 커널 또는 새 커널 중 하나만 보게 됩니다.
+        variance_window가 바뀌면 최근 기록을 유지한 채 링 버퍼 크기를 조정합니다.
+        """
+        kernel = CompiledCorrection.from_config(config)
+        self._sync_arrays()
+        window = max(1, int(config.variance_window))
+        if window != self._variance_window:
+            self._resize_history(window)
+        if kernel.variance_filter != self._kernel.variance_filter:
+            self._iir_initialized = False
+        if (kernel.variance_filter, kernel.low_pass_cutoff) != (self._kernel.variance_filter,
+                                                                  self._kernel.low_pass_cutoff):
+            self._iir_dt = None
+        if any(getattr(config, name) != getattr(self._config, name) for name in ESTIMATOR_FIELDS):
+            self.estimator = self._create_estimator(config)
+        self._config = config
+        self._kernel = kernel
+        self.backend = self._select_backend(config)
+        # 재사용 중인 단계 출력은 이전 계수로 계산된 것이므로 다음 틱에 갱신
+        self._memory_stale = True
+        self._variance_stale = True
+        with self._memory_lock:
+            self.memory_breaker.configure(
+                config.memory_failure_threshold,
+                config.memory_breaker_cooldown,
+                config.memory_breaker_backoff,
+                config.memory_breaker_max_cooldown
+        )
+        # 캐시된 confidence는 min_confidence로 클리핑된 값이므로 함께 무효화
+        self.invalidate_memory_cache()
+    
+    def _select_backend(self, config: CerebellumConfig) -> str:
+        """설정과 memory_dim에 맞는 계산 백엔드"""
+        if config.backend == 'auto':
+            return 'scalar' if self.memory_dim <= SCALAR_BACKEND_MAX_DIM else 'numpy'
+        return config.backend
+    
+    def _create_estimator(self, config: CerebellumConfig) -> Optional[DerivativeEstimator]:
+        """설정에 맞는 속도/가속도 추정기 (유한 차분이면 None: 이전 상태로 직접 계산)"""
+        if config.derivative_estimator == 'finite_difference':
+            return None
+        return create_derivative_estimator(self.memory_dim, config)
+    
+    def update_config(self, **changes: Any) -> CerebellumConfig:
+        """
+        설정 일부 변경 후 커널 재컴파일 (v0.7)
+        
+        CerebellumConfig는 불변이므로(필드 대입은 FrozenInstanceError) 설정 변경은
+        이 메서드나 config 대입으로 합니다.
+        
+        Args:
+            **changes: 변경할 CerebellumConfig 필드
+        
+        Returns:
+            새 설정
+        """
+        self.config = replace(self._config, **changes)
+        return self._config
+    
+    def _allocate_history(self, window: int) -> None:
+        """링 버퍼 할당"""
+        self._variance_window = window
+        self._error_ring = np.zeros((window, self.memory_dim))
+        self._state_ring = np.zeros((window, self.memory_dim))
+        self._error_rows = list(self._error_ring)  # 행 뷰 (틱마다 뷰 객체를 만들지 않도록)
+        self._state_rows = list(self._state_ring)
+        self._error_sum = np.zeros(self.memory_dim)
+        self._ring_index = 0  # 다음에 기록할 위치
+        self._ring_count = 0  # 기록된 개수 (최대 variance_window)
+    
+    def _resize_history(self, window: int) -> None:
+        """링 버퍼 크기 조정 (최근 기록 유지)"""
+        error_rows = self._ordered_history(self._error_ring)[-window:]
+        state_rows = self._ordered_history(self._state_ring)[-window:]
+        self._allocate_history(window)
+        count = len(error_rows)
+        if count:
+            self._error_ring[:count] = error_rows
+            self._state_ring[:count] = state_rows
+            np.sum(self._error_ring, axis=0, out=self._error_sum)
+        self._ring_count = count
+        self._ring_index = count % window
+    
+    @property
+    def error_history(self) -> deque:
+        """오차 기록 (오래된 순서, 링 버퍼의 복사본)"""
+        self._sync_arrays()
+        return deque(self._ordered_history(self._error_ring), maxlen=self._variance_window)
+    
+    @property
+    def state_history(self) -> deque:
+        """상태 기록 (오래된 순서, 링 버퍼의 복사본)"""
+        self._sync_arrays()
+        return deque(self._ordered_history(self._state_ring), maxlen=self._variance_window)
+    
+    # prev_state / prev_velocity / filtered_error는 복사본을 반환합니다. 내부 버퍼는
+    # 할당 없는 경로를 위해 틱마다 제자리에서 덮어쓰므로, 읽은 값을 보관해도 바뀌지 않도록
+    # (엔진 내부는 _prev_state 등 버퍼를 직접 사용)
+    
+    @property
+    def prev_state(self) -> Optional[np.ndarray]:
+        """이전 상태 (예측용, 첫 틱 전에는 None, 복사본)"""
+        if self._scalar is not None:
+            self._sync_arrays()
+        return None if self._prev_state is None else self._prev_state.copy()
+    
+    @prev_state.setter
+    def prev_state(self, value: Optional[np.ndarray]) -> None:
+        self._prev_state = value
+    
+    @property
+    def prev_velocity(self) -> Optional[np.ndarray]:
+        """이전 속도 (가속도 추정용, 첫 틱 전에는 None, 복사본)"""
+        if self._scalar is not None:
+            self._sync_arrays()
+        return None if self._prev_velocity is None else self._prev_velocity.copy()
+    
+    @prev_velocity.setter
+    def prev_velocity(self, value: Optional[np.ndarray]) -> None:
+        self._prev_velocity = value
+    
+    @property
+    def filtered_error(self) -> Optional[np.ndarray]:
+        """저주파 필터 출력 ē (Variance 감소용, 첫 틱 전에는 None, 복사본)"""
+        if self._scalar is not None:
+            self._sync_arrays()
+        return None if self._filtered_error is None else self._filtered_error.copy()
+    
+    @filtered_error.setter
+    def filtered_error(self, value: Optional[np.ndarray]) -> None:
+        self._filtered_error = value
+    
+    def _sync_arrays(self) -> None:
+        """스칼라 백엔드 상태를 NumPy 버퍼에 기록 (버퍼를 읽기 전에 호출)"""
+        scalar = self._scalar
+        if scalar is not None:
+            self._scalar = None
+            scalar.store(self)
+    
+    def _ordered_history(self, ring: np.ndarray) -> List[np.ndarray]:
+        """링 버퍼 내용을 시간 순서대로 나열"""
+        if self._ring_count < self._variance_window:
+            return [row.copy() for row in ring[:self._ring_count]]
+        start = self._ring_index
+        return [ring[(start + i) % self._variance_window].copy() for i in range(self._variance_window)]
+    
+    def _push_history(self, current_error: np.ndarray, current_state: np.ndarray) -> None:
+        """
+        링 버퍼에 오차/상태 기록 (v0.7)
+        
+        가장 오래된 오차를 누적 합에서 빼고 새 오차를 더해 이동 평균을 O(D)로 유지합니다.
+        버퍼가 한 바퀴 돌 때마다 누적 합을 다시 계산하여 반올림 오차가 쌓이지 않게 합니다.
+        """
+        idx = self._ring_index
+        error_row = self._error_rows[idx]
+        if self._ring_count == self._variance_window:
+            self._error_sum -= error_row
+        else:
+            self._ring_count += 1
+        
+        np.copyto(error_row, current_error)
+        np.copyto(self._state_rows[idx], current_state)
+        self._error_sum += error_row
+        
+        idx += 1
+        if idx == self._variance_window:
+            idx = 0
+            np.sum(self._error_ring, axis=0, out=self._error_sum)
+        self._ring_index = idx
+    
+    def enable_profiling(self, profiler: Optional[StageProfiler] = None) -> StageProfiler:
+        """
+        단계별 지연 시간 계측 활성화 (v0.7)
+        
+        Args:
+            profiler: 사용할 계측기 (None이면 새로 생성, 여러 엔진이 공유 가능)
+        
+        Returns:
+            계측기 (snapshot()으로 p50/p99/max 조회)
+        """
+        self.profiler = profiler or StageProfiler()
+        return self.profiler
+    
+    def disable_profiling(self) -> None:
+        """단계별 지연 시간 계측 비활성화"""
+        self.profiler = None
+    
+    def enable_prefetch(self, max_staleness: int = 2) -> MemoryPrefetcher:
+        """
+        비동기 기억 prefetch 활성화 (v0.7)
+        
+        백그라운드 스레드가 최신 상태로 해마 메모리를 계속 검색하고,
+        compute_correction은 staleness가 max_staleness 틱 이하인 가장 새로운
+        결과를 사용합니다 (없으면 기억 없음으로 처리).
+        
+        Args:
+            max_staleness: 사용할 결과의 최대 staleness (틱)
+        
+        Returns:
+            prefetcher (get_stats()로 staleness 통계 조회)
+        """
+        self.disable_prefetch()
+        self.prefetcher = MemoryPrefetcher(self._get_memory_bias, max_staleness=max_staleness).start()
+        return self.prefetcher
+    
+    def disable_prefetch(self) -> None:
+        """비동기 기억 prefetch 비활성화 (백그라운드 스레드 정지)"""
+        if self.prefetcher is not None:
+            self.prefetcher.stop()
+            self.prefetcher = None
+        self.last_memory_staleness = None
+    
+    def enable_memory_cache(
+        self,
+        resolution: Union[float, np.ndarray] = 1e-3,
+        max_entries: int = 4096
+    ) -> MemoryBiasCache:
+        """
+        양자화 상태 LRU 캐시 활성화 (v0.7)
+        
+        메모리에 version 속성이 있으면 값이 바뀔 때 자동 무효화되고,
+        없으면 기억을 기록한 뒤 invalidate_memory_cache()를 호출해야 합니다.
+        
+        Args:
+            resolution: 상태 양자화 격자 크기 (메모리 검색 반경보다 충분히 작게)
+            max_entries: 최대 캐시 항목 수
+        
+        Returns:
+            캐시 (get_stats()로 적중률 조회)
+        """
+        self.memory_cache = MemoryBiasCache(resolution=resolution, max_entries=max_entries)
+        return self.memory_cache
+    
+    def disable_memory_cache(self) -> None:
+        """기억 검색 캐시 비활성화"""
+        self.memory_cache = None
+    
+    def invalidate_memory_cache(self) -> None:
+        """기억 검색 캐시 무효화 (메모리에 새 기억을 기록한 뒤 호출)"""
+        if self.memory_cache is not None:
+            with self._memory_lock:
+                self.memory_cache.invalidate()
+    
     def set_memory(self, memory: Any) -> None:
         """
         해마 메모리 설정
@@ -145,6 +632,20 @@ class CerebellumEngine:
             memory: UniversalMemory 인스턴스
         """
         self.memory = memory
+        self.invalidate_memory_cache()
+    
+    def set_context_registry(self, registry: Optional[ContextRegistry]) -> None:
+        """
+        맥락 ID 등록부 설정 (v0.7)
+        
+        설정하면 compute_correction의 context에 registry.intern(...)이 돌려준
+        정수 ID를 넘길 수 있습니다 (맥락 가중치는 등록 시 계산된 값 사용).
+        
+        Args:
+            registry: ContextRegistry (None이면 해제, dict 맥락만 사용)
+        """
+        self.context_registry = registry
+        self.invalidate_memory_cache()
     
     def compute_correction(
         self,
@@ -152,85 +653,515 @@ class CerebellumEngine:
         target_state: np.ndarray,
         velocity: Optional[np.ndarray] = None,
         acceleration: Optional[np.ndarray] = None,
-        context: Optional[Dict[str, Any]] = None,
-        dt: float = 0.001  # 시간 간격 (초, 기본값: 1ms)
+        context: Optional[Union[Dict[str, Any], int]] = None,
+        dt: float = 0.001,  # 시간 간격 (초, 기본값: 1ms)
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         소뇌 보정값 계산
         
         해마의 기억을 활용하여 즉각 보정값을 계산합니다.
         
+        ⭐ v0.7: 모든 중간 결과는 엔진 내부 스크래치 버퍼에 계산됩니다.
+        out을 지정하면 결과를 out에 기록하므로 정상 상태 틱에서 새 배열을
+        할당하지 않습니다 (메모리 검색을 제외하면 tracemalloc 기준 신규 블록 0).
+        backend='auto'는 out을 받으면 NumPy 경로를 사용합니다. backend='scalar'를
+        명시하면 out이 있어도 스칼라 경로이며 틱마다 Python float를 할당합니다.
+        
         Args:
             current_state: 현재 상태 [x, y, z, theta_a, theta_b]
             target_state: 목표 상태 [x, y, z, theta_a, theta_b]
             velocity: 현재 속도 (None이면 계산)
             acceleration: 현재 가속도 (None이면 계산)
-            context: 맥락 정보 (해마 메모리 검색용)
+            context: 맥락 정보 (해마 메모리 검색용) 또는 ⭐ v0.7 ContextRegistry 맥락 ID
             dt: 시간 간격 (초)
+            out: 결과를 기록할 (memory_dim,) 배열 (None이면 새 배열 반환)
         
         Returns:
             cerebellum_correction: 소뇌 보정값 [x, y, z, theta_a, theta_b]
         """
+        # ⭐ v0.7: 작은 차원은 스칼라 경로 (계측, 추정기, IIR 필터 사용 시 NumPy 경로,
+        # 'auto'는 out을 받으면 할당 없는 NumPy 경로)
+        if (self.backend == 'scalar' and self.profiler is None and self.estimator is None
+                and self._kernel.variance_filter == 'moving_average'
+                and (out is None or self._config.backend == 'scalar')):
+            return self._compute_correction_scalar(
+                current_state, target_state, velocity, acceleration, context, dt, out
+            )
+        self._sync_arrays()
+        
+        if out is None:
+            out = np.empty(self.memory_dim)
+        kernel = self._kernel
+        profiler = self.profiler
+        if profiler is not None:
+            tick_start = lap = profiler.clock()
+        
         # 현재 오차 계산
-        current_error = target_state - current_state
+        current_error = np.subtract(target_state, current_state, out=self._error_buffer)
         
         # 상태 기록 업데이트
-        self.error_history.append(current_error.copy())
-        self.state_history.append(current_state.copy())
+        self._push_history(current_error, current_state)
+        if profiler is not None:
+            lap = profiler.lap('history', lap)
         
         # 속도/가속도 계산 (제공되지 않은 경우)
-        if velocity is None:
-            velocity = self._estimate_velocity(current_state, dt)
-        if acceleration is None:
-            acceleration = self._estimate_acceleration(velocity, dt)
+        # ⭐ v0.7: 추정기가 있으면 틱당 한 번만 갱신
+        if self.estimator is not None and (velocity is None or acceleration is None):
+            estimated_velocity, estimated_acceleration = self.estimator.update(current_state, dt)
+            np.copyto(self._velocity_buffer, estimated_velocity if velocity is None else velocity)
+            np.copyto(self._acceleration_buffer,
+                      estimated_acceleration if acceleration is None else acceleration)
+            velocity = self._velocity_buffer
+        else:
+            if velocity is None:
+                velocity = self._estimate_velocity(current_state, dt, out=self._velocity_buffer)
+            else:
+                np.copyto(self._velocity_buffer, velocity)
+            if acceleration is None:
+                self._estimate_acceleration(velocity, dt, out=self._acceleration_buffer)
+            else:
+                np.copyto(self._acceleration_buffer, acceleration)
+        if profiler is not None:
+            lap = profiler.lap('derivatives', lap)
+        
+        # ⭐ v0.7: 다중 시간 스케일 - 주기가 아닌 틱은 마지막 단계 출력 재사용
+        tick = self.tick_count
         
         # 1. 해마에서 기억 검색 (기억 기반 적응) - v0.6: confidence 포함
-        memory_bias, confidence = self._get_memory_bias(current_state, context)
+        if self._memory_stale or tick % kernel.memory_interval == 0:
+            self._update_scaled_bias(current_state, context)
+        if profiler is not None:
+            lap = profiler.lap('memory', lap)
+        
+        # 4. Variance 감소용 저주파 필터 (ē를 커널 입력 스택에 기록)
+        # 오차 기록은 매 틱 쌓이며, IIR 필터는 갱신 주기만큼의 Δt로 계산
+        if self._variance_stale or tick % kernel.variance_interval == 0:
+            self._update_filtered_error(current_error, dt * kernel.variance_interval)
+            self._variance_stale = False
+        if profiler is not None:
+            lap = profiler.lap('variance', lap)
+        
+        # 2~6. ⭐ v0.7: 융합 커널 (Feedforward + Trial + Variance + Memory를 한 번의 내적으로)
+        total_correction = np.dot(kernel.coefficients, self._kernel_inputs, out=out)
+        if profiler is not None:
+            lap = profiler.lap('kernel', lap)
+        
+        # ⭐ v0.6: Error norm 기반 saturation 적용
+        total_correction = self._saturate_correction(total_correction, out=total_correction)
+        if profiler is not None:
+            profiler.lap('saturation', lap)
+        
+        # 이전 상태 업데이트 (버퍼 재사용)
+        np.copyto(self._prev_state_buffer, current_state)
+        np.copyto(self._prev_velocity_buffer, self._velocity_buffer)
+        self.prev_state = self._prev_state_buffer
+        self.prev_velocity = self._prev_velocity_buffer
+        
+        self.tick_count += 1
+        if profiler is not None:
+            profiler.lap('total', tick_start)
+        return total_correction
+    
+    def _update_scaled_bias(
+        self,
+        current_state: np.ndarray,
+        context: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        기억 단계: 검색 결과로 커널 입력 b_scaled 갱신 (다음 갱신까지 재사용)
+        
+        ⭐ v0.7: 데드라인 모드면 예산을 넘길 것으로 예상될 때 대체값 사용
+        ⭐ v0.7: prefetch 모드면 백그라운드 검색 결과 사용
+        """
+        kernel = self._kernel
+        if self.prefetcher is not None:
+            memory_bias, confidence, match = self._consume_prefetch(current_state, context)
+        elif kernel.memory_deadline_ns is None:
+            memory_bias, confidence, match = self._get_memory_bias(current_state, context)
+        else:
+            memory_bias, confidence, match = self._get_memory_bias_within_deadline(current_state, context)
         
         # ⭐ v0.6: Confidence 기반 adaptive gain 계산
         adaptive_gain = self._compute_adaptive_gain(confidence)
         
-        # ⭐ v0.6: Context 가중치 계산
-        context_weight = self._compute_context_weight(context) if self.config.context_weight_enabled else 1.0
+        # ⭐ v0.6: Context 가중치 계산 (⭐ v0.7: 메모리가 준 맥락 일치도 우선)
+        if not kernel.context_weight_enabled:
+            context_weight = 1.0
+        elif match is not None:
+            context_weight = match
+        else:
+            context_weight = self._compute_context_weight(context)
+        
+        bias_scale = kernel.bias_coef + kernel.memory_bias_coef * adaptive_gain * context_weight
+        np.multiply(memory_bias, bias_scale, out=self._scaled_bias_buffer)
+        self._memory_stale = False
+    
+    def _compute_correction_scalar(
+        self,
+        current_state: np.ndarray,
+        target_state: np.ndarray,
+        velocity: Optional[np.ndarray],
+        acceleration: Optional[np.ndarray],
+        context: Optional[Dict[str, Any]],
+        dt: float,
+        out: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """
+        작은 차원용 스칼라 경로 (v0.7, backend == 'scalar')
+        
+        memory_dim이 작으면 NumPy 호출 한 번(약 1μs)이 산술 자체보다 비쌉니다.
+        compute_correction과 같은 단계를 Python float 리스트로 계산하며, 상태는
+        ScalarState에 두고 NumPy 버퍼에는 필요할 때만 기록합니다 (_sync_arrays).
+        결과는 NumPy 경로와 합산 순서(내적, 노름)만 다릅니다.
+        """
+        scalar = self._scalar
+        if scalar is None:
+            scalar = self._scalar = ScalarState(self)
+        kernel = self._kernel
+        tick = self.tick_count
+        dim = self.memory_dim
+        state = current_state.tolist() if type(current_state) is np.ndarray else [float(x) for x in current_state]
+        target = target_state.tolist() if type(target_state) is np.ndarray else [float(x) for x in target_state]
+        
+        # 1. 기억 단계 (NumPy 경로와 같은 함수, b_scaled는 NumPy 버퍼가 기준)
+        if self._memory_stale or tick % kernel.memory_interval == 0:
+            self._update_scaled_bias(current_state, context)
+            scalar.scaled_bias = self._scaled_bias_buffer.tolist()
+        
+        # 현재 오차, 상태 기록 (링 버퍼 + 누적 합)
+        errors = [target[i] - state[i] for i in range(dim)]
+        window = self._variance_window
+        idx = self._ring_index
+        sums = scalar.error_sum
+        if self._ring_count == window:
+            old_errors = scalar.error_ring[idx]
+            sums = [sums[i] - old_errors[i] + errors[i] for i in range(dim)]
+        else:
+            sums = [sums[i] + errors[i] for i in range(dim)]
+            self._ring_count += 1
+        scalar.error_ring[idx] = errors
+        scalar.state_ring[idx] = state
+        idx += 1
+        if idx == window:
+            # 한 바퀴마다 누적 합 재계산 (np.sum(axis=0)과 같은 순서)
+            idx = 0
+            sums = [sum(column) for column in zip(*scalar.error_ring)]
+        scalar.error_sum = sums
+        self._ring_index = idx
+        
+        # 속도/가속도 계산 (제공되지 않은 경우)
+        if velocity is not None:
+            velocities = [float(x) for x in velocity]
+        elif scalar.prev_state is None or dt <= 0:
+            velocities = [0.0] * dim
+        else:
+            prev_state = scalar.prev_state
+            velocities = [(state[i] - prev_state[i]) / dt for i in range(dim)]
+        if acceleration is not None:
+            accelerations = [float(x) for x in acceleration]
+        elif scalar.prev_velocity is None or dt <= 0:
+            accelerations = [0.0] * dim
+        else:
+            prev_velocity = scalar.prev_velocity
+            accelerations = [(velocities[i] - prev_velocity[i]) / dt for i in range(dim)]
+        
+        # 4. Variance 감소용 저주파 필터 (이동 평균)
+        if self._variance_stale or tick % kernel.variance_interval == 0:
+            scalar.filtered = errors if self._ring_count < window else [x / window for x in sums]
+            self._variance_stale = False
+        filtered = scalar.filtered
+        
+        # 2~6. 융합 커널 + saturation
+        c_e, c_v, c_a, c_f, c_b = kernel.scalar_coefficients
+        scaled_bias = scalar.scaled_bias
+        correction = [
+            c_e * errors[i] + c_v * velocities[i] + c_a * accelerations[i]
+            + c_f * filtered[i] + c_b * scaled_bias[i]
+            for i in range(dim)
+        ]
+        norm = math.sqrt(sum([x * x for x in correction]))
+        max_norm = kernel.max_correction_norm
+        if norm > max_norm:
+            scale = max_norm / (norm + 1e-8)
+            correction = [x * scale for x in correction]
+        
+        # 이전 상태 업데이트
+        scalar.errors = errors
+        scalar.velocities = velocities
+        scalar.accelerations = accelerations
+        scalar.prev_state = state
+        scalar.prev_velocity = velocities
+        self.tick_count += 1
+        
+        if out is None:
+            return np.array(correction)
+        out[...] = correction
+        return out
+    
+    def compute_corrections(
+        self,
+        states: np.ndarray,
+        targets: np.ndarray,
+        velocities: Optional[np.ndarray] = None,
+        accelerations: Optional[np.ndarray] = None,
+        contexts: Optional[Union[Dict[str, Any], int, Sequence[Optional[Union[Dict[str, Any], int]]]]] = None,
+        dt: float = 0.001
+    ) -> np.ndarray:
+        """
+        궤적 전체에 대한 소뇌 보정값 일괄 계산 (오프라인 모드, v0.7)
+        
+        상태/목표 궤적을 미리 알고 있는 경우(계획, 재생) compute_correction을
+        T번 호출하는 대신 벡터 연산으로 한 번에 계산합니다.
+        - 속도/가속도: 유한 차분 (np.diff)
+        - Variance 필터: 슬라이딩 윈도우 이동 평균
+        - 기억 검색: _get_memory_biases 일괄 조회
+        
+        엔진 상태(오차 기록, prev_state, prev_velocity, filtered_error)는
+        compute_correction을 T번 호출한 것과 같은 상태로 끝납니다.
+        
+        Args:
+            states: 상태 궤적 (T, D)
+            targets: 목표 궤적 (T, D)
+            velocities: 속도 궤적 (T, D) (None이면 계산)
+            accelerations: 가속도 궤적 (T, D) (None이면 계산)
+            contexts: 공통 맥락 하나 또는 스텝별 맥락 T개 (dict 또는 맥락 ID)
+            dt: 시간 간격 (초)
+        
+        Returns:
+            corrections: 소뇌 보정값 궤적 (T, D)
+        """
+        self._sync_arrays()
+        states = np.asarray(states, dtype=float)
+        targets = np.asarray(targets, dtype=float)
+        n_steps = len(states)
+        if n_steps == 0:
+            return np.zeros((0, self.memory_dim))
+        
+        if contexts is None or isinstance(contexts, dict) or is_context_id(contexts):
+            contexts = [contexts] * n_steps
+        elif len(contexts) != n_steps:
+            raise ValueError(f"contexts 길이({len(contexts)})가 궤적 길이({n_steps})와 다릅니다")
+        
+        errors = targets - states
+        
+        # 속도/가속도 (유한 차분, 첫 스텝은 이전 호출의 상태를 이어받음)
+        # ⭐ v0.7: 추정기가 있으면 스텝 순서대로 갱신 (단계별 경로와 같은 상태로 끝남)
+        if self.estimator is not None and (velocities is None or accelerations is None):
+            estimated = np.empty((2, n_steps, self.memory_dim))
+            for t, state in enumerate(states):
+                estimated[0, t], estimated[1, t] = self.estimator.update(state, dt)
+            velocities = estimated[0] if velocities is None else np.asarray(velocities, dtype=float)
+            accelerations = estimated[1] if accelerations is None else np.asarray(accelerations, dtype=float)
+        if velocities is None:
+            velocities = self._finite_difference(states, self._prev_state, dt)
+        else:
+            velocities = np.asarray(velocities, dtype=float)
+        if accelerations is None:
+            accelerations = self._finite_difference(velocities, self._prev_velocity, dt)
+        else:
+            accelerations = np.asarray(accelerations, dtype=float)
+        
+        kernel = self._kernel
         
-        # 2. Predictive Feedforward (다음 순간의 오차 예측)
-        predicted_error = self._predict_error(
-            current_error,
-            velocity,
-            acceleration,
-            dt
+        # ⭐ v0.7: 다중 시간 스케일 - 단계별로 갱신되는 스텝
+        ticks = self.tick_count + np.arange(n_steps)
+        memory_steps = ticks % kernel.memory_interval == 0
+        variance_steps = ticks % kernel.variance_interval == 0
+        memory_steps[0] |= self._memory_stale
+        variance_steps[0] |= self._variance_stale
+        
+        # 1. 기억 검색 (갱신 스텝만 일괄 조회)
+        memory_index = np.flatnonzero(memory_steps)
+        memory_biases, confidences, matches = self._get_memory_biases(
+            states[memory_index], [contexts[i] for i in memory_index]
+        )
+        adaptive_gains = np.clip(confidences, kernel.min_confidence, 1.0)
+        if kernel.context_weight_enabled:
+            context_weights = np.array([
+                self._compute_context_weight(contexts[i]) if np.isnan(match) else match
+                for i, match in zip(memory_index, matches)
+            ])
+        else:
+            context_weights = 1.0
+        bias_scales = kernel.bias_coef + kernel.memory_bias_coef * adaptive_gains * context_weights
+        scaled_biases = self._hold_between_updates(
+            bias_scales[:, None] * memory_biases, memory_steps, self._scaled_bias_buffer
         )
-        feedforward_correction = -predicted_error * self.config.feedforward_gain
         
-        # 3. Trial-to-Trial 보정 (반복 궤적의 미세 편차 제거)
-        trial_correction = self._compute_trial_correction(
-            current_error,
-            memory_bias
+        # 4. Variance 감소 (이전 기록을 이어붙인 슬라이딩 윈도우 평균)
+        filtered_errors = self._hold_between_updates(
+            self._filter_errors(errors, dt, variance_steps), variance_steps, self._filtered_buffer
         )
         
-        # 4. Variance 감소 (미세한 떨림 필터링)
-        variance_correction = self._reduce_variance(current_error)
+        # 2~6. 융합 커널 (스텝별 bias 계수만 다름)
+        c_e, c_v, c_a, c_f, _ = kernel.coefficients
+        corrections = (
+            c_e * errors +
+            c_v * velocities +
+            c_a * accelerations +
+            c_f * filtered_errors +
+            scaled_biases
+        )
         
-        # 5. 기억 기반 적응 (해마의 기억을 즉각 행동으로 변환)
-        # ⭐ v0.6: confidence와 context_weight 적용
-        memory_correction = -memory_bias * self.config.memory_gain * adaptive_gain * context_weight
+        # 스텝별 saturation
+        norms = np.linalg.norm(corrections, axis=1)
+        over = norms > kernel.max_correction_norm
+        if over.any():
+            corrections[over] *= (kernel.max_correction_norm / (norms[over] + 1e-8))[:, None]
+        
+        # 엔진 상태를 단계별 경로와 같게 갱신
+        self._extend_history(errors, states)
+        np.copyto(self._filtered_buffer, filtered_errors[-1])
+        self.filtered_error = self._filtered_buffer
+        np.copyto(self._scaled_bias_buffer, scaled_biases[-1])
+        self._memory_stale = False
+        self._variance_stale = False
+        np.copyto(self._prev_state_buffer, states[-1])
+        np.copyto(self._prev_velocity_buffer, velocities[-1])
+        self.prev_state = self._prev_state_buffer
+        self.prev_velocity = self._prev_velocity_buffer
+        self.tick_count += n_steps
+        
+        return corrections
+    
+    def _finite_difference(
+        self,
+        values: np.ndarray,
+        prev_value: Optional[np.ndarray],
+        dt: float
+    ) -> np.ndarray:
+        """궤적의 유한 차분 (_estimate_velocity/_estimate_acceleration의 일괄 버전)"""
+        derivative = np.zeros_like(values)
+        if dt <= 0:
+            return derivative
+        derivative[1:] = np.diff(values, axis=0) / dt
+        if prev_value is not None:
+            derivative[0] = (values[0] - prev_value) / dt
+        return derivative
+    
+    @staticmethod
+    def _hold_between_updates(
+        updated: np.ndarray,
+        update_steps: np.ndarray,
+        previous: np.ndarray
+    ) -> np.ndarray:
+        """
+        다중 시간 스케일 출력의 일괄 버전 (갱신 스텝 사이는 마지막 값 유지)
         
-        # 6. 통합 보정
-        total_correction = (
-            feedforward_correction +
-            trial_correction +
-            variance_correction +
-            memory_correction
-        ) * self.config.correction_weight
+        Args:
+            updated: 갱신 스텝의 출력 (갱신 스텝 수, D) 또는 전체 스텝 (T, D)
+            update_steps: 스텝별 갱신 여부 (T,)
+            previous: 첫 갱신 이전 스텝이 쓸 값 (D,)
         
-        # ⭐ v0.6: Error norm 기반 saturation 적용
-        total_correction = self._saturate_correction(total_correction)
+        Returns:
+            (T, D) 스텝별 출력
+        """
+        n_steps = len(update_steps)
+        if len(updated) == n_steps:
+            updated = updated[update_steps]
+        # 행 k(≥1)는 k번째 갱신, 스텝 t는 t까지의 갱신 횟수 번째 행을 사용
+        rows = np.concatenate([previous[None, :], updated])
+        return rows[np.cumsum(update_steps)]
+    
+    def _filter_errors(
+        self,
+        errors: np.ndarray,
+        dt: float,
+        update_steps: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        궤적 전체의 저주파 필터 (_update_filtered_error의 일괄 버전)
         
-        # 이전 상태 업데이트
-        self.prev_state = current_state.copy()
-        self.prev_velocity = velocity.copy()
+        이동 평균: 스텝 t에서 기록 개수가 윈도우보다 작으면 현재 오차, 아니면 최근 N개 평균
+        IIR: 재귀식이므로 스텝 순서대로 O(D) 갱신 (필터 상태도 함께 갱신)
         
-        return total_correction
+        update_steps가 주어지면 IIR은 갱신 스텝만 계산합니다 (나머지 행은 미정).
+        """
+        if self._kernel.variance_filter != 'moving_average':
+            if update_steps is None:
+                update_steps = np.ones(len(errors), dtype=bool)
+            step_dt = dt * self._kernel.variance_interval
+            filtered = np.empty_like(errors)
+            for t in np.flatnonzero(update_steps):
+                self._update_iir_filter(errors[t], step_dt, filtered[t])
+            return filtered
+        
+        window = self._variance_window
+        prior = self._ordered_history(self._error_ring)
+        n_prior = len(prior)
+        history = np.concatenate([np.array(prior).reshape(n_prior, self.memory_dim), errors])
+        
+        filtered = errors.copy()
+        first_full = max(0, window - 1 - n_prior)  # 윈도우가 처음 채워지는 스텝
+        if first_full < len(errors):
+            means = sliding_window_view(history, window, axis=0).mean(axis=-1)
+            # history[j-window+1 : j+1]의 평균이 means[j-window+1]
+            start = n_prior + first_full - window + 1
+            filtered[first_full:] = means[start:]
+        return filtered
+    
+    def _extend_history(self, errors: np.ndarray, states: np.ndarray) -> None:
+        """궤적 전체를 링 버퍼에 기록한 것과 같은 상태로 링 버퍼 재구성"""
+        window = self._variance_window
+        error_rows = self._ordered_history(self._error_ring) + list(errors[-window:])
+        state_rows = self._ordered_history(self._state_ring) + list(states[-window:])
+        count = min(window, len(error_rows))
+        
+        self._error_ring.fill(0.0)
+        self._state_ring.fill(0.0)
+        self._error_ring[:count] = error_rows[-count:]
+        self._state_ring[:count] = state_rows[-count:]
+        np.sum(self._error_ring, axis=0, out=self._error_sum)
+        self._ring_count = count
+        self._ring_index = count % window
+    
+    def _get_memory_biases(
+        self,
+        states: np.ndarray,
+        contexts: Sequence[Optional[Dict[str, Any]]]
+    ) -> tuple:
+        """
+        여러 상태에 대한 기억 일괄 검색
+        
+        Args:
+            states: 상태 (T, D)
+            contexts: 스텝별 맥락 T개
+        
+        Returns:
+            (memory_biases, confidences, matches): (T, D) bias, (T,) 신뢰도,
+            (T,) 맥락 일치도 (메모리가 주지 않으면 nan)
+        """
+        memory_biases = np.zeros((len(states), self.memory_dim))
+        confidences = np.zeros(len(states))
+        matches = np.full(len(states), np.nan)
+        
+        # ⭐ v0.7: retrieve_many가 있는 메모리는 한 번에 검색 (캐시 사용 시에는 스텝별 조회)
+        retrieve_many = getattr(self.memory, 'retrieve_many', None)
+        if retrieve_many is not None and self.memory_cache is None:
+            breaker = self.memory_breaker
+            now = self.tick_count
+            with self._memory_lock:
+                if not breaker.allow(now):
+                    return memory_biases, confidences, matches
+            try:
+                result = retrieve_many(
+                    states, [memory_context(c, self.context_registry, self.memory) for c in contexts]
+                )
+            except Exception as e:
+                with self._memory_lock:
+                    breaker.record_failure(now, e)
+                return memory_biases, confidences, matches
+            with self._memory_lock:
+                breaker.record_success()
+            # 스텝별 _retrieve_memory_bias와 같은 해석 (confidence 0인 적중도 min_confidence로 적용)
+            return memory_results(result, self.memory_dim, self._kernel.min_confidence)
+        
+        for i, state in enumerate(states):
+            memory_biases[i], confidences[i], match = self._get_memory_bias(state, contexts[i])
+            if match is not None:
+                matches[i] = match
+        return memory_biases, confidences, matches
     
     def _get_memory_bias(
         self,
@@ -245,182 +1176,264 @@ class CerebellumEngine:
             context: 맥락 정보
         
         Returns:
-            (memory_bias, confidence): 기억된 bias와 신뢰도 (없으면 0 벡터, 0.0)
+            (memory_bias, confidence, match): 기억된 bias, 신뢰도 (없으면 0 벡터, 0.0),
+            메모리가 준 맥락 일치도 (없으면 None → 맥락 키 개수 근사 사용)
         """
         if self.memory is None:
-            return np.zeros(self.memory_dim), 0.0
+            return self._zero_bias, 0.0, None
+        
+        # ⭐ v0.7: prefetch 스레드에서도 호출되므로 캐시/차단기는 _memory_lock 안에서만 갱신
+        cache = self.memory_cache
+        breaker = self.memory_breaker
+        now = self.tick_count
+        with self._memory_lock:
+            # ⭐ v0.7: 양자화 상태 캐시 (적중 시 최근접 이웃 검색 생략)
+            if cache is not None:
+                cache.sync(self.memory)
+                key = cache.make_key(current_state, context)
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+                invalidations = cache.invalidations
+            
+            # ⭐ v0.7: 회로 차단기가 열려 있으면 메모리 없이 동작
+            if not breaker.allow(now):
+                return self._zero_bias, 0.0, None
+        
+        memory_bias, confidence, match, error = self._retrieve_memory_bias(current_state, context)
+        with self._memory_lock:
+            if error is not None:
+                breaker.record_failure(now, error)
+                return memory_bias, confidence, match
+            
+            breaker.record_success()
+            # 검색 중에 무효화되었으면 이전 기억으로 계산한 결과이므로 저장하지 않음
+            if cache is not None and cache.invalidations == invalidations:
+                cache.put(key, memory_bias, confidence, match)
+        return memory_bias, confidence, match
+    
+    def _retrieve_memory_bias(
+        self,
+        current_state: np.ndarray,
+        context: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """
+        해마 메모리 retrieve 호출 및 결과 해석
         
+        Args:
+            current_state: 현재 상태
+            context: 맥락 정보
+        
+        Returns:
+            (memory_bias, confidence, match, error): 실패 시 0 벡터, 0.0, None과 발생한 예외
+        """
+        memory_bias, confidence, match, error = self._zero_bias, 0.0, None, None
         try:
             # 해마 메모리에서 기억 검색
-            memories = self.memory.retrieve(current_state, context or {})
+            memories = self.memory.retrieve(
+                current_state, memory_context(context, self.context_registry, self.memory)
+            )
             
-            if memories:
-                # 첫 번째 기억의 bias와 confidence 사용
-                memory_bias = memories[0].get('bias', np.zeros(self.memory_dim))
-                confidence = memories[0].get('confidence', 0.5)  # 기본값 0.5
-                # confidence를 [min_confidence, 1.0] 범위로 클리핑
-                confidence = np.clip(confidence, self.config.min_confidence, 1.0)
-                return memory_bias, confidence
-            else:
-                return np.zeros(self.memory_dim), 0.0
-        except Exception:
-            # 오류 발생 시 0 벡터 반환
-            return np.zeros(self.memory_dim), 0.0
+            # 첫 번째 기억의 bias와 confidence ([min_confidence, 1.0]로 클리핑) 사용
+            # ⭐ v0.7: 맥락 분할 메모리(ContextMemory)는 실제 맥락 일치도를 함께 반환
+            memory_bias, confidence, match = memory_result(memories, self._kernel.min_confidence)
+            if memory_bias is None:
+                memory_bias = self._zero_bias
+        except Exception as e:
+            # 오류 발생 시 0 벡터 반환 (회로 차단기에 기록)
+            memory_bias, confidence, match, error = self._zero_bias, 0.0, None, e
+        
+        return memory_bias, confidence, match, error
     
-    def _predict_error(
+    def _get_memory_bias_within_deadline(
         self,
-        current_error: np.ndarray,
-        velocity: np.ndarray,
-        acceleration: np.ndarray,
-        dt: float
-    ) -> np.ndarray:
+        current_state: np.ndarray,
+        context: Optional[Dict[str, Any]]
+    ) -> tuple:
         """
-        다음 순간의 오차 예측 (Predictive Feedforward)
-        
-        ================================================================================
-        수식 설명
-        ================================================================================
-        e_pred(t+Δt) = e(t) + v(t)·Δt + ½a(t)·(Δt)²
+        시간 예산 안에서 기억 검색 (v0.7 데드라인 모드)
         
-        여기서:
-        - e(t): 현재 오차 (current_error)
-        - v(t): 현재 속도 (velocity)
-        - a(t): 현재 가속도 (acceleration)
-        - Δt: 예측 시간 (prediction_horizon)
-        - e_pred(t+Δt): 예측된 오차
-        
-        물리적 의미:
-        - 현재 오차에 속도와 가속도를 고려하여 다음 순간의 오차를 예측
-        - Taylor 전개 1차 항(속도) + 2차 항(가속도) 사용
+        검색 지연 추정치(빠른 상승, 느린 감쇠)가 memory_deadline을 넘으면 검색을
+        건너뛰고 마지막 기억(또는 0 벡터)을 사용합니다. 건너뛴 틱이
+        deadline_probe_interval에 도달하면 한 번 다시 검색해 추정치를 갱신합니다.
         
-        생물학적 대응:
-        - 소뇌의 Internal Model (내부 모델)
-        - Forward Model을 통한 오차 예측
-        
-        ================================================================================
+        동기 검색 자체는 중간에 끊을 수 없으므로, 예상치 못한 한 번의 지연은
+        overruns로 집계됩니다 (비동기 prefetch와 함께 쓰면 완전히 분리 가능).
         
         Args:
-            current_error: 현재 오차 [x, y, z, theta_a, theta_b]
-            velocity: 현재 속도 [vx, vy, vz, v_theta_a, v_theta_b]
-            acceleration: 현재 가속도 [ax, ay, az, a_theta_a, a_theta_b]
-            dt: 시간 간격 (초) - 실제로는 prediction_horizon 사용
+            current_state: 현재 상태
+            context: 맥락 정보
         
         Returns:
-            predicted_error: 예측된 오차 [x, y, z, theta_a, theta_b]
+            (memory_bias, confidence, match)
         """
-        # 예측 시간
-        prediction_dt = self.config.prediction_horizon
+        kernel = self._kernel
+        budget_ns = kernel.memory_deadline_ns
+        self._deadline_ticks += 1
+        
+        if self._memory_latency_ns > budget_ns and self._deadline_skips < kernel.deadline_probe_interval:
+            self._deadline_skips += 1
+            self._degraded_ticks += 1
+            if kernel.fallback_last:
+                return self._last_bias_buffer, self._last_confidence, self._last_match
+            return self._zero_bias, 0.0, None
+        
+        self._deadline_skips = 0
+        start = time.perf_counter_ns()
+        memory_bias, confidence, match = self._get_memory_bias(current_state, context)
+        elapsed = time.perf_counter_ns() - start
+        
+        # 빠른 상승 / 느린 감쇠 (α = 0.25)
+        if elapsed >= self._memory_latency_ns:
+            self._memory_latency_ns = elapsed
+        else:
+            self._memory_latency_ns += (elapsed - self._memory_latency_ns) // 4
+        if elapsed > budget_ns:
+            self._deadline_overruns += 1
+        
+        np.copyto(self._last_bias_buffer, memory_bias)
+        self._last_confidence = confidence
+        self._last_match = match
+        return memory_bias, confidence, match
+    
+    def _consume_prefetch(
+        self,
+        current_state: np.ndarray,
+        context: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """
+        prefetch 결과 사용 (v0.7)
         
-        # 예측 오차 계산
-        predicted_error = (
-            current_error +
-            velocity * prediction_dt +
-            0.5 * acceleration * prediction_dt ** 2
-        )
+        현재 상태로 다음 검색을 요청하고, 완료된 가장 새로운 결과를 가져옵니다.
+        staleness는 last_memory_staleness에 기록됩니다.
+        
+        Returns:
+            (memory_bias, confidence, match)
+        """
+        prefetcher = self.prefetcher
+        prefetcher.submit(current_state, context, self.tick_count)
+        result = prefetcher.consume(self.tick_count)
+        self.last_memory_staleness = prefetcher.last_staleness
+        if result is None:
+            return self._zero_bias, 0.0, None
+        memory_bias, confidence, match, _ = result
+        return memory_bias, confidence, match
+    
+    def get_deadline_stats(self) -> Dict[str, Any]:
+        """
+        데드라인 모드 통계 (v0.7)
         
-        return predicted_error
+        Returns:
+            ticks: 데드라인 모드로 처리한 틱 수
+            degraded: 기억 검색을 건너뛰고 대체값을 쓴 틱 수
+            overruns: 검색이 예산을 넘긴 횟수
+            degraded_ratio: degraded / ticks
+            memory_latency_estimate_us: 현재 검색 지연 추정치 (μs)
+        """
+        ticks = self._deadline_ticks
+        return {
+            'ticks': ticks,
+            'degraded': self._degraded_ticks,
+            'overruns': self._deadline_overruns,
+            'degraded_ratio': self._degraded_ticks / ticks if ticks else 0.0,
+            'memory_latency_estimate_us': self._memory_latency_ns / 1000.0,
+        }
     
-    def _compute_trial_correction(
+    def _update_filtered_error(
         self,
         current_error: np.ndarray,
-        memory_bias: np.ndarray
+        dt: Optional[float] = None
     ) -> np.ndarray:
         """
-        Trial-to-Trial 보정 계산
-        
-        ================================================================================
-        수식 설명
-        ================================================================================
-        trial_error = e(t) - b_hip(x(t), c(t))
-        trial_correction = -trial_error · α_trial
-        
-        여기서:
-        - e(t): 현재 오차 (current_error)
-        - b_hip(x(t), c(t)): 해마에서 기억된 bias (memory_bias)
-        - trial_error: Trial 오차 (기억된 bias와 현재 오차의 차이)
-        - α_trial: Trial gain (trial_gain)
-        - trial_correction: Trial 보정값
-        
-        의미:
-        - 반복 궤적에서 "항상 생기던 오차"를 기억하고
-        - 다음 시행에서 미리 제거하여 더 정확한 제어
-        
-        생물학적 대응:
-        - 소뇌의 Trial-to-Trial Learning
-        - 인간이 악기·운동 배울 때 정확히 이 방식
-        
-        ================================================================================
+        저주파 필터 갱신 (variance_filter에 따라 이동 평균 또는 IIR)
         
         Args:
-            current_error: 현재 오차 [x, y, z, theta_a, theta_b]
-            memory_bias: 기억된 bias [bx, by, bz, b_theta_a, b_theta_b]
+            current_error: 현재 오차
+            dt: 시간 간격 (IIR 계수 계산용, None이면 직전 값)
         
         Returns:
-            trial_correction: Trial 보정값 [x, y, z, theta_a, theta_b]
+            filtered_error: 필터링된 오차 (_filtered_buffer, filtered_error 속성은 이 버퍼의 복사본)
         """
-        # Trial 오차 계산 (기억된 bias와 현재 오차의 차이)
-        trial_error = current_error - memory_bias
-        
-        # Trial 보정
-        trial_correction = -trial_error * self.config.trial_gain
+        filtered_error = self._filtered_buffer
+        if self._kernel.variance_filter != 'moving_average':
+            self._update_iir_filter(current_error, dt, filtered_error)
+        elif self._ring_count < self._variance_window:
+            # 윈도우가 채워지지 않았으면 현재 오차 사용
+            np.copyto(filtered_error, current_error)
+        else:
+            # 이동 평균 필터 (누적 합 / 윈도우 크기)
+            np.divide(self._error_sum, self._variance_window, out=filtered_error)
         
-        return trial_correction
+        # 필터링된 오차 저장
+        self.filtered_error = filtered_error
+        return filtered_error
     
-    def _reduce_variance(
+    def _update_iir_filter(
         self,
-        current_error: np.ndarray
+        current_error: np.ndarray,
+        dt: Optional[float],
+        out: np.ndarray
     ) -> np.ndarray:
         """
-        Variance 감소 (미세한 떨림 필터링)
+        IIR 저주파 필터 한 스텝 (v0.7, O(D), 기록 버퍼 없음)
         
         ================================================================================
         수식 설명
         ================================================================================
-        filtered_error = mean(error_history)  # 이동 평균 필터
-        high_freq_noise = e(t) - filtered_error
-        variance_correction = -high_freq_noise · α_variance
-        
-        여기서:
-        - e(t): 현재 오차 (current_error)
-        - filtered_error: 저주파 필터링된 오차 (이동 평균)
-        - high_freq_noise: 고주파 노이즈 (떨림)
-        - α_variance: Variance gain (variance_gain)
-        - variance_correction: Variance 감소 보정값
-        
-        의미:
-        - 고주파 노이즈(떨림) 제거
-        - 저주파 의도적 움직임 유지
-        - 분산(Variance) 감소
-        
-        생물학적 대응:
-        - 소뇌의 Tremor Suppression
-        - 파킨슨·소뇌 실조 연구에도 쓰는 개념
+        1차: α = 1 - exp(-2π·f_c·Δt),  y = y + α·(e - y)
+        2차: Butterworth biquad (Direct Form II Transposed)
+             y = b0·e + z1,  z1 = b1·e - a1·y + z2,  z2 = b2·e - a2·y
         
+        여기서 f_c는 low_pass_cutoff이며, 계수는 Δt가 바뀔 때만 다시 계산합니다.
+        첫 스텝은 현재 오차에서 정상 상태로 시작합니다 (y = e).
         ================================================================================
         
         Args:
-            current_error: 현재 오차 [x, y, z, theta_a, theta_b]
+            current_error: 현재 오차
+            dt: 시간 간격 (None이면 직전 값)
+            out: 필터 출력을 기록할 배열
         
         Returns:
-            variance_correction: Variance 감소 보정값 [x, y, z, theta_a, theta_b]
+            out
         """
-        # 저주파 필터 적용 (단순 이동 평균)
-        if len(self.error_history) < self.config.variance_window:
-            # 윈도우가 채워지지 않았으면 현재 오차 사용
-            filtered_error = current_error.copy()
-        else:
-            # 이동 평균 필터
-            error_array = np.array(list(self.error_history))
-            filtered_error = np.mean(error_array, axis=0)
-        
-        # 필터링된 오차 저장
-        self.filtered_error = filtered_error
-        
-        # Variance 보정 (고주파 노이즈 제거)
-        high_freq_noise = current_error - filtered_error
-        variance_correction = -high_freq_noise * self.config.variance_gain
-        
-        return variance_correction
+        kernel = self._kernel
+        if dt is not None and dt != self._iir_dt:
+            self._iir_dt = dt
+            self._iir_alpha = first_order_alpha(kernel.low_pass_cutoff, dt)
+            self._iir_biquad = butterworth2_coefficients(kernel.low_pass_cutoff, dt)
+        
+        z1, z2 = self._iir_state
+        scratch = self._filter_scratch
+        
+        if kernel.variance_filter == 'iir1':
+            if not self._iir_initialized:
+                np.copyto(z1, current_error)
+                self._iir_initialized = True
+            else:
+                np.subtract(current_error, z1, out=scratch)
+                np.multiply(scratch, self._iir_alpha, out=scratch)
+                np.add(z1, scratch, out=z1)
+            np.copyto(out, z1)
+            return out
+        
+        b0, b1, b2, a1, a2 = self._iir_biquad
+        if not self._iir_initialized:
+            # 입력 e가 계속될 때의 정상 상태 (y = e)
+            np.multiply(current_error, 1.0 - b0, out=z1)
+            np.multiply(current_error, b2 - a2, out=z2)
+            self._iir_initialized = True
+        
+        y = np.multiply(current_error, b0, out=scratch)
+        np.add(y, z1, out=y)
+        np.multiply(current_error, b1, out=z1)
+        np.multiply(y, a1, out=out)
+        np.subtract(z1, out, out=z1)
+        np.add(z1, z2, out=z1)
+        np.multiply(current_error, b2, out=z2)
+        np.multiply(y, a2, out=out)
+        np.subtract(z2, out, out=z2)
+        np.copyto(out, y)
+        return out
     
     def _compute_adaptive_gain(self, confidence: float) -> float:
         """
@@ -435,7 +1448,7 @@ class CerebellumEngine:
             adaptive_gain: 적응형 gain [min_confidence, 1.0]
         """
         # confidence를 [min_confidence, 1.0] 범위로 정규화
-        adaptive_gain = np.clip(confidence, self.config.min_confidence, 1.0)
+        adaptive_gain = min(max(confidence, self._kernel.min_confidence), 1.0)
         return adaptive_gain
     
     def _compute_context_weight(self, context: Optional[Dict[str, Any]]) -> float:
@@ -444,21 +1457,29 @@ class CerebellumEngine:
         
         같은 위치라도 상황(context)이 다르면 소뇌 반응이 달라야 함
         
+        ⭐ v0.7: 메모리가 검색 결과에 맥락 일치도('match')를 주면 (ContextMemory)
+        그 값을 대신 사용하고, 이 함수는 일치도를 모를 때의 근사로만 쓰입니다.
+        
         Args:
             context: 맥락 정보 (tool, temperature, medium 등)
         
         Returns:
             context_weight: 맥락 가중치 [0.0, 1.0]
         """
-        if context is None or len(context) == 0:
-            return 0.5  # 맥락 없으면 중간 가중치
-        
-        # 간단한 구현: 맥락 키 개수 기반 가중치
-        # 실제로는 맥락 일치도 계산 필요
-        context_weight = min(1.0, 0.5 + len(context) * 0.1)
-        return context_weight
+        # ⭐ v0.7: 맥락 ID는 등록 시 계산된 가중치
+        if is_context_id(context):
+            if self.context_registry is None:
+                raise ValueError("정수 맥락 ID를 쓰려면 set_context_registry()로 등록부를 설정해야 합니다")
+            return self.context_registry.weight(context)
+        
+        # 근사: 맥락 키 개수 기반 가중치 (맥락 없으면 0.5)
+        return context_weight(context)
     
-    def _saturate_correction(self, correction: np.ndarray) -> np.ndarray:
+    def _saturate_correction(
+        self,
+        correction: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Error norm 기반 saturation (v0.6)
         
@@ -484,25 +1505,30 @@ class CerebellumEngine:
         
         Args:
             correction: 보정 신호 [x, y, z, theta_a, theta_b]
+            out: 결과를 기록할 배열 (None이면 포화 시 새 배열, correction 자체도 가능)
         
         Returns:
             saturated_correction: 포화 제한된 보정 신호 [x, y, z, theta_a, theta_b]
         """
         correction_norm = np.linalg.norm(correction)
-        max_norm = self.config.max_correction_norm
+        max_norm = self._kernel.max_correction_norm
         
         if correction_norm > max_norm:
             # Soft saturation: smooth clip
             eps = 1e-8
             scale = max_norm / (correction_norm + eps)
-            return correction * scale
+            return np.multiply(correction, scale, out=out)
         
+        if out is not None and out is not correction:
+            np.copyto(out, correction)
+            return out
         return correction
     
     def _estimate_velocity(
         self,
         current_state: np.ndarray,
-        dt: float
+        dt: float,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         속도 추정 (이전 상태 기반)
@@ -510,20 +1536,26 @@ class CerebellumEngine:
         Args:
             current_state: 현재 상태
             dt: 시간 간격
+            out: 결과를 기록할 배열 (None이면 새 배열)
         
         Returns:
             velocity: 추정된 속도
         """
-        if self.prev_state is None or dt <= 0:
-            return np.zeros(self.memory_dim)
-        
-        velocity = (current_state - self.prev_state) / dt
+        if out is None:
+            out = np.empty(self.memory_dim)
+        if self._prev_state is None or dt <= 0:
+            out.fill(0.0)
+            return out
+        
+        velocity = np.subtract(current_state, self._prev_state, out=out)
+        np.divide(velocity, dt, out=velocity)
         return velocity
     
     def _estimate_acceleration(
         self,
         velocity: np.ndarray,
-        dt: float
+        dt: float,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         가속도 추정 (이전 속도 기반)
@@ -531,20 +1563,173 @@ class CerebellumEngine:
         Args:
             velocity: 현재 속도
             dt: 시간 간격
+            out: 결과를 기록할 배열 (None이면 새 배열)
         
         Returns:
             acceleration: 추정된 가속도
         """
-        if self.prev_velocity is None or dt <= 0:
-            return np.zeros(self.memory_dim)
-        
-        acceleration = (velocity - self.prev_velocity) / dt
+        if out is None:
+            out = np.empty(self.memory_dim)
+        if self._prev_velocity is None or dt <= 0:
+            out.fill(0.0)
+            return out
+        
+        acceleration = np.subtract(velocity, self._prev_velocity, out=out)
+        np.divide(acceleration, dt, out=acceleration)
         return acceleration
     
+    def snapshot(self) -> bytes:
+        """
+        엔진 상태 스냅샷 (v0.7, 웜 재시작/핫 스탠바이 복제용)
+        
+        설정, 오차/상태 기록, prev_state, prev_velocity, filtered_error,
+        IIR 필터·추정기·다중 주기 상태, 틱 카운터를 버전 있는 바이너리로
+        직렬화합니다 (pickle 없음, 형식은 cerebellum.snapshot 참고).
+        해마 메모리, 캐시, prefetch, 계측기, 회로 차단기는 포함하지 않습니다.
+        
+        Returns:
+            스냅샷 바이트열
+        """
+        self._sync_arrays()
+        arrays = [
+            ('error_ring', self._error_ring),
+            ('state_ring', self._state_ring),
+            ('error_sum', self._error_sum),
+            ('kernel_inputs', self._kernel_inputs),
+            ('prev_state', self._prev_state_buffer),
+            ('prev_velocity', self._prev_velocity_buffer),
+            ('iir_state', self._iir_state),
+            ('last_bias', self._last_bias_buffer),
+        ]
+        estimator_scalars = None
+        if self.estimator is not None:
+            estimator_arrays, estimator_scalars = self.estimator.get_state()
+            arrays.extend(('estimator.' + name, array) for name, array in estimator_arrays.items())
+        
+        header = {
+            'memory_dim': self.memory_dim,
+            'config': asdict(self._config),
+            'state': {
+                'ring_index': self._ring_index,
+                'ring_count': self._ring_count,
+                'tick_count': self.tick_count,
+                'prev_time': self.prev_time,
+                'has_prev_state': self._prev_state is not None,
+                'has_prev_velocity': self._prev_velocity is not None,
+                'has_filtered_error': self._filtered_error is not None,
+                'iir_initialized': self._iir_initialized,
+                'memory_stale': self._memory_stale,
+                'variance_stale': self._variance_stale,
+                'last_confidence': self._last_confidence,
+                'last_match': self._last_match,
+                'memory_latency_ns': self._memory_latency_ns,
+                'deadline_skips': self._deadline_skips,
+            },
+            'estimator': estimator_scalars,
+        }
+        return encode_snapshot(header, arrays)
+    
+    def restore(self, buffer: bytes) -> None:
+        """
+        snapshot()으로 만든 상태 복원 (v0.7)
+        
+        스냅샷의 설정이 현재 설정과 다르면 설정도 교체합니다.
+        
+        Args:
+            buffer: 스냅샷 바이트열
+        
+        Raises:
+            ValueError: 형식/버전/차원이 맞지 않는 경우
+        """
+        header, arrays = decode_snapshot(buffer)
+        self._scalar = None  # 버퍼를 통째로 덮어쓰므로 스칼라 상태는 버림
+        if header['memory_dim'] != self.memory_dim:
+            raise ValueError(
+                f"스냅샷 memory_dim({header['memory_dim']})이 엔진({self.memory_dim})과 다릅니다"
+            )
+        config = CerebellumConfig(**header['config'])
+        if config != self._config:
+            self.config = config
+        
+        np.copyto(self._error_ring, arrays['error_ring'])
+        np.copyto(self._state_ring, arrays['state_ring'])
+        np.copyto(self._error_sum, arrays['error_sum'])
+        np.copyto(self._kernel_inputs, arrays['kernel_inputs'])
+        np.copyto(self._prev_state_buffer, arrays['prev_state'])
+        np.copyto(self._prev_velocity_buffer, arrays['prev_velocity'])
+        np.copyto(self._iir_state, arrays['iir_state'])
+        np.copyto(self._last_bias_buffer, arrays['last_bias'])
+        if self.estimator is not None:
+            prefix = 'estimator.'
+            self.estimator.set_state(
+                {name[len(prefix):]: array for name, array in arrays.items() if name.startswith(prefix)},
+                header['estimator']
+            )
+        
+        state = header['state']
+        self._ring_index = state['ring_index']
+        self._ring_count = state['ring_count']
+        self.tick_count = state['tick_count']
+        self.prev_time = state['prev_time']
+        self.prev_state = self._prev_state_buffer if state['has_prev_state'] else None
+        self.prev_velocity = self._prev_velocity_buffer if state['has_prev_velocity'] else None
+        self.filtered_error = self._filtered_buffer if state['has_filtered_error'] else None
+        self._iir_initialized = state['iir_initialized']
+        self._iir_dt = None  # 계수는 다음 틱에 다시 계산
+        self._memory_stale = state['memory_stale']
+        self._variance_stale = state['variance_stale']
+        self._last_confidence = state['last_confidence']
+        self._last_match = state.get('last_match')
+        self._memory_latency_ns = state['memory_latency_ns']
+        self._deadline_skips = state['deadline_skips']
+        
+        # 이전 틱 번호로 요청된 prefetch 결과는 버림
+        if self.prefetcher is not None:
+            self.prefetcher.clear()
+    
+    @classmethod
+    def from_snapshot(cls, buffer: bytes, memory: Optional[Any] = None) -> 'CerebellumEngine':
+        """
+        스냅샷에서 새 엔진 생성 (v0.7, 핫 스탠바이용)
+        
+        Args:
+            buffer: 스냅샷 바이트열
+            memory: 해마 메모리 인스턴스
+        
+        Returns:
+            CerebellumEngine 인스턴스
+        """
+        header, _ = decode_snapshot(buffer)
+        engine = cls(
+            memory_dim=header['memory_dim'],
+            config=CerebellumConfig(**header['config']),
+            memory=memory
+        )
+        engine.restore(buffer)
+        return engine
+    
     def reset(self) -> None:
         """소뇌 엔진 리셋"""
-        self.error_history.clear()
-        self.state_history.clear()
+        self._scalar = None
+        self._error_ring.fill(0.0)
+        self._state_ring.fill(0.0)
+        self._error_sum.fill(0.0)
+        self._ring_index = 0
+        self._ring_count = 0
+        self._kernel_inputs.fill(0.0)
+        self._last_bias_buffer.fill(0.0)
+        self._last_confidence = 0.0
+        self._last_match = None
+        self._iir_state.fill(0.0)
+        self._iir_initialized = False
+        if self.prefetcher is not None:
+            self.prefetcher.clear()
+        self.last_memory_staleness = None
+        self.tick_count = 0
+        self._memory_stale = True
+        self._variance_stale = True
+        if self.estimator is not None:
+            self.estimator.reset()
         self.prev_state = None
         self.prev_velocity = None
         self.filtered_error = None
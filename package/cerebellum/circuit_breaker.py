@@ -0,0 +1,148 @@
+"""
+Circuit Breaker
+해마 메모리 장애 시 기억 검색을 일시 차단하는 회로 차단기
+
+================================================================================
+핵심 개념
+================================================================================
+계속 실패하는 메모리 백엔드를 매 틱 호출하면 예외 발생·전파 비용을 매번
+지불하면서도 결과는 항상 0 벡터입니다. 회로 차단기는 연속 실패를 세어
+임계값에 도달하면 검색을 차단(open)하고, cooldown이 지나면 한 번만 시험
+검색(half-open)을 허용합니다.
+
+   closed ──(연속 실패 ≥ N)──▶ open ──(cooldown 경과)──▶ half_open
+     ▲                                                     │
+     └──────────────(시험 성공)────────────────────────────┤
+                    (시험 실패: cooldown × backoff) ──▶ open
+
+시간 단위는 호출자가 넘기는 now (CerebellumEngine은 tick_count 사용)
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    회로 차단기 (closed / open / half_open)
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: int = 100,
+        backoff_factor: float = 2.0,
+        max_cooldown: int = 10000
+    ):
+        """
+        Args:
+            failure_threshold: 차단까지의 연속 실패 횟수
+            cooldown: 차단 후 시험 검색까지의 기본 대기 시간 (틱)
+            backoff_factor: 시험 검색이 실패할 때마다 cooldown에 곱하는 값
+            max_cooldown: cooldown 상한 (틱)
+        """
+        self.configure(failure_threshold, cooldown, backoff_factor, max_cooldown)
+
+        self.state = self.CLOSED
+        self.current_cooldown = self.cooldown
+        self.opened_at = 0
+
+        # 통계
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.trips = 0  # closed/half_open → open 전환 횟수
+        self.skipped = 0  # 차단 중 건너뛴 호출 수
+        self.last_error: Optional[str] = None
+
+    def configure(
+        self,
+        failure_threshold: int,
+        cooldown: int,
+        backoff_factor: float,
+        max_cooldown: int
+    ) -> None:
+        """파라미터 변경 (현재 상태는 유지)"""
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = max(1, int(cooldown))
+        self.backoff_factor = max(1.0, float(backoff_factor))
+        self.max_cooldown = max(self.cooldown, int(max_cooldown))
+
+    @property
+    def is_open(self) -> bool:
+        """차단 중 여부 (half_open 포함, 메모리 없이 동작 중)"""
+        return self.state != self.CLOSED
+
+    def allow(self, now: int) -> bool:
+        """
+        호출 허용 여부
+
+        open 상태에서 cooldown이 지나면 half_open으로 전환하고 한 번 허용합니다.
+        """
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and now - self.opened_at >= self.current_cooldown:
+            self.state = self.HALF_OPEN
+            return True
+        self.skipped += 1
+        return False
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (half_open이면 closed로 복귀)"""
+        self.total_successes += 1
+        self.consecutive_failures = 0
+        if self.state != self.CLOSED:
+            self.state = self.CLOSED
+            self.current_cooldown = self.cooldown
+
+    def record_failure(self, now: int, error: Optional[BaseException] = None) -> None:
+        """호출 실패 기록 (임계값 도달 또는 시험 실패 시 open)"""
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        if error is not None:
+            self.last_error = repr(error)
+
+        if self.state == self.HALF_OPEN:
+            self.current_cooldown = min(int(self.current_cooldown * self.backoff_factor), self.max_cooldown)
+            self._open(now)
+        elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self.current_cooldown = self.cooldown
+            self._open(now)
+
+    def _open(self, now: int) -> None:
+        self.state = self.OPEN
+        self.opened_at = now
+        self.trips += 1
+
+    def reset(self) -> None:
+        """closed 상태로 초기화 (통계 유지)"""
+        self.state = self.CLOSED
+        self.current_cooldown = self.cooldown
+        self.consecutive_failures = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        차단기 상태와 카운터
+
+        Returns:
+            state, consecutive_failures, total_failures, total_successes,
+            trips, skipped, current_cooldown, last_error
+        """
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'total_failures': self.total_failures,
+            'total_successes': self.total_successes,
+            'trips': self.trips,
+            'skipped': self.skipped,
+            'current_cooldown': self.current_cooldown,
+            'last_error': self.last_error,
+        }
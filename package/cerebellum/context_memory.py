@@ -0,0 +1,378 @@
+"""
+Context Memory
+맥락별로 색인을 나눈 해마 메모리 (분할 검색 + 이웃 분할 대체 + 맥락 일치도)
+
+================================================================================
+핵심 개념
+================================================================================
+retrieve(key, context)는 맥락을 받지만 MockMemory/ArrayMemory는 맥락을 무시하고
+전체를 검색하며, 엔진의 맥락 가중치는 맥락 키 개수(0.5 + len(context)·0.1)로
+근사합니다. ContextMemory는 맥락을 분할 키로 정규화하고 분할마다 별도 메모리를 둡니다.
+
+   분할 키 = ((이름, 값), ...)   partition_keys의 이름만 (None이면 맥락의 모든 키)
+             bands에 있는 숫자 값은 구간 번호 ⌊값 / 폭⌋ (예: 고도 100m 구간)
+   분할 ID  = 처음 본 분할 키 순서대로 0, 1, 2, ... (dict 조회 한 번)
+
+검색:
+   1. 같은 분할에서 검색                           → match = 1.0
+   2. 없고 fallback이면 이웃 분할에서 검색
+      (범주 값은 모두 같고 구간 번호만 ±1씩 다른 분할)  → match = neighbour_score^(다른 구간 수)
+      여러 이웃에서 찾으면 confidence · match가 가장 큰 기억
+   결과: [{'bias': ..., 'confidence': ..., 'match': ...}] 또는 []
+
+CerebellumEngine/BatchCerebellumEngine은 결과에 'match'가 있으면 이를 맥락 가중치로
+사용합니다 (맥락 키 개수 근사 대신).
+
+일괄 검색 retrieve_many(keys, contexts) -> (biases, confidences, matches):
+   행을 분할별로 모아 분할 메모리의 retrieve_many를 한 번씩 호출하고, 미적중 행만
+   이웃 분할을 검색 (행마다 retrieve와 같은 결과, 미적중은 confidence/match nan)
+
+분할 추가·캐시·통계도 인스턴스 잠금 안에서 갱신하므로 여러 스레드가 공유할 수 있습니다.
+
+context_registry(ContextRegistry)를 주면 엔진이 맥락 ID를 그대로 넘기고,
+ID → 분할은 처음 한 번만 계산해 캐시합니다 (틱마다 dict 해싱 없음).
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+import math
+import threading
+import numpy as np
+
+from .array_memory import ArrayMemory, synchronized
+from .context_registry import ContextRegistry, is_context_id
+
+
+PartitionKey = Tuple[Tuple[str, Hashable], ...]
+
+
+class ContextMemory:
+    """
+    맥락 분할 메모리 (retrieve / store 계약은 ArrayMemory와 같고 결과에 'match' 추가)
+    """
+
+    def __init__(
+        self,
+        partition_keys: Optional[Sequence[str]] = None,
+        bands: Optional[Dict[str, float]] = None,
+        fallback: bool = True,
+        neighbour_score: float = 0.5,
+        radius: float = 0.1,
+        memory_factory: Optional[Callable[[], Any]] = None,
+        context_registry: Optional[ContextRegistry] = None
+    ):
+        """
+        Args:
+            partition_keys: 분할에 쓸 맥락 키 (예: ('tool', 'mode')), None이면 맥락의 모든 키
+            bands: 숫자 맥락 값의 구간 폭 (예: {'altitude': 100.0})
+            fallback: 같은 분할에 기억이 없으면 이웃 분할 검색
+            neighbour_score: 구간 하나가 다른 이웃 분할의 일치도 (0, 1)
+            radius: 분할 메모리의 검색 반경 (memory_factory가 없을 때)
+            memory_factory: 분할마다 메모리를 만드는 함수 (기본 ArrayMemory(radius))
+            context_registry: 맥락 ID를 받을 때 쓰는 등록부 (ID의 대표 맥락으로 분할 결정)
+        """
+        for name, width in (bands or {}).items():
+            if width <= 0:
+                raise ValueError(f"bands['{name}']는 0보다 커야 합니다: {width}")
+        self.partition_keys = tuple(partition_keys) if partition_keys is not None else None
+        self.bands = dict(bands or {})
+        self.fallback = fallback
+        self.neighbour_score = neighbour_score
+        self.radius = radius
+        self.memory_factory = memory_factory or (lambda: ArrayMemory(radius=radius))
+        self.context_registry = context_registry
+        self.version = 0  # store/remove마다 증가 (MemoryBiasCache 무효화용)
+
+        self._ids: Dict[PartitionKey, int] = {}  # 분할 키 → 분할 ID
+        self._partitions: List[PartitionKey] = []  # 분할 ID → 분할 키
+        self._memories: List[Any] = []  # 분할 ID → 메모리
+        self._neighbours: Dict[PartitionKey, List[Tuple[int, float]]] = {}  # 분할 추가 시 비움
+        self._by_context_id: Dict[int, Tuple[PartitionKey, Optional[int]]] = {}  # 맥락 ID → (분할 키, 분할 ID)
+        self._lock = threading.RLock()  # 분할 추가·통계 갱신과 검색 직렬화 (ArrayMemory와 같음)
+
+        # 통계
+        self.exact_hits = 0
+        self.fallback_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(len(memory) for memory in self._memories)
+
+    @property
+    def n_partitions(self) -> int:
+        """분할 수"""
+        return len(self._partitions)
+
+    # ------------------------------------------------------------------
+    # 분할 키
+    # ------------------------------------------------------------------
+
+    def partition_key(self, context: Optional[Union[Dict[str, Any], int]]) -> PartitionKey:
+        """
+        맥락 → 분할 키 (구간 값은 구간 번호, 해시 불가능한 값은 repr)
+
+        Args:
+            context: 맥락 정보 또는 context_registry의 맥락 ID
+
+        Returns:
+            ((이름, 값), ...) 튜플
+        """
+        if is_context_id(context):
+            return self._lookup(context)[0]
+        context = context or {}
+        names = self.partition_keys if self.partition_keys is not None else sorted(context)
+        key = []
+        for name in names:
+            value = context.get(name)
+            width = self.bands.get(name)
+            if width is not None and value is not None:
+                value = math.floor(value / width)
+            elif not isinstance(value, Hashable):
+                value = repr(value)
+            key.append((name, value))
+        return tuple(key)
+
+    @synchronized
+    def partition_of(self, context: Optional[Union[Dict[str, Any], int]]) -> int:
+        """
+        맥락의 분할 ID (처음 보는 분할이면 새로 만듦)
+
+        Args:
+            context: 맥락 정보
+
+        Returns:
+            분할 ID
+        """
+        return self._intern(self.partition_key(context))
+
+    @synchronized
+    def memory_for(self, context: Optional[Union[Dict[str, Any], int]]) -> Optional[Any]:
+        """맥락에 해당하는 분할 메모리 (없으면 None)"""
+        partition = self._lookup(context)[1]
+        return self._memories[partition] if partition is not None else None
+
+    def _lookup(self, context: Optional[Union[Dict[str, Any], int]]) -> Tuple[PartitionKey, Optional[int]]:
+        """맥락 → (분할 키, 분할 ID 또는 None) - 맥락 ID는 결과를 캐시"""
+        if not is_context_id(context):
+            key = self.partition_key(context)
+            return key, self._ids.get(key)
+        cached = self._by_context_id.get(context)
+        if cached is None:
+            if self.context_registry is None:
+                raise ValueError("맥락 ID를 쓰려면 ContextMemory에 context_registry를 지정해야 합니다")
+            key = self.partition_key(self.context_registry.context(context))
+            cached = self._by_context_id[context] = (key, self._ids.get(key))
+        return cached
+
+    def _intern(self, key: PartitionKey) -> int:
+        partition = self._ids.get(key)
+        if partition is None:
+            partition = len(self._partitions)
+            self._ids[key] = partition
+            self._partitions.append(key)
+            self._memories.append(self.memory_factory())
+            self._neighbours.clear()
+            self._by_context_id.clear()
+        return partition
+
+    def _neighbours_of(self, key: PartitionKey) -> List[Tuple[int, float]]:
+        """이웃 분할 (ID, 일치도) - 일치도 내림차순, 분할 키별로 캐시"""
+        neighbours = self._neighbours.get(key)
+        if neighbours is None:
+            neighbours = []
+            for partition, other in enumerate(self._partitions):
+                differing = self._band_distance(key, other)
+                if differing:
+                    neighbours.append((partition, self.neighbour_score ** differing))
+            neighbours.sort(key=lambda item: -item[1])
+            self._neighbours[key] = neighbours
+        return neighbours
+
+    def _band_distance(self, key: PartitionKey, other: PartitionKey) -> int:
+        """구간 번호만 ±1씩 다르면 다른 구간 수, 아니면 0 (같은 분할 포함)"""
+        if len(key) != len(other):
+            return 0
+        differing = 0
+        for (name, value), (other_name, other_value) in zip(key, other):
+            if name != other_name:
+                return 0
+            if value == other_value:
+                continue
+            if name in self.bands and value is not None and other_value is not None \
+                    and abs(value - other_value) == 1:
+                differing += 1
+                continue
+            return 0
+        return differing
+
+    # ------------------------------------------------------------------
+    # 저장 / 검색
+    # ------------------------------------------------------------------
+
+    @synchronized
+    def store(
+        self,
+        key: np.ndarray,
+        value: np.ndarray,
+        confidence: float = 0.9,
+        context: Optional[Union[Dict[str, Any], int]] = None
+    ) -> None:
+        """
+        기억 저장 (맥락의 분할에)
+
+        Args:
+            key: 상태 (저장 키)
+            value: bias 값
+            confidence: 신뢰도 [0.0, 1.0]
+            context: 맥락 정보 또는 맥락 ID (분할 결정)
+        """
+        self._memories[self.partition_of(context)].store(key, value, confidence, context)
+        self.version += 1
+
+    @synchronized
+    def remove(self, key: np.ndarray, context: Optional[Union[Dict[str, Any], int]] = None) -> bool:
+        """
+        기억 삭제
+
+        Returns:
+            삭제 여부 (없는 분할/키면 False)
+        """
+        memory = self.memory_for(context)
+        if memory is None or not memory.remove(key):
+            return False
+        self.version += 1
+        return True
+
+    @synchronized
+    def retrieve(
+        self,
+        key: np.ndarray,
+        context: Optional[Union[Dict[str, Any], int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        기억 검색 (같은 분할 → 이웃 분할)
+
+        Args:
+            key: 현재 상태 (검색 키)
+            context: 맥락 정보 또는 맥락 ID
+
+        Returns:
+            memories: [{'bias': ..., 'confidence': ..., 'match': ...}] 또는 []
+        """
+        partition_key, partition = self._lookup(context)
+        if partition is not None:
+            memories = self._memories[partition].retrieve(key, context)
+            if memories:
+                self.exact_hits += 1
+                return [dict(memories[0], match=1.0)]
+        return self._retrieve_neighbour(key, partition_key, context)
+
+    def _retrieve_neighbour(
+        self,
+        key: np.ndarray,
+        partition_key: PartitionKey,
+        context: Optional[Union[Dict[str, Any], int]]
+    ) -> List[Dict[str, Any]]:
+        """같은 분할에 없을 때: 이웃 분할에서 confidence · match가 가장 큰 기억 (통계 갱신)"""
+        if self.fallback:
+            best, best_value = None, 0.0
+            for neighbour, match in self._neighbours_of(partition_key):
+                if best is not None and match <= best_value:
+                    break  # confidence ≤ 1이므로 남은 이웃은 더 나을 수 없음
+                memories = self._memories[neighbour].retrieve(key, context)
+                if memories and (best is None or memories[0]['confidence'] * match > best_value):
+                    best = dict(memories[0], match=match)
+                    best_value = memories[0]['confidence'] * match
+            if best is not None:
+                self.fallback_hits += 1
+                return [best]
+
+        self.misses += 1
+        return []
+
+    @synchronized
+    def retrieve_many(
+        self,
+        keys: np.ndarray,
+        contexts: Optional[Sequence[Optional[Union[Dict[str, Any], int]]]] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        일괄 기억 검색 (분할마다 retrieve_many 한 번, 미적중 행만 이웃 분할 검색)
+
+        Args:
+            keys: 질의 키 (N, D)
+            contexts: 행별 맥락 정보 또는 맥락 ID N개 (None이면 모두 맥락 없음)
+
+        Returns:
+            (biases, confidences, matches): (N, D_b), (N,), (N,) - 미적중 행은 bias 0, nan, nan
+        """
+        keys = np.asarray(keys, dtype=float).reshape(len(keys), -1)
+        n = len(keys)
+        if contexts is None:
+            contexts = [None] * n
+        groups: Dict[Tuple[PartitionKey, Optional[int]], List[int]] = {}
+        for row, context in enumerate(contexts):
+            groups.setdefault(self._lookup(context), []).append(row)
+
+        biases: Optional[np.ndarray] = None
+        confidences = np.full(n, np.nan)
+        matches = np.full(n, np.nan)
+
+        def record(row: int, bias: np.ndarray, confidence: float, match: float) -> None:
+            nonlocal biases
+            if biases is None:
+                biases = np.zeros((n, np.shape(bias)[-1]))
+            biases[row] = bias
+            confidences[row] = confidence
+            matches[row] = match
+
+        for (partition_key, partition), rows in groups.items():
+            memory = self._memories[partition] if partition is not None else None
+            if memory is None or not hasattr(memory, 'retrieve_many'):
+                for row in rows:
+                    memories = self.retrieve(keys[row], contexts[row])
+                    if memories:
+                        record(row, memories[0]['bias'], memories[0]['confidence'], memories[0]['match'])
+                continue
+            group_biases, group_confidences = memory.retrieve_many(keys[rows], [contexts[row] for row in rows])[:2]
+            for i, row in enumerate(rows):
+                if not np.isnan(group_confidences[i]):
+                    self.exact_hits += 1
+                    record(row, group_biases[i], group_confidences[i], 1.0)
+                    continue
+                memories = self._retrieve_neighbour(keys[row], partition_key, contexts[row])
+                if memories:
+                    record(row, memories[0]['bias'], memories[0]['confidence'], memories[0]['match'])
+
+        if biases is None:
+            biases = np.zeros((n, keys.shape[1]))
+        return biases, confidences, matches
+
+    @synchronized
+    def clear(self) -> None:
+        """모든 분할과 기억 삭제"""
+        self._ids.clear()
+        self._partitions.clear()
+        self._memories.clear()
+        self._neighbours.clear()
+        self._by_context_id.clear()
+        self.version += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        분할/검색 통계
+
+        Returns:
+            partitions, entries, exact_hits, fallback_hits, misses
+        """
+        return {
+            'partitions': self.n_partitions,
+            'entries': len(self),
+            'exact_hits': self.exact_hits,
+            'fallback_hits': self.fallback_hits,
+            'misses': self.misses,
+        }
@@ -0,0 +1,204 @@
+"""
+Context Registry
+맥락 dict(또는 양자화된 숫자 맥락 값)을 작은 정수 ID로 한 번만 변환하는 등록부
+
+================================================================================
+핵심 개념
+================================================================================
+예제들은 틱마다 {'altitude': ..., 'airspeed': ..., 'mode': 'autopilot'} 같은 새 dict를
+만들고, 엔진은 그 dict를 다시 훑어 맥락 가중치를 계산합니다. ContextRegistry는 같은
+맥락을 같은 ID로 정규화(intern)하고 가중치를 미리 계산해 둡니다.
+
+   정규 키 = ((이름, 값), ...)  이름순 정렬, quantize에 있는 숫자 값은 ⌊값 / 폭⌋
+   ID      = 처음 본 정규 키 순서대로 1, 2, 3, ...  (0 = 맥락 없음)
+   가중치  = weight(ID)  (엔진의 맥락 키 개수 근사를 등록 시 한 번 계산)
+
+사용:
+   registry = ContextRegistry(fields=('altitude', 'airspeed', 'mode'),
+                              quantize={'altitude': 500.0, 'airspeed': 10.0})
+   engine.set_context_registry(registry)
+   context_id = registry.intern_values(altitude, airspeed, 'autopilot')  # dict 생성 없음
+   engine.compute_correction(state, target, context=context_id)
+
+compute_correction은 dict와 ID를 모두 받습니다. ContextMemory에 같은 등록부를 주면
+ID를 분할 키로 바로 사용합니다 (ID → 분할 조회 한 번).
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+import math
+import numpy as np
+
+
+ContextKey = Tuple[Tuple[str, Hashable], ...]
+
+# 맥락 없음 (None 또는 빈 dict)의 ID
+NO_CONTEXT = 0
+
+
+def is_context_id(context: Any) -> bool:
+    """정수 맥락 ID 여부 (int, NumPy 정수)"""
+    return isinstance(context, (int, np.integer)) and not isinstance(context, bool)
+
+
+def memory_context(
+    context: Union[Dict[str, Any], int, None],
+    registry: Optional['ContextRegistry'],
+    memory: Any
+) -> Any:
+    """
+    메모리 retrieve에 넘길 맥락
+
+    맥락 ID는 같은 등록부를 쓰는 메모리(ContextMemory(context_registry=...))에는
+    그대로, 그 밖의 메모리에는 대표 dict로 넘깁니다.
+    """
+    if is_context_id(context):
+        if registry is None:
+            raise ValueError("정수 맥락 ID를 쓰려면 set_context_registry()로 등록부를 설정해야 합니다")
+        if getattr(memory, 'context_registry', None) is registry:
+            return context
+        return registry.context(context)
+    return context or {}
+
+
+def context_weight(context: Optional[Dict[str, Any]]) -> float:
+    """
+    맥락 키 개수 기반 가중치 근사 (메모리가 맥락 일치도를 주지 않을 때)
+
+    Args:
+        context: 맥락 정보
+
+    Returns:
+        맥락 없으면 0.5, 아니면 min(1.0, 0.5 + 키 개수 · 0.1)
+    """
+    if context is None or len(context) == 0:
+        return 0.5
+    return min(1.0, 0.5 + len(context) * 0.1)
+
+
+class ContextRegistry:
+    """
+    맥락 정규화 등록부 (맥락 → 정수 ID, ID별 대표 맥락과 가중치)
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        quantize: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            fields: intern_values()의 값 순서 (예: ('altitude', 'airspeed', 'mode'))
+            quantize: 숫자 맥락 값의 양자화 폭 (예: {'altitude': 500.0})
+        """
+        for name, width in (quantize or {}).items():
+            if width <= 0:
+                raise ValueError(f"quantize['{name}']는 0보다 커야 합니다: {width}")
+        self.fields = tuple(fields) if fields is not None else None
+        self.quantize = dict(quantize or {})
+
+        self._ids: Dict[ContextKey, int] = {(): NO_CONTEXT}
+        self._keys: List[ContextKey] = [()]
+        self._contexts: List[Dict[str, Any]] = [{}]
+        self._weights: List[float] = [context_weight(None)]
+
+        # intern_values용: 값 튜플 → ID (정규 키를 만들지 않는 빠른 경로)
+        self._value_ids: Dict[Tuple[Hashable, ...], int] = {}
+        if self.fields is not None:
+            self._banded_fields = [(i, self.quantize[name]) for i, name in enumerate(self.fields)
+                                   if name in self.quantize]
+            self._field_order = sorted(range(len(self.fields)), key=lambda i: self.fields[i])
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, context_id: int) -> bool:
+        return 0 <= context_id < len(self._keys)
+
+    def _quantized(self, name: str, value: Any) -> Hashable:
+        width = self.quantize.get(name)
+        if width is not None and value is not None:
+            return math.floor(value / width)
+        if not isinstance(value, Hashable):
+            return repr(value)
+        return value
+
+    def make_key(self, context: Optional[Dict[str, Any]]) -> ContextKey:
+        """맥락 → 정규 키 (이름순, 양자화 적용)"""
+        if not context:
+            return ()
+        return tuple((name, self._quantized(name, context[name])) for name in sorted(context))
+
+    def intern(self, context: Union[Dict[str, Any], int, None]) -> int:
+        """
+        맥락의 ID (처음 보는 맥락이면 등록)
+
+        Args:
+            context: 맥락 dict, None, 또는 이미 등록된 ID
+
+        Returns:
+            정수 ID (0 = 맥락 없음)
+        """
+        if is_context_id(context):
+            if context not in self:
+                raise ValueError(f"등록되지 않은 맥락 ID: {context}")
+            return int(context)
+        key = self.make_key(context)
+        context_id = self._ids.get(key)
+        if context_id is None:
+            context_id = self._register(key, dict(context))
+        return context_id
+
+    def intern_values(self, *values: Any) -> int:
+        """
+        fields 순서의 맥락 값 → ID (틱마다 dict를 만들지 않는 경로)
+
+        Args:
+            values: fields와 같은 순서의 값
+
+        Returns:
+            정수 ID
+        """
+        if self.fields is None:
+            raise ValueError("intern_values()를 쓰려면 fields를 지정해야 합니다")
+        if len(values) != len(self.fields):
+            raise ValueError(f"값 개수({len(values)})가 fields({len(self.fields)})와 다릅니다")
+        quantized = values
+        if self._banded_fields:
+            quantized = list(values)
+            for i, width in self._banded_fields:
+                if quantized[i] is not None:
+                    quantized[i] = math.floor(quantized[i] / width)
+            quantized = tuple(quantized)
+        context_id = self._value_ids.get(quantized)
+        if context_id is None:
+            key = tuple((self.fields[i], self._quantized(self.fields[i], values[i])) for i in self._field_order)
+            context_id = self._ids.get(key)
+            if context_id is None:
+                context_id = self._register(key, dict(zip(self.fields, values)))
+            self._value_ids[quantized] = context_id
+        return context_id
+
+    def _register(self, key: ContextKey, context: Dict[str, Any]) -> int:
+        context_id = len(self._keys)
+        self._ids[key] = context_id
+        self._keys.append(key)
+        self._contexts.append(context)
+        self._weights.append(context_weight(context))
+        return context_id
+
+    def key(self, context_id: int) -> ContextKey:
+        """ID의 정규 키"""
+        return self._keys[context_id]
+
+    def context(self, context_id: int) -> Dict[str, Any]:
+        """ID의 대표 맥락 (처음 등록된 dict, 수정하지 말 것)"""
+        return self._contexts[context_id]
+
+    def weight(self, context_id: int) -> float:
+        """ID의 맥락 가중치 (등록 시 계산)"""
+        return self._weights[context_id]
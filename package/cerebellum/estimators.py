@@ -0,0 +1,328 @@
+"""
+Derivative Estimators
+상태 측정값으로부터 속도/가속도를 추정하는 온라인 추정기 (O(D) 제자리 갱신)
+
+================================================================================
+핵심 개념
+================================================================================
+유한 차분 v = (x(t) - x(t-1)) / Δt, a = (v(t) - v(t-1)) / Δt 는 측정 잡음을
+1/Δt, 1/Δt² 배로 증폭합니다. 추정기는 매 틱 측정값 하나로 갱신되며,
+결과는 추정기가 소유한 버퍼에 제자리 기록됩니다 (틱당 배열 할당 없음).
+
+1. 유한 차분 (finite_difference)
+   v = (x - x_prev) / Δt,  a = (v - v_prev) / Δt
+
+2. Alpha-Beta(-Gamma) 추적 필터 (alpha_beta, alpha_beta_gamma)
+   예측: x̂ = x + v·Δt + ½·a·Δt²,  v̂ = v + a·Δt
+   잔차: r = z - x̂
+   갱신: x = x̂ + α·r,  v = v̂ + (β/Δt)·r,  a = a + (2γ/Δt²)·r
+   (alpha_beta는 γ = 0, a = 0)
+
+3. Savitzky-Golay (savitzky_golay)
+   최근 W개 측정값에 p차 다항식을 최소제곱 적합하고 최신 시점에서 미분
+   v = Σ c1_k · x_k / Δt,  a = Σ c2_k · x_k / Δt²
+   계수 c1, c2는 생성 시 한 번 계산 (균일 Δt 가정), 윈도우가 찰 때까지는 유한 차분
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, Tuple
+import numpy as np
+
+
+# CerebellumConfig.derivative_estimator 값
+DERIVATIVE_ESTIMATORS = ('finite_difference', 'alpha_beta', 'alpha_beta_gamma', 'savitzky_golay')
+
+
+class DerivativeEstimator:
+    """
+    속도/가속도 추정기 기본 클래스
+
+    update(measurement, dt)는 (velocity, acceleration)을 반환하며,
+    두 배열은 추정기 소유 버퍼이므로 다음 update에서 덮어씁니다.
+    """
+
+    def __init__(self, dim: int):
+        """
+        Args:
+            dim: 상태 차원 D
+        """
+        self.dim = dim
+        self.velocity = np.zeros(dim)
+        self.acceleration = np.zeros(dim)
+        self._scratch = np.zeros(dim)
+        self.initialized = False
+
+    def update(self, measurement: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        측정값 하나로 추정값 갱신
+
+        Args:
+            measurement: 현재 상태 측정값 (D,)
+            dt: 시간 간격 (초)
+
+        Returns:
+            (velocity, acceleration) - 추정기 소유 버퍼
+        """
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """추정기 상태 초기화"""
+        self.velocity.fill(0.0)
+        self.acceleration.fill(0.0)
+        self.initialized = False
+
+    def get_state(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """
+        직렬화용 상태 (엔진 snapshot에서 사용)
+
+        Returns:
+            (arrays, scalars) - arrays는 내부 버퍼 자체 (복사 아님)
+        """
+        return (
+            {'velocity': self.velocity, 'acceleration': self.acceleration},
+            {'initialized': self.initialized},
+        )
+
+    def set_state(self, arrays: Dict[str, np.ndarray], scalars: Dict[str, Any]) -> None:
+        """get_state로 얻은 상태 복원 (내부 버퍼에 복사)"""
+        own_arrays, _ = self.get_state()
+        for name, buffer in own_arrays.items():
+            np.copyto(buffer, arrays[name])
+        self.initialized = bool(scalars['initialized'])
+
+
+class FiniteDifferenceEstimator(DerivativeEstimator):
+    """
+    유한 차분 추정기
+
+    첫 속도가 나오는 틱에는 가속도를 0으로 둡니다 (이전 속도 0에서의 스파이크 방지).
+    """
+
+    def __init__(self, dim: int):
+        super().__init__(dim)
+        self._prev_measurement = np.zeros(dim)
+        self._has_velocity = False
+
+    def update(self, measurement: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        velocity, acceleration, scratch = self.velocity, self.acceleration, self._scratch
+        if not self.initialized or dt <= 0:
+            velocity.fill(0.0)
+            acceleration.fill(0.0)
+        else:
+            np.subtract(measurement, self._prev_measurement, out=scratch)
+            np.divide(scratch, dt, out=scratch)
+            if self._has_velocity:
+                np.subtract(scratch, velocity, out=acceleration)
+                np.divide(acceleration, dt, out=acceleration)
+            else:
+                acceleration.fill(0.0)
+            np.copyto(velocity, scratch)
+        self._has_velocity = self.initialized
+        np.copyto(self._prev_measurement, measurement)
+        self.initialized = True
+        return velocity, acceleration
+
+    def reset(self) -> None:
+        super().reset()
+        self._has_velocity = False
+
+    def get_state(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        arrays, scalars = super().get_state()
+        arrays['prev_measurement'] = self._prev_measurement
+        scalars['has_velocity'] = self._has_velocity
+        return arrays, scalars
+
+    def set_state(self, arrays: Dict[str, np.ndarray], scalars: Dict[str, Any]) -> None:
+        super().set_state(arrays, scalars)
+        self._has_velocity = bool(scalars['has_velocity'])
+
+
+class AlphaBetaEstimator(DerivativeEstimator):
+    """
+    Alpha-Beta(-Gamma) 추적 필터
+
+    gamma가 0이면 alpha-beta (등속 모델), 양수면 alpha-beta-gamma (등가속 모델)
+    """
+
+    def __init__(self, dim: int, alpha: float = 0.5, beta: float = 0.1, gamma: float = 0.0):
+        """
+        Args:
+            dim: 상태 차원 D
+            alpha: 위치 갱신 gain (0 < α ≤ 1)
+            beta: 속도 갱신 gain (0 < β ≤ 2)
+            gamma: 가속도 갱신 gain (0이면 가속도 추정 안 함)
+        """
+        super().__init__(dim)
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha는 (0, 1] 범위여야 합니다: {alpha}")
+        if not 0.0 < beta <= 2.0:
+            raise ValueError(f"beta는 (0, 2] 범위여야 합니다: {beta}")
+        if gamma < 0.0:
+            raise ValueError(f"gamma는 0 이상이어야 합니다: {gamma}")
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.position = np.zeros(dim)
+        self._residual = np.zeros(dim)
+
+    def update(self, measurement: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        position, velocity, acceleration = self.position, self.velocity, self.acceleration
+        if not self.initialized:
+            np.copyto(position, measurement)
+            self.initialized = True
+            return velocity, acceleration
+        if dt <= 0:
+            return velocity, acceleration
+
+        scratch, residual = self._scratch, self._residual
+        # 예측: x̂ = x + v·Δt + ½·a·Δt²,  v̂ = v + a·Δt
+        np.multiply(velocity, dt, out=scratch)
+        np.add(position, scratch, out=position)
+        if self.gamma > 0.0:
+            np.multiply(acceleration, 0.5 * dt * dt, out=scratch)
+            np.add(position, scratch, out=position)
+            np.multiply(acceleration, dt, out=scratch)
+            np.add(velocity, scratch, out=velocity)
+
+        # 갱신
+        np.subtract(measurement, position, out=residual)
+        np.multiply(residual, self.alpha, out=scratch)
+        np.add(position, scratch, out=position)
+        np.multiply(residual, self.beta / dt, out=scratch)
+        np.add(velocity, scratch, out=velocity)
+        if self.gamma > 0.0:
+            np.multiply(residual, 2.0 * self.gamma / (dt * dt), out=scratch)
+            np.add(acceleration, scratch, out=acceleration)
+        return velocity, acceleration
+
+    def reset(self) -> None:
+        super().reset()
+        self.position.fill(0.0)
+
+    def get_state(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        arrays, scalars = super().get_state()
+        arrays['position'] = self.position
+        return arrays, scalars
+
+
+def savitzky_golay_coefficients(window: int, order: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    최신 시점에서의 1차/2차 미분 계수
+
+    Args:
+        window: 윈도우 크기 W (가장 오래된 샘플부터)
+        order: 다항식 차수 p (1 ≤ p < W)
+
+    Returns:
+        (c1, c2) - 각각 (W,), Δt = 1 기준
+    """
+    if window < 2 or not 1 <= order < window:
+        raise ValueError(f"1 ≤ order < window 이어야 합니다: window={window}, order={order}")
+    t = np.arange(window, dtype=float) - (window - 1)  # 최신 샘플이 t = 0
+    vandermonde = np.vander(t, order + 1, increasing=True)
+    pinv = np.linalg.pinv(vandermonde)  # 행 j: t^j 계수
+    c1 = pinv[1].copy()
+    c2 = 2.0 * pinv[2] if order >= 2 else np.zeros(window)
+    return c1, c2
+
+
+class SavitzkyGolayEstimator(DerivativeEstimator):
+    """
+    고정 윈도우 Savitzky-Golay 미분 추정기
+
+    측정값은 링 버퍼 (W, D)에 기록하고, 링 위치별로 회전해 둔 계수 행을
+    내적하므로 재정렬 없이 틱당 O(W·D) (W 고정이므로 O(D))
+    """
+
+    def __init__(self, dim: int, window: int = 7, order: int = 2):
+        """
+        Args:
+            dim: 상태 차원 D
+            window: 윈도우 크기 W
+            order: 다항식 차수 p
+        """
+        super().__init__(dim)
+        self.window = window
+        self.order = order
+        c1, c2 = savitzky_golay_coefficients(window, order)
+        # 최신 샘플이 링 인덱스 i에 있을 때의 계수 = 계수를 i+1만큼 회전
+        self._c1 = np.stack([np.roll(c1, i + 1) for i in range(window)])
+        self._c2 = np.stack([np.roll(c2, i + 1) for i in range(window)])
+        self._ring = np.zeros((window, dim))
+        self._index = 0
+        self._count = 0
+        self._fallback = FiniteDifferenceEstimator(dim)
+
+    def update(self, measurement: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        index = self._index
+        np.copyto(self._ring[index], measurement)
+        self._index = (index + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+
+        # 윈도우가 찰 때까지는 유한 차분
+        fallback_velocity, fallback_acceleration = self._fallback.update(measurement, dt)
+        if self._count < self.window or dt <= 0:
+            np.copyto(self.velocity, fallback_velocity)
+            np.copyto(self.acceleration, fallback_acceleration)
+        else:
+            np.dot(self._c1[index], self._ring, out=self.velocity)
+            np.divide(self.velocity, dt, out=self.velocity)
+            np.dot(self._c2[index], self._ring, out=self.acceleration)
+            np.divide(self.acceleration, dt * dt, out=self.acceleration)
+        self.initialized = True
+        return self.velocity, self.acceleration
+
+    def reset(self) -> None:
+        super().reset()
+        self._ring.fill(0.0)
+        self._index = 0
+        self._count = 0
+        self._fallback.reset()
+
+    def get_state(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        arrays, scalars = super().get_state()
+        arrays['ring'] = self._ring
+        scalars['index'] = self._index
+        scalars['count'] = self._count
+        fallback_arrays, fallback_scalars = self._fallback.get_state()
+        arrays.update({'fallback.' + k: v for k, v in fallback_arrays.items()})
+        scalars.update({'fallback.' + k: v for k, v in fallback_scalars.items()})
+        return arrays, scalars
+
+    def set_state(self, arrays: Dict[str, np.ndarray], scalars: Dict[str, Any]) -> None:
+        super().set_state(arrays, scalars)
+        self._index = int(scalars['index'])
+        self._count = int(scalars['count'])
+        prefix = 'fallback.'
+        self._fallback.set_state(
+            {k[len(prefix):]: v for k, v in arrays.items() if k.startswith(prefix)},
+            {k[len(prefix):]: v for k, v in scalars.items() if k.startswith(prefix)},
+        )
+
+
+def create_derivative_estimator(dim: int, config: Any) -> DerivativeEstimator:
+    """
+    CerebellumConfig에 맞는 추정기 생성
+
+    Args:
+        dim: 상태 차원 D
+        config: derivative_estimator, estimator_alpha/beta/gamma,
+                savgol_window/savgol_order 속성을 가진 설정
+
+    Returns:
+        DerivativeEstimator
+    """
+    kind = config.derivative_estimator
+    if kind == 'finite_difference':
+        return FiniteDifferenceEstimator(dim)
+    if kind == 'alpha_beta':
+        return AlphaBetaEstimator(dim, config.estimator_alpha, config.estimator_beta, 0.0)
+    if kind == 'alpha_beta_gamma':
+        return AlphaBetaEstimator(dim, config.estimator_alpha, config.estimator_beta, config.estimator_gamma)
+    if kind == 'savitzky_golay':
+        return SavitzkyGolayEstimator(dim, config.savgol_window, config.savgol_order)
+    raise ValueError(f"derivative_estimator는 {DERIVATIVE_ESTIMATORS} 중 하나여야 합니다: {kind!r}")
@@ -0,0 +1,86 @@
+"""
+Low-pass Filters
+Variance 감소용 저주파 필터 계수 (low_pass_cutoff, dt로부터 계산)
+
+================================================================================
+수식
+================================================================================
+1. 1차 IIR (지수 이동 평균)
+   α = 1 - exp(-2π·f_c·Δt)
+   y(t) = y(t-1) + α·(x(t) - y(t-1))
+
+2. 2차 IIR (Butterworth biquad, 쌍선형 변환 + 주파수 prewarp)
+   K = tan(π·f_c·Δt),  n = 1 / (1 + √2·K + K²)
+   b0 = K²·n,  b1 = 2·b0,  b2 = b0
+   a1 = 2·(K² - 1)·n,  a2 = (1 - √2·K + K²)·n
+   Direct Form II Transposed:
+   y  = b0·x + z1
+   z1 = b1·x - a1·y + z2
+   z2 = b2·x - a2·y
+
+f_c·Δt ≥ 0.5 (Nyquist 이상) 또는 Δt ≤ 0이면 필터를 통과(y = x)시킵니다.
+모든 함수는 스칼라와 배열(배치 엔진의 행별 값)을 모두 받습니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Tuple
+import numpy as np
+
+
+# CerebellumConfig.variance_filter 값
+VARIANCE_FILTERS = ('moving_average', 'iir1', 'iir2')
+
+
+def _passthrough(cutoff, dt):
+    """필터를 통과시켜야 하는 경우 (Δt ≤ 0 또는 Nyquist 이상)"""
+    normalized = np.asarray(cutoff, dtype=float) * np.asarray(dt, dtype=float)
+    return (np.asarray(dt) <= 0) | (normalized >= 0.5) | (np.asarray(cutoff) <= 0)
+
+
+def first_order_alpha(cutoff, dt):
+    """
+    1차 IIR 계수 α
+
+    Args:
+        cutoff: 차단 주파수 (Hz)
+        dt: 시간 간격 (초)
+
+    Returns:
+        α (통과 시 1.0)
+    """
+    normalized = np.maximum(np.asarray(cutoff, dtype=float) * np.asarray(dt, dtype=float), 0.0)
+    alpha = 1.0 - np.exp(-2.0 * np.pi * normalized)
+    alpha = np.where(_passthrough(cutoff, dt), 1.0, alpha)
+    return float(alpha) if alpha.ndim == 0 else alpha
+
+
+def butterworth2_coefficients(cutoff, dt) -> Tuple:
+    """
+    2차 Butterworth 저주파 필터 계수
+
+    Args:
+        cutoff: 차단 주파수 (Hz)
+        dt: 시간 간격 (초)
+
+    Returns:
+        (b0, b1, b2, a1, a2) (통과 시 (1, 0, 0, 0, 0))
+    """
+    passthrough = _passthrough(cutoff, dt)
+    normalized = np.where(passthrough, 0.25, np.asarray(cutoff, dtype=float) * np.asarray(dt, dtype=float))
+    k = np.tan(np.pi * normalized)
+    norm = 1.0 / (1.0 + np.sqrt(2.0) * k + k * k)
+    b0 = k * k * norm
+    coefficients = (
+        np.where(passthrough, 1.0, b0),
+        np.where(passthrough, 0.0, 2.0 * b0),
+        np.where(passthrough, 0.0, b0),
+        np.where(passthrough, 0.0, 2.0 * (k * k - 1.0) * norm),
+        np.where(passthrough, 0.0, (1.0 - np.sqrt(2.0) * k + k * k) * norm),
+    )
+    if np.ndim(coefficients[0]) == 0:
+        return tuple(float(c) for c in coefficients)
+    return coefficients
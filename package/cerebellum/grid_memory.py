@@ -0,0 +1,189 @@
+"""
+Grid Memory
+균일 해시 격자 색인을 사용하는 반경 제한 최근접 이웃 해마 메모리
+
+================================================================================
+핵심 개념
+================================================================================
+검색은 반경(radius, 기본 0.1) 안의 기억만 받아들이므로, 셀 크기 h인 균일 격자에
+키를 해시해 두면 질의가 들어 있는 셀 주변만 보면 됩니다.
+
+   셀 좌표   c = ⌊key / h⌋
+   셀 ID     id(c) = Σ c_i·M^(D-1-i)  (선형 → id(c + o) = id(c) + id(o), dict 키)
+   이웃 범위 r = ⌈radius / h⌉  →  오프셋 (2r+1)^D개 (h = radius이면 3^D)
+
+M = 2^⌊62/D⌋이므로 |c_i| ≥ M/2인 먼 셀끼리는 ID가 겹칠 수 있지만, 후보가 늘어날 뿐
+거리는 정확히 다시 계산하므로 결과는 같습니다.
+
+질의점에서 이웃 셀까지의 최소 거리가 radius 이상인 셀은 미리 걸러내고
+(5차원·h = radius에서 243개 중 보통 수십 개만 남음), 남은 셀들의 행만 모아
+ArrayMemory와 같은 벡터화 거리 계산을 합니다.
+→ 검색 비용은 저장 개수가 아니라 반경 안의 밀도에만 비례
+
+저장 배열·덮어쓰기·삭제·version 의미는 ArrayMemory와 같고,
+셀 색인은 행이 추가/삭제/이동될 때 갱신됩니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Dict, List, Optional, Tuple
+import itertools
+import math
+import numpy as np
+
+from .array_memory import ArrayMemory, synchronized
+
+
+class GridMemory(ArrayMemory):
+    """
+    해시 격자 색인 메모리 (retrieve / store 계약은 ArrayMemory와 동일)
+    """
+
+    def __init__(
+        self,
+        radius: float = 0.1,
+        cell_size: Optional[float] = None,
+        initial_capacity: int = 1024
+    ):
+        """
+        Args:
+            radius: 검색 반경
+            cell_size: 격자 셀 크기 (None이면 radius)
+            initial_capacity: 초기 배열 행 수
+        """
+        super().__init__(radius=radius, initial_capacity=initial_capacity)
+        self.cell_size = float(cell_size) if cell_size is not None else float(radius)
+        if self.cell_size <= 0:
+            raise ValueError(f"cell_size는 0보다 커야 합니다: {self.cell_size}")
+        self.reach = max(1, math.ceil(radius / self.cell_size))  # 이웃 셀 범위 r
+
+        self._cells: Dict[int, List[int]] = {}  # 셀 ID → 행 목록
+        self._cell_weights: Optional[np.ndarray] = None  # (D,) M^(D-1-i), 첫 store에서 차원 결정
+
+    @property
+    def n_cells(self) -> int:
+        """비어 있지 않은 셀 수"""
+        return len(self._cells)
+
+    def _allocate(self, key: np.ndarray, value: np.ndarray) -> None:
+        super()._allocate(key, value)
+        # 이웃 오프셋 ID (itertools.product 순서: 첫 축이 가장 느리게 변함)
+        reach = self.reach
+        dim = key.shape[0]
+        base = 1 << (62 // dim)
+        self._cell_weights = np.array([base ** (dim - 1 - i) for i in range(dim)], dtype=np.int64)
+        offsets = np.array(list(itertools.product(range(-reach, reach + 1), repeat=dim)), dtype=np.int64)
+        self._offset_ids = offsets @ self._cell_weights
+        # 축별 오프셋 o의 셀까지 최소 거리:
+        #   o < 0: (-o - 1)·h + (질의점 - 셀 하한)
+        #   o > 0: ( o - 1)·h + (셀 상한 - 질의점)
+        steps = np.arange(-reach, reach + 1)
+        self._whole_steps = np.maximum(np.abs(steps) - 1, 0) * self.cell_size
+        self._below = (steps < 0).astype(float)
+        self._above = (steps > 0).astype(float)
+
+    def _cell_of(self, key: np.ndarray) -> int:
+        return int(np.floor(key / self.cell_size).astype(np.int64) @ self._cell_weights)
+
+    def _on_insert(self, row: int) -> None:
+        self._cells.setdefault(self._cell_of(self._keys[row]), []).append(row)
+
+    def _on_remove(self, row: int) -> None:
+        cell = self._cell_of(self._keys[row])
+        rows = self._cells[cell]
+        rows.remove(row)
+        if not rows:
+            del self._cells[cell]
+
+    def _on_move(self, old_row: int, new_row: int) -> None:
+        rows = self._cells[self._cell_of(self._keys[new_row])]
+        rows[rows.index(old_row)] = new_row
+
+    @synchronized
+    def candidate_rows(self, key: np.ndarray) -> List[int]:
+        """
+        반경 안에 들 수 있는 행 (질의점에서 radius 미만 거리의 셀에 든 행)
+
+        Args:
+            key: 질의 키
+
+        Returns:
+            행 번호 목록
+        """
+        if self.size == 0:
+            return []
+        scaled = key / self.cell_size
+        base = np.floor(scaled)
+        low_gap = (scaled - base) * self.cell_size  # 셀 하한까지
+        high_gap = self.cell_size - low_gap  # 셀 상한까지
+        # 축별 거리 제곱 (D, 2r+1) → 오프셋별 합 ((2r+1)^D,)
+        gaps = self._whole_steps + np.multiply.outer(low_gap, self._below) + np.multiply.outer(high_gap, self._above)
+        gaps *= gaps
+        squared = gaps[0]
+        for axis_gaps in gaps[1:]:
+            squared = np.add.outer(squared, axis_gaps).ravel()
+        reachable = np.flatnonzero(squared < self.radius * self.radius)
+
+        base_id = base.astype(np.int64) @ self._cell_weights
+        cell_ids = (self._offset_ids[reachable] + base_id).tolist()
+        # 셀 조회는 map(dict.get)으로 C 루프에서 (빈 셀은 None → 건너뜀)
+        return list(itertools.chain.from_iterable(filter(None, map(self._cells.get, cell_ids))))
+
+    @synchronized
+    def nearest(self, key: np.ndarray) -> Tuple[int, float]:
+        """
+        반경 안의 최근접 항목
+
+        Returns:
+            (행 번호, 거리) - 반경 안에 없으면 (-1, inf)
+        """
+        key = np.asarray(key, dtype=float)
+        rows = self.candidate_rows(key)
+        if not rows:
+            return -1, float('inf')
+        rows.sort()  # 거리가 같으면 먼저 저장된 행 (ArrayMemory와 동일)
+        n = len(rows)
+        diff, distances = self._scratch(n)
+        np.subtract(self._keys[rows], key, out=diff)
+        np.einsum('ij,ij->i', diff, diff, out=distances)
+        best = int(distances.argmin())
+        return rows[best], float(np.sqrt(distances[best]))
+
+    @synchronized
+    def nearest_many(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 키의 반경 안 최근접 항목
+
+        후보 행은 키마다 셀 색인에서 모으고, 거리는 전체 후보를 이어 붙여 한 번에 계산합니다.
+
+        Returns:
+            (행 번호 (N,), 거리 (N,)) - 반경 안에 없으면 -1, inf
+        """
+        n_keys = len(keys)
+        rows = np.full(n_keys, -1)
+        distances = np.full(n_keys, np.inf)
+        candidates = [self.candidate_rows(key) for key in keys]
+        counts = np.array([len(c) for c in candidates], dtype=np.int64)
+        queried = np.flatnonzero(counts)
+        if len(queried) == 0:
+            return rows, distances
+        flat_rows = np.fromiter(itertools.chain.from_iterable(candidates), dtype=np.int64, count=int(counts.sum()))
+        owners = np.repeat(np.arange(n_keys), counts)
+        diff = self._keys[flat_rows] - keys[owners]
+        squared = np.einsum('ij,ij->i', diff, diff)
+        # 키별 구간 [starts, starts + counts)의 최솟값, 같은 거리면 작은 행 (nearest와 동일)
+        starts = (np.cumsum(counts) - counts)[queried]
+        best = np.minimum.reduceat(squared, starts)
+        tied_rows = np.where(squared == np.repeat(best, counts[queried]), flat_rows, np.iinfo(np.int64).max)
+        rows[queried] = np.minimum.reduceat(tied_rows, starts)
+        distances[queried] = np.sqrt(best)
+        return rows, distances
+
+    @synchronized
+    def clear(self) -> None:
+        """모든 기억 삭제 (배열 용량은 유지)"""
+        super().clear()
+        self._cells.clear()
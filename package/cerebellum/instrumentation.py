@@ -0,0 +1,161 @@
+"""
+Cerebellum Instrumentation
+소뇌 엔진 단계별 지연 시간 계측 (opt-in)
+
+================================================================================
+핵심 개념
+================================================================================
+compute_correction 한 틱의 시간이 어느 단계에서 쓰이는지 측정합니다.
+- 단계별 고정 크기 로그 히스토그램 (log2 옥타브당 4개 구간, 상대 오차 ≤ 25%)
+- 기록은 O(1), 배열 할당 없음
+- snapshot()은 제어 루프를 멈추지 않고 현재 카운트를 복사해 p50/p99/max 계산
+
+비활성 상태(engine.profiler is None)에서는 단계마다 None 검사 한 번만 추가됩니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Dict, Optional, Sequence
+import time
+
+
+# compute_correction 단계 이름 (v0.7 융합 커널 기준)
+STAGES = (
+    'history',      # 오차/상태 링 버퍼 기록
+    'derivatives',  # 속도/가속도 추정
+    'memory',       # 해마 기억 검색 (_get_memory_bias)
+    'variance',     # 저주파 필터 (Variance 감소)
+    'kernel',       # 융합 커널 (Feedforward + Trial + Variance + Memory)
+    'saturation',   # 포화 제한 (_saturate_correction)
+    'total',        # 틱 전체
+)
+
+
+class LatencyHistogram:
+    """
+    고정 크기 로그 히스토그램 (나노초 단위)
+
+    구간 인덱스 = 4·⌊log2(ns)⌋ + (상위 2비트 다음 비트), 최대 2^40 ns (약 18분)
+    """
+
+    SUB_BUCKETS = 4
+    MAX_OCTAVE = 40
+
+    def __init__(self):
+        self.counts = [0] * (self.SUB_BUCKETS * (self.MAX_OCTAVE + 1))
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int) -> None:
+        """지연 시간 기록"""
+        if ns < 0:
+            ns = 0
+        octave = ns.bit_length() - 1
+        if octave < 2:
+            index = max(ns, 0)
+        elif octave > self.MAX_OCTAVE:
+            index = len(self.counts) - 1
+        else:
+            index = octave * self.SUB_BUCKETS + ((ns >> (octave - 2)) & 3)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    @classmethod
+    def bucket_upper_ns(cls, index: int) -> int:
+        """구간의 상한 (나노초)"""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index
+        octave, sub = divmod(index, cls.SUB_BUCKETS)
+        return ((4 + sub + 1) << (octave - 2)) - 1
+
+    @classmethod
+    def percentile_from_counts(cls, counts: Sequence[int], total: int, q: float) -> int:
+        """카운트 배열에서 백분위수 (구간 상한, 나노초)"""
+        if total == 0:
+            return 0
+        rank = max(1, int(round(q / 100.0 * total)))
+        cumulative = 0
+        for index, c in enumerate(counts):
+            cumulative += c
+            if cumulative >= rank:
+                return cls.bucket_upper_ns(index)
+        return cls.bucket_upper_ns(len(counts) - 1)
+
+    def percentile(self, q: float) -> int:
+        """백분위수 (나노초, 최댓값을 넘지 않도록 제한)"""
+        return min(self.percentile_from_counts(self.counts, self.count, q), self.max_ns)
+
+    def reset(self) -> None:
+        """히스토그램 초기화"""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+
+class StageProfiler:
+    """
+    단계별 지연 시간 계측기
+
+    사용 예:
+        profiler = engine.enable_profiling()
+        ...
+        stats = profiler.snapshot()
+        stats['memory']['p99_us']
+    """
+
+    def __init__(self, stages: Sequence[str] = STAGES):
+        """
+        Args:
+            stages: 계측할 단계 이름
+        """
+        self.histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in stages}
+        self.clock = time.perf_counter_ns
+
+    def record(self, stage: str, ns: int) -> None:
+        """단계 지연 시간 기록"""
+        self.histograms[stage].record(ns)
+
+    def lap(self, stage: str, start_ns: int) -> int:
+        """start_ns부터 지금까지를 stage에 기록하고 현재 시각 반환"""
+        now = self.clock()
+        self.histograms[stage].record(now - start_ns)
+        return now
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        현재 통계 스냅샷 (제어 루프를 멈추지 않음)
+
+        카운트 리스트를 먼저 복사한 뒤 계산하므로 기록 중에 호출해도 안전합니다.
+
+        Returns:
+            {stage: {'count', 'mean_us', 'p50_us', 'p99_us', 'max_us'}}
+        """
+        result = {}
+        for stage, histogram in self.histograms.items():
+            counts = list(histogram.counts)
+            total = sum(counts)
+            total_ns = histogram.total_ns
+            max_ns = histogram.max_ns
+            result[stage] = {
+                'count': total,
+                'mean_us': (total_ns / total / 1000.0) if total else 0.0,
+                'p50_us': min(LatencyHistogram.percentile_from_counts(counts, total, 50.0), max_ns) / 1000.0,
+                'p99_us': min(LatencyHistogram.percentile_from_counts(counts, total, 99.0), max_ns) / 1000.0,
+                'max_us': max_ns / 1000.0,
+            }
+        return result
+
+    def reset(self, stage: Optional[str] = None) -> None:
+        """통계 초기화 (stage가 None이면 전체)"""
+        stages = self.histograms if stage is None else [stage]
+        for name in stages:
+            self.histograms[name].reset()
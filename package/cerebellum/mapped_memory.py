@@ -0,0 +1,408 @@
+"""
+Mapped Memory
+메모리 맵 파일에 저장되는 해마 메모리 (대용량 학습 맵의 즉시 로드)
+
+================================================================================
+핵심 개념
+================================================================================
+학습이 끝난 보정 맵은 수백만 개의 (상태, bias, confidence) 항목이 될 수 있고,
+시작할 때마다 store()로 다시 채우면 수 분이 걸립니다. MappedMemory는 배열을
+파일에 두고 np.memmap으로 엽니다.
+
+- 열기: 헤더만 읽고 배열은 파일에 대한 뷰 (복사 없음, 페이지는 검색 시 OS가 읽음)
+- 같은 키 덮어쓰기용 색인(_rows)도 첫 store/remove 때 만듦 (검색만 하면 만들지 않음)
+- 확장: 파일 끝에 행을 덧붙이고 다시 매핑 (기존 바이트는 그대로)
+
+================================================================================
+형식 (리틀 엔디언)
+================================================================================
+   offset  크기   내용
+   0       4      매직 b'CBMM'
+   4       2      형식 버전 (uint16)
+   6       2      예약 (0)
+   8       4      키 차원 D (uint32)
+   12      4      bias 차원 D_b (uint32)
+   16      8      용량 (파일에 할당된 행 수, uint64)
+   24      8      확정된 행 수 size (uint64)
+   32      8      세대 번호 (uint64, 기록 중에는 홀수)
+   40      8      검색 반경 (float64)
+   48      16     예약 (0)
+   64      ...    행 레코드 (용량 × (D + D_b + 1)개 float64): [키 | bias | confidence]
+
+행을 레코드 하나로 이어 붙였기 때문에 용량을 늘려도 기존 행이 옮겨지지 않습니다
+(keys/biases/confidences는 레코드 배열의 열 뷰).
+
+================================================================================
+다른 프로세스의 읽기 (쓰기 프로세스는 하나)
+================================================================================
+   쓰기:  세대 += 1 (홀수) → (용량 확장) → 행 기록 → size 기록 → 세대 += 1 (짝수)
+   읽기:  refresh()는 세대가 짝수이고 용량/size를 읽는 동안 바뀌지 않았을 때만 반영,
+          snapshot()은 세대가 짝수이고 복사 전후로 같을 때까지 다시 시도하여
+          일관된 복사본을 반환
+
+새 항목은 확정된 size 뒤에 쓰이므로 덧붙이기만 하는 동안에는 읽기 쪽의 복사 없는
+검색도 항상 일관됩니다. 덮어쓰기/삭제처럼 확정된 행을 바꾸는 쓰기와 동시에 읽어야
+하면 snapshot()을 사용합니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import os
+import struct
+import time
+import numpy as np
+
+from .array_memory import ArrayMemory, synchronized
+
+
+MAPPED_MEMORY_MAGIC = b'CBMM'
+MAPPED_MEMORY_VERSION = 1
+
+_HEADER = struct.Struct('<4sHHIIQQQd16x')
+_HEADER_SIZE = _HEADER.size  # 64
+_CAPACITY_OFFSET = 16
+_SIZE_OFFSET = 24
+_GENERATION_OFFSET = 32
+_U64 = struct.Struct('<Q')
+_DTYPE = np.dtype('<f8')
+
+
+class MappedMemory(ArrayMemory):
+    """
+    메모리 맵 파일 기반 메모리 (retrieve / store 계약은 ArrayMemory와 동일)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        radius: Optional[float] = None,
+        readonly: bool = False,
+        initial_capacity: int = 1024
+    ):
+        """
+        Args:
+            path: 저장 파일 경로 (없으면 첫 store에서 생성)
+            radius: 검색 반경 (None이면 파일 헤더 값, 새 파일은 0.1)
+            readonly: True면 읽기 전용으로 열기 (다른 프로세스의 읽기용)
+            initial_capacity: 새 파일의 초기 행 수 (가득 차면 두 배로 확장)
+        """
+        super().__init__(radius=0.1 if radius is None else radius, initial_capacity=initial_capacity)
+        self.path = path
+        self.readonly = readonly
+        self._map: Optional[np.memmap] = None
+        self._records: Optional[np.ndarray] = None
+        self._generation = 0
+        self._closed = False
+
+        if os.path.exists(path):
+            self._open()
+            if radius is None:
+                self.radius = self._header_radius
+        elif readonly:
+            raise FileNotFoundError(f"메모리 파일이 없습니다: {path}")
+
+    # ------------------------------------------------------------------
+    # 파일 매핑
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        """헤더 검증 후 레코드 배열 매핑 (배열 데이터는 읽지 않음)"""
+        with open(self.path, 'rb') as f:
+            preamble = f.read(_HEADER_SIZE)
+        if len(preamble) < _HEADER_SIZE:
+            raise ValueError("메모리 파일 헤더가 잘렸습니다")
+        magic, version, _, key_dim, bias_dim, capacity, size, generation, radius = _HEADER.unpack(preamble)
+        if magic != MAPPED_MEMORY_MAGIC:
+            raise ValueError("소뇌 메모리 파일이 아닙니다")
+        if version != MAPPED_MEMORY_VERSION:
+            raise ValueError(f"지원하지 않는 메모리 파일 버전: {version} (지원: {MAPPED_MEMORY_VERSION})")
+        expected = _HEADER_SIZE + capacity * (key_dim + bias_dim + 1) * _DTYPE.itemsize
+        if os.path.getsize(self.path) < expected or size > capacity:
+            raise ValueError("메모리 파일 길이가 헤더와 다릅니다")
+
+        self._header_radius = radius
+        self._map_records(key_dim, bias_dim, capacity)
+        self.size = size
+        self._generation = generation
+        self._rows = None  # 첫 store/remove에서 생성
+
+    def _map_records(self, key_dim: int, bias_dim: int, capacity: int) -> None:
+        """파일을 다시 매핑하고 키/bias/confidence 열 뷰 설정"""
+        width = key_dim + bias_dim + 1
+        self._map = np.memmap(
+            self.path,
+            dtype=np.uint8,
+            mode='r' if self.readonly else 'r+',
+            shape=(_HEADER_SIZE + capacity * width * _DTYPE.itemsize,)
+        )
+        # memmap 하위 클래스가 아닌 일반 ndarray 뷰 (검색 결과가 memmap으로 새지 않도록)
+        records = self._map[_HEADER_SIZE:].view(_DTYPE).view(np.ndarray).reshape(capacity, width)
+        self._records = records
+        self._keys = records[:, :key_dim]
+        self._biases = records[:, key_dim:key_dim + bias_dim]
+        self._confidences = records[:, -1]
+
+    def _map_for_write(self, key: np.ndarray, value: np.ndarray) -> None:
+        """첫 쓰기: 파일이 있으면 매핑 (다른 프로세스가 그 사이에 만든 경우), 없을 때만 생성"""
+        if not os.path.exists(self.path):
+            self._allocate(key, value)
+            return
+        self._open()
+        if self._keys.shape[1] != key.shape[0] or self._biases.shape[1] != value.shape[0]:
+            raise ValueError(
+                f"메모리 파일 차원({self._keys.shape[1]}, {self._biases.shape[1]})과 "
+                f"저장하려는 차원({key.shape[0]}, {value.shape[0]})이 다릅니다"
+            )
+
+    def _allocate(self, key: np.ndarray, value: np.ndarray) -> None:
+        """첫 store: 헤더와 빈 레코드로 파일 생성 (파일이 없을 때만 호출)"""
+        capacity = self.initial_capacity
+        key_dim, bias_dim = key.shape[0], value.shape[0]
+        with open(self.path, 'wb') as f:
+            f.write(_HEADER.pack(
+                MAPPED_MEMORY_MAGIC, MAPPED_MEMORY_VERSION, 0,
+                key_dim, bias_dim, capacity, 0, 0, float(self.radius)
+            ))
+            f.truncate(_HEADER_SIZE + capacity * (key_dim + bias_dim + 1) * _DTYPE.itemsize)
+        self._map_records(key_dim, bias_dim, capacity)
+        self._rows = {}
+
+    def _grow(self) -> None:
+        """파일 끝에 행 추가 후 다시 매핑 (기존 행은 이동하지 않음)"""
+        capacity = self._next_capacity()
+        key_dim, bias_dim = self._keys.shape[1], self._biases.shape[1]
+        self._map.flush()
+        with open(self.path, 'r+b') as f:
+            f.truncate(_HEADER_SIZE + capacity * (key_dim + bias_dim + 1) * _DTYPE.itemsize)
+        _U64.pack_into(self._map, _CAPACITY_OFFSET, capacity)
+        self._map_records(key_dim, bias_dim, capacity)
+
+    @property
+    def _rows(self) -> Dict[Tuple[float, ...], int]:
+        """키 → 행 색인 (파일에서 연 경우 처음 필요할 때 생성)"""
+        if self._row_index is None:
+            self._row_index = {
+                tuple(key): row for row, key in enumerate(self._keys[:self.size].tolist())
+            }
+        return self._row_index
+
+    @_rows.setter
+    def _rows(self, rows: Optional[Dict[Tuple[float, ...], int]]) -> None:
+        self._row_index = rows
+
+    # ------------------------------------------------------------------
+    # 헤더 세대 번호 (seqlock)
+    # ------------------------------------------------------------------
+
+    def _read_u64(self, offset: int) -> int:
+        return _U64.unpack_from(self._map, offset)[0]
+
+    def _begin_write(self) -> None:
+        self._generation += 1
+        _U64.pack_into(self._map, _GENERATION_OFFSET, self._generation)
+
+    def _end_write(self) -> None:
+        _U64.pack_into(self._map, _SIZE_OFFSET, self.size)
+        self._generation += 1
+        _U64.pack_into(self._map, _GENERATION_OFFSET, self._generation)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError(f"닫힌 메모리입니다 (다시 쓰려면 새로 여세요): {self.path}")
+
+    def _check_writable(self) -> None:
+        self._check_open()
+        if self.readonly:
+            raise ValueError(f"읽기 전용으로 연 메모리입니다: {self.path}")
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    @synchronized
+    def store(
+        self,
+        key: np.ndarray,
+        value: np.ndarray,
+        confidence: float = 0.9,
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        기억 저장 (같은 키가 있으면 덮어쓰기, 없으면 파일 끝에 덧붙임)
+
+        Args:
+            key: 상태 (저장 키)
+            value: bias 값
+            confidence: 신뢰도 [0.0, 1.0]
+            context: 맥락 정보 (사용하지 않음)
+        """
+        self._check_writable()
+        key = np.asarray(key, dtype=float).ravel()
+        value = np.asarray(value, dtype=float).ravel()
+        if self._keys is None:
+            self._map_for_write(key, value)
+        self._begin_write()
+        try:
+            super().store(key, value, confidence, context)
+        finally:
+            self._end_write()
+
+    @synchronized
+    def extend(self, keys: np.ndarray, values: np.ndarray, confidences: Any = 0.9) -> None:
+        """
+        여러 기억을 한 번에 저장 (새 키는 파일 끝에 이어서 기록, 확정은 한 번)
+
+        Args:
+            keys: 상태 (N, D)
+            values: bias (N, D_b)
+            confidences: 신뢰도 (N,) 또는 스칼라
+        """
+        self._check_writable()
+        keys = np.asarray(keys, dtype=float).reshape(len(keys), -1)
+        values = np.asarray(values, dtype=float).reshape(len(keys), -1)
+        confidences = np.broadcast_to(np.asarray(confidences, dtype=float), (len(keys),))
+        if len(keys) == 0:
+            return
+        if self._keys is None:
+            self._map_for_write(keys[0], values[0])
+
+        index = self._rows
+        rows = np.empty(len(keys), dtype=np.int64)
+        size = self.size
+        for i, row_key in enumerate(map(tuple, keys.tolist())):
+            row = index.get(row_key)
+            if row is None:
+                row = index[row_key] = size
+                size += 1
+            rows[i] = row
+
+        self._begin_write()
+        try:
+            while self.capacity < size:
+                self._grow()  # 용량 헤더 변경도 기록 구간 안에서
+            self._keys[rows] = keys
+            self._biases[rows] = values
+            self._confidences[rows] = confidences
+            self.size = size
+            self.version += 1
+        finally:
+            self._end_write()
+
+    @synchronized
+    def remove(self, key: np.ndarray) -> bool:
+        """기억 삭제 (마지막 행을 빈 자리로 이동)"""
+        self._check_writable()
+        if self._keys is None:
+            return False
+        self._begin_write()
+        try:
+            return super().remove(key)
+        finally:
+            self._end_write()
+
+    @synchronized
+    def clear(self) -> None:
+        """모든 기억 삭제 (파일 용량은 유지)"""
+        self._check_writable()
+        if self._keys is None:
+            return
+        self._begin_write()
+        try:
+            super().clear()
+        finally:
+            self._end_write()
+
+    @synchronized
+    def flush(self) -> None:
+        """변경 내용을 디스크에 기록"""
+        if self._map is not None and not self.readonly:
+            self._map.flush()
+
+    @synchronized
+    def close(self) -> None:
+        """디스크에 기록 후 매핑 해제 (이후 쓰기/refresh는 ValueError, 파일은 그대로)"""
+        self.flush()
+        self._closed = True
+        self._map = None
+        self._records = None
+        self._keys = self._biases = None
+        self._confidences = np.empty(0)
+        self._rows = {}
+        self.size = 0
+
+    def __enter__(self) -> 'MappedMemory':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # 다른 프로세스의 쓰기 반영
+    # ------------------------------------------------------------------
+
+    @property
+    def generation(self) -> int:
+        """파일 헤더의 세대 번호 (쓰기 중이면 홀수)"""
+        return self._read_u64(_GENERATION_OFFSET) if self._map is not None else 0
+
+    @synchronized
+    def refresh(self) -> bool:
+        """
+        다른 프로세스가 확정한 행 반영 (파일이 커졌으면 다시 매핑)
+
+        Returns:
+            변경 여부 (변경되었으면 version 증가 → MemoryBiasCache 무효화)
+        """
+        self._check_open()
+        if self._map is None:
+            if not os.path.exists(self.path):
+                return False
+            self._open()
+            self.version += 1
+            return True
+        generation = self.generation
+        if generation == self._generation or generation % 2:
+            return False  # 변경 없음 또는 기록 중 (다음 refresh에서 반영)
+        capacity = self._read_u64(_CAPACITY_OFFSET)
+        size = self._read_u64(_SIZE_OFFSET)
+        if self.generation != generation or size > capacity:
+            return False  # 읽는 도중 기록이 시작됨
+        if capacity != self.capacity:
+            self._map_records(self._keys.shape[1], self._biases.shape[1], capacity)
+        self.size = size
+        self._generation = generation
+        self._rows = None
+        self.version += 1
+        return True
+
+    @synchronized
+    def snapshot(self, timeout: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        일관된 복사본 (쓰기 프로세스의 기록 중간 상태를 보지 않음)
+
+        Args:
+            timeout: 기록이 끝나기를 기다릴 최대 시간 (초)
+
+        Returns:
+            (keys, biases, confidences) 복사본: (size, D), (size, D_b), (size,)
+        """
+        deadline = time.perf_counter() + timeout
+        while True:
+            self.refresh()
+            before = self.generation
+            if before % 2 == 0:
+                n = self._read_u64(_SIZE_OFFSET) if self._map is not None else 0
+                if n <= self.capacity:
+                    records = np.array(self._records[:n]) if n else None
+                    if self.generation == before:
+                        if records is None:
+                            return np.empty((0, 0)), np.empty((0, 0)), np.empty(0)
+                        key_dim = self._keys.shape[1]
+                        return records[:, :key_dim], records[:, key_dim:-1], records[:, -1]
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"메모리 파일 기록이 끝나지 않았습니다: {self.path}")
+            time.sleep(0.0001)
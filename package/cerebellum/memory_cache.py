@@ -0,0 +1,136 @@
+"""
+Memory Bias Cache
+양자화된 상태 + 맥락 지문을 키로 하는 해마 기억 검색 LRU 캐시
+
+================================================================================
+핵심 개념
+================================================================================
+반복 궤적(벤치마크의 n_repeats, 호버링 시행)은 거의 같은 상태로 retrieve를
+반복 호출합니다. 상태를 resolution 격자로 양자화한 키가 같으면 최근접 이웃
+검색을 건너뛰고 이전 결과(bias, confidence)를 재사용합니다.
+
+   key = (⌊x / resolution⌋, context_fingerprint)
+
+- LRU 제거, 최대 항목 수 제한
+- 메모리에 기록이 생기면 전체 무효화
+  (메모리의 version 속성이 바뀌면 자동, 아니면 invalidate() 호출)
+- 적중률 카운터
+
+주의: 같은 격자 칸 안의 상태들은 같은 기억을 공유하므로 resolution은
+메모리 검색 반경보다 충분히 작게 잡아야 합니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+from collections import OrderedDict
+import numpy as np
+
+from .context_registry import is_context_id
+
+
+def context_fingerprint(context: Optional[Dict[str, Any]]) -> Hashable:
+    """
+    맥락 지문 (키 순서와 무관)
+
+    값이 해시 불가능하면 repr로 대체합니다. ContextRegistry 맥락 ID는 그대로 사용합니다.
+    """
+    if is_context_id(context):
+        return int(context)
+    if not context:
+        return ()
+    try:
+        return tuple(sorted(context.items()))
+    except TypeError:
+        return tuple(sorted((k, repr(v)) for k, v in context.items()))
+
+
+class MemoryBiasCache:
+    """
+    양자화 상태 LRU 캐시
+
+    CerebellumEngine._get_memory_bias 앞단에서 (bias, confidence, match)를 캐시합니다.
+    """
+
+    def __init__(
+        self,
+        resolution: Union[float, np.ndarray] = 1e-3,
+        max_entries: int = 4096
+    ):
+        """
+        Args:
+            resolution: 양자화 격자 크기 (스칼라 또는 차원별 배열)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+        """
+        self.resolution = resolution
+        self._inverse_resolution = 1.0 / np.asarray(resolution, dtype=float)
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Tuple[np.ndarray, float, Optional[float]]]' = OrderedDict()
+        self._memory_version: Any = None
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def make_key(self, state: np.ndarray, context: Optional[Dict[str, Any]]) -> Hashable:
+        """양자화 상태 + 맥락 지문 키"""
+        cell = np.floor(np.multiply(state, self._inverse_resolution)).astype(np.int64)
+        return cell.tobytes(), context_fingerprint(context)
+
+    def get(self, key: Hashable) -> Optional[Tuple[np.ndarray, float, Optional[float]]]:
+        """캐시 조회 (적중 시 최근 사용으로 갱신)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, bias: np.ndarray, confidence: float, match: Optional[float] = None) -> None:
+        """캐시 저장 (bias는 복사되어 읽기 전용으로 보관, match는 맥락 일치도)"""
+        stored = np.array(bias, dtype=float)
+        stored.flags.writeable = False
+        self._entries[key] = (stored, confidence, match)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def sync(self, memory: Any) -> None:
+        """메모리의 version이 바뀌었으면 무효화 (version 속성이 없으면 무시)"""
+        version = getattr(memory, 'version', None)
+        if version != self._memory_version:
+            self._memory_version = version
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """전체 무효화 (메모리에 새 기억이 기록된 경우)"""
+        if self._entries:
+            self._entries.clear()
+        self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            entries, hits, misses, hit_rate, evictions, invalidations
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
@@ -0,0 +1,81 @@
+"""
+Memory Results
+해마 메모리 검색 결과 해석 (CerebellumEngine / BatchCerebellumEngine 공통)
+
+================================================================================
+핵심 개념
+================================================================================
+retrieve(key, context)  → [{'bias': b, 'confidence': c, ('match': m)}] 또는 []
+retrieve_many(keys, contexts) → (biases (N, D_b), confidences (N,)[, matches (N,)])
+   적중 여부는 confidence가 nan이 아닌 것으로 표시합니다 (confidence 0도 적중).
+   matches는 맥락 일치도를 주는 메모리(ContextMemory)만 반환 (없는 행은 nan)
+
+단계별 검색과 일괄 검색이 같은 보정을 내도록 두 경로 모두 여기서 해석합니다.
+   적중:   confidence → [min_confidence, 1.0]로 클리핑, match → [0, 1]
+   미적중: bias 0, confidence 0.0, match 없음 (맥락 키 개수 근사 사용)
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+
+def memory_result(
+    memories: Optional[List[Dict[str, Any]]],
+    min_confidence: float
+) -> Tuple[Optional[np.ndarray], float, Optional[float]]:
+    """
+    retrieve() 결과 해석
+
+    Args:
+        memories: retrieve() 반환값
+        min_confidence: confidence 하한
+
+    Returns:
+        (bias, confidence, match): 미적중이거나 bias가 없으면 bias는 None,
+        미적중이면 confidence 0.0, 일치도가 없으면 match는 None
+    """
+    if not memories:
+        return None, 0.0, None
+    first = memories[0]
+    confidence = first.get('confidence', 0.5)  # 기본값 0.5
+    confidence = min(max(float(confidence), min_confidence), 1.0)
+    match = first.get('match')
+    if match is not None:
+        match = min(max(float(match), 0.0), 1.0)
+    return first.get('bias'), confidence, match
+
+
+def memory_results(
+    result: Sequence[np.ndarray],
+    bias_dim: int,
+    min_confidence: Union[float, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    retrieve_many() 결과 해석 (행마다 memory_result와 같은 규칙)
+
+    Args:
+        result: (biases, confidences) 또는 (biases, confidences, matches)
+        bias_dim: bias 차원
+        min_confidence: confidence 하한 (스칼라 또는 (N,))
+
+    Returns:
+        (biases, confidences, matches): (N, D_b), (N,) (미적중 0), (N,) (없으면 nan)
+    """
+    found = np.asarray(result[1], dtype=float)
+    n = len(found)
+    biases = np.zeros((n, bias_dim))
+    confidences = np.zeros(n)
+    matches = np.full(n, np.nan)
+    hits = ~np.isnan(found)
+    if hits.any():
+        biases[hits] = result[0][hits]
+        lower = np.broadcast_to(np.asarray(min_confidence, dtype=float), (n,))[hits]
+        confidences[hits] = np.minimum(np.maximum(found[hits], lower), 1.0)
+        if len(result) > 2:
+            matches[hits] = np.clip(np.asarray(result[2], dtype=float)[hits], 0.0, 1.0)
+    return biases, confidences, matches
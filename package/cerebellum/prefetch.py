@@ -0,0 +1,179 @@
+"""
+Memory Prefetcher
+해마 기억 검색을 제어 스레드 밖(백그라운드 스레드)에서 수행하는 prefetch 계층
+
+================================================================================
+핵심 개념
+================================================================================
+compute_correction은 매 틱 최신 상태를 요청(submit)만 하고, 백그라운드 스레드가
+가장 최근 요청에 대해 memory.retrieve(최근접 이웃 검색)를 수행합니다.
+제어 스레드는 완료된 결과 중 가장 새로운 것을 가져다 씁니다.
+
+- 요청은 덮어쓰기 방식 (밀린 요청은 버리고 항상 최신 상태만 검색)
+- staleness = 현재 틱 - 결과가 계산된 요청 틱
+- staleness > max_staleness인 결과는 버림 (bounded staleness)
+- lookup이 예외를 던지면 기록(errors, last_error)하고 미적중(0 벡터, confidence 0)을
+  게시 (스레드는 계속 동작, 제어 스레드가 점점 오래된 결과를 쓰지 않도록)
+
+lookup은 제어 스레드와 동시에 실행됩니다. CerebellumEngine._get_memory_bias는
+캐시/회로 차단기 갱신을 엔진의 잠금 안에서 수행합니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+import threading
+import numpy as np
+
+
+class MemoryPrefetcher:
+    """
+    백그라운드 기억 검색기
+
+    lookup(state, context) -> (bias, confidence, match)를 별도 스레드에서 호출합니다.
+    """
+
+    def __init__(
+        self,
+        lookup: Callable[[np.ndarray, Optional[Dict[str, Any]]], Tuple[np.ndarray, float, Optional[float]]],
+        max_staleness: int = 2
+    ):
+        """
+        Args:
+            lookup: 기억 검색 함수 (보통 CerebellumEngine._get_memory_bias)
+            max_staleness: 사용할 결과의 최대 staleness (틱)
+        """
+        self.lookup = lookup
+        self.max_staleness = max_staleness
+
+        self._condition = threading.Condition()
+        self._pending: Optional[Tuple[np.ndarray, Optional[Dict[str, Any]], int, int]] = None
+        self._result: Optional[Tuple[np.ndarray, float, Optional[float], int, int]] = None
+        self._epoch = 0  # clear()마다 증가 (리셋 이전 결과 무시)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.completed = 0  # 백그라운드에서 완료된 검색 수
+        self.used = 0  # 제어 스레드가 사용한 결과 수
+        self.dropped = 0  # 결과가 없거나 너무 오래되어 버린 틱 수
+        self.errors = 0  # lookup 예외 수 (미적중으로 게시)
+        self.last_error: Optional[str] = None
+        self.staleness_histogram = [0] * (max_staleness + 1)
+        self.last_staleness: Optional[int] = None
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 스레드 동작 여부"""
+        return self._running
+
+    def start(self) -> 'MemoryPrefetcher':
+        """백그라운드 스레드 시작"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name='cerebellum-prefetch', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """백그라운드 스레드 정지"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, state: np.ndarray, context: Optional[Dict[str, Any]], tick: int) -> None:
+        """
+        최신 상태에 대한 검색 요청 (이전 미처리 요청은 덮어씀)
+
+        Args:
+            state: 현재 상태 (복사되어 보관)
+            context: 맥락 정보
+            tick: 요청 틱
+        """
+        with self._condition:
+            self._pending = (np.array(state, dtype=float), context, tick, self._epoch)
+            self._condition.notify()
+
+    def consume(self, tick: int) -> Optional[Tuple[np.ndarray, float, Optional[float], int]]:
+        """
+        완료된 가장 새로운 결과 가져오기
+
+        Args:
+            tick: 현재 틱
+
+        Returns:
+            (bias, confidence, match, staleness) 또는 None (결과 없음/너무 오래됨)
+        """
+        result = self._result  # 참조 하나를 읽으므로 잠금 불필요
+        if result is None or result[4] != self._epoch:
+            self.dropped += 1
+            self.last_staleness = None
+            return None
+
+        bias, confidence, match, request_tick, _ = result
+        staleness = tick - request_tick
+        self.last_staleness = staleness
+        if staleness > self.max_staleness:
+            self.dropped += 1
+            return None
+
+        self.used += 1
+        self.staleness_histogram[staleness] += 1
+        return bias, confidence, match, staleness
+
+    def clear(self) -> None:
+        """보류 요청과 완료 결과 폐기 (엔진 리셋 시)"""
+        with self._condition:
+            self._epoch += 1
+            self._pending = None
+            self._result = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        prefetch 통계
+
+        Returns:
+            completed, used, dropped, errors, last_error, last_staleness,
+            staleness_histogram (staleness 0..max_staleness별 사용 횟수), mean_staleness
+        """
+        used = sum(self.staleness_histogram)
+        weighted = sum(k * c for k, c in enumerate(self.staleness_histogram))
+        return {
+            'completed': self.completed,
+            'used': self.used,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'last_error': self.last_error,
+            'last_staleness': self.last_staleness,
+            'staleness_histogram': list(self.staleness_histogram),
+            'mean_staleness': weighted / used if used else 0.0,
+        }
+
+    def _worker(self) -> None:
+        """최신 요청을 꺼내 검색하고 결과를 게시"""
+        while True:
+            with self._condition:
+                while self._pending is None and self._running:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                state, context, tick, epoch = self._pending
+                self._pending = None
+
+            try:
+                bias, confidence, match = self.lookup(state, context)
+            except Exception as e:
+                # 스레드가 죽지 않도록 기록하고 이 요청은 미적중으로 게시
+                self.errors += 1
+                self.last_error = repr(e)
+                bias, confidence, match = np.zeros_like(state), 0.0, None
+            # 결과는 튜플 하나로 교체 (제어 스레드는 항상 완전한 결과만 봄)
+            self._result = (np.array(bias, dtype=float), float(confidence), match, tick, epoch)
+            self.completed += 1
@@ -0,0 +1,354 @@
+"""
+Engine Registry
+여러 제어 스레드가 공유하는 샤딩된 소뇌 엔진 레지스트리
+
+================================================================================
+핵심 개념
+================================================================================
+CerebellumEngine은 동기화 없이 링 버퍼·prev_state·filtered_error를 갱신하므로
+한 엔진을 두 스레드가 동시에 호출하면 안 됩니다. 레지스트리는 축/제어기 ID로
+엔진을 보관하고, 키를 샤드로 나눠 샤드마다 잠금 하나를 둡니다 (lock striping).
+
+   key ──hash──▶ shard k ─┬─ lock
+                          ├─ engines {key: CerebellumEngine}
+                          └─ 통계 (틱 수, 실행 시간, 잠금 대기 시간)
+
+- step(key, ...): 해당 샤드 잠금을 잡고 한 엔진 계산
+- step_all(inputs): 샤드별로 묶어 스레드 풀에서 동시에 계산
+  (샤드 하나는 한 작업자만 처리, 샤드 간 공유 상태는 해마 메모리뿐)
+- locked(key): 잠금을 잡은 채 엔진 상태 읽기/설정 변경
+
+스레드 간 병렬성은 NumPy가 GIL을 놓는 구간에 한정됩니다. 작은 벡터(memory_dim
+≤ 8, 스칼라 백엔드)는 대부분 GIL을 잡고 실행되므로 step_all의 이점은 주로
+해마 메모리 검색(I/O, 큰 배열 연산)이 GIL을 놓는 경우에 나타납니다.
+해마 메모리를 여러 엔진이 공유해도 됩니다. 패키지의 메모리(ArrayMemory 계열,
+ContextMemory)는 저장/검색을 인스턴스 잠금으로 직렬화하므로 step_all 중에 다른
+스레드가 store해도 안전합니다. 직접 구현한 메모리를 공유한다면 retrieve/store를
+같은 방식(cerebellum.array_memory.synchronized)으로 보호해야 합니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import os
+import threading
+import time
+import numpy as np
+
+from .cerebellum_engine import CerebellumEngine, CerebellumConfig
+
+
+class EngineShard:
+    """
+    레지스트리 샤드 (잠금 하나 + 엔진 묶음 + 처리량 통계)
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+        self.lock = threading.Lock()
+        self.engines: Dict[Hashable, CerebellumEngine] = {}
+
+        # 통계 (lock을 잡은 상태에서만 갱신)
+        self.ticks = 0  # 계산한 엔진 틱 수
+        self.batches = 0  # step / step_all 샤드 작업 수
+        self.busy_ns = 0  # 잠금을 잡고 계산한 시간
+        self.lock_wait_ns = 0  # 잠금을 기다린 시간
+        self.max_batch_ns = 0  # 가장 오래 걸린 샤드 작업
+
+    def acquire(self) -> None:
+        """잠금 획득 (대기 시간 기록)"""
+        start = time.perf_counter_ns()
+        self.lock.acquire()
+        self.lock_wait_ns += time.perf_counter_ns() - start
+
+    def record(self, ticks: int, elapsed_ns: int) -> None:
+        """샤드 작업 하나의 통계 기록 (잠금을 잡은 상태에서 호출)"""
+        self.ticks += ticks
+        self.batches += 1
+        self.busy_ns += elapsed_ns
+        if elapsed_ns > self.max_batch_ns:
+            self.max_batch_ns = elapsed_ns
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        샤드 통계
+
+        Returns:
+            shard, engines, ticks, batches, busy_seconds, ticks_per_second,
+            lock_wait_seconds, max_batch_us
+        """
+        busy_seconds = self.busy_ns / 1e9
+        return {
+            'shard': self.index,
+            'engines': len(self.engines),
+            'ticks': self.ticks,
+            'batches': self.batches,
+            'busy_seconds': busy_seconds,
+            'ticks_per_second': self.ticks / busy_seconds if self.busy_ns > 0 else 0.0,
+            'lock_wait_seconds': self.lock_wait_ns / 1e9,
+            'max_batch_us': self.max_batch_ns / 1000,
+        }
+
+
+class EngineRegistry:
+    """
+    샤딩된 소뇌 엔진 레지스트리 (스레드 안전)
+    """
+
+    def __init__(self, n_shards: int = 8, max_workers: Optional[int] = None):
+        """
+        Args:
+            n_shards: 샤드(잠금) 개수
+            max_workers: step_all 작업 스레드 수 (None이면 min(n_shards, CPU 수))
+        """
+        if n_shards < 1:
+            raise ValueError(f"n_shards는 1 이상이어야 합니다: {n_shards}")
+        self.n_shards = n_shards
+        self.max_workers = max_workers or min(n_shards, os.cpu_count() or 1)
+        self.shards: List[EngineShard] = [EngineShard(i) for i in range(n_shards)]
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 엔진 등록/조회
+    # ------------------------------------------------------------------
+
+    def shard_of(self, key: Hashable) -> EngineShard:
+        """키가 속한 샤드"""
+        return self.shards[hash(key) % self.n_shards]
+
+    def add(self, key: Hashable, engine: CerebellumEngine) -> CerebellumEngine:
+        """
+        엔진 등록
+
+        Raises:
+            ValueError: 이미 등록된 키인 경우
+        """
+        shard = self.shard_of(key)
+        with shard.lock:
+            if key in shard.engines:
+                raise ValueError(f"이미 등록된 엔진입니다: {key!r}")
+            shard.engines[key] = engine
+        return engine
+
+    def create(
+        self,
+        key: Hashable,
+        memory_dim: int = 5,
+        config: Optional[CerebellumConfig] = None,
+        memory: Optional[Any] = None
+    ) -> CerebellumEngine:
+        """새 엔진을 만들어 등록"""
+        return self.add(key, CerebellumEngine(memory_dim=memory_dim, config=config, memory=memory))
+
+    def remove(self, key: Hashable) -> CerebellumEngine:
+        """
+        엔진 등록 해제
+
+        Raises:
+            KeyError: 등록되지 않은 키인 경우
+        """
+        shard = self.shard_of(key)
+        with shard.lock:
+            return shard.engines.pop(key)
+
+    def get(self, key: Hashable) -> CerebellumEngine:
+        """
+        등록된 엔진 (잠금 없이 참조만 반환, 상태 접근은 locked() 사용)
+
+        Raises:
+            KeyError: 등록되지 않은 키인 경우
+        """
+        return self.shard_of(key).engines[key]
+
+    @contextmanager
+    def locked(self, key: Hashable) -> Iterator[CerebellumEngine]:
+        """
+        샤드 잠금을 잡은 채 엔진 사용
+
+        with registry.locked('axis-x') as engine:
+            history = engine.error_history
+        """
+        shard = self.shard_of(key)
+        shard.acquire()
+        try:
+            yield shard.engines[key]
+        finally:
+            shard.lock.release()
+
+    def keys(self) -> List[Hashable]:
+        """등록된 키 목록"""
+        keys = []
+        for shard in self.shards:
+            with shard.lock:
+                keys.extend(shard.engines)
+        return keys
+
+    def __len__(self) -> int:
+        return sum(len(shard.engines) for shard in self.shards)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.shard_of(key).engines
+
+    # ------------------------------------------------------------------
+    # 계산
+    # ------------------------------------------------------------------
+
+    def step(
+        self,
+        key: Hashable,
+        current_state: np.ndarray,
+        target_state: np.ndarray,
+        velocity: Optional[np.ndarray] = None,
+        acceleration: Optional[np.ndarray] = None,
+        context: Optional[Dict[str, Any]] = None,
+        dt: float = 0.001,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        엔진 하나의 compute_correction (샤드 잠금 안에서 실행)
+
+        Raises:
+            KeyError: 등록되지 않은 키인 경우
+        """
+        shard = self.shard_of(key)
+        shard.acquire()
+        try:
+            engine = shard.engines[key]
+            start = time.perf_counter_ns()
+            correction = engine.compute_correction(
+                current_state, target_state, velocity, acceleration, context, dt, out
+            )
+            shard.record(1, time.perf_counter_ns() - start)
+        finally:
+            shard.lock.release()
+        return correction
+
+    def step_all(
+        self,
+        inputs: Mapping[Hashable, Tuple[np.ndarray, np.ndarray]],
+        contexts: Optional[Mapping[Hashable, Optional[Dict[str, Any]]]] = None,
+        dt: float = 0.001,
+        outs: Optional[Mapping[Hashable, np.ndarray]] = None,
+        parallel: bool = True
+    ) -> Dict[Hashable, np.ndarray]:
+        """
+        여러 엔진을 한 번에 계산 (샤드별로 묶어 스레드 풀에서 실행)
+
+        Args:
+            inputs: {key: (current_state, target_state)}
+            contexts: {key: context} (없는 키는 None)
+            dt: 시간 간격
+            outs: {key: 결과를 기록할 배열} (compute_correction의 out=)
+            parallel: False면 호출 스레드에서 샤드를 차례로 실행
+
+        Returns:
+            {key: 보정 신호}
+
+        Raises:
+            KeyError: 등록되지 않은 키가 있는 경우 (어느 엔진도 계산하지 않음)
+        """
+        groups: Dict[int, List[Hashable]] = {}
+        for key in inputs:
+            shard = self.shard_of(key)
+            if key not in shard.engines:
+                raise KeyError(key)
+            groups.setdefault(shard.index, []).append(key)
+
+        contexts = contexts or {}
+        outs = outs or {}
+        results: Dict[Hashable, np.ndarray] = {}
+
+        def run(shard: EngineShard, keys: Sequence[Hashable]) -> None:
+            shard.acquire()
+            try:
+                start = time.perf_counter_ns()
+                engines = shard.engines
+                for key in keys:
+                    current_state, target_state = inputs[key]
+                    # 서로 다른 키에 대한 dict 대입은 GIL 아래에서 원자적
+                    results[key] = engines[key].compute_correction(
+                        current_state, target_state, context=contexts.get(key), dt=dt, out=outs.get(key)
+                    )
+                shard.record(len(keys), time.perf_counter_ns() - start)
+            finally:
+                shard.lock.release()
+
+        if not parallel or len(groups) <= 1 or self.max_workers <= 1:
+            for index, keys in groups.items():
+                run(self.shards[index], keys)
+            return results
+
+        executor = self._get_executor()
+        futures = [executor.submit(run, self.shards[index], keys) for index, keys in groups.items()]
+        for future in futures:
+            future.result()  # 작업자 예외 전파
+        return results
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """step_all용 스레드 풀 (처음 사용할 때 생성)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='cerebellum-registry'
+                )
+            return self._executor
+
+    # ------------------------------------------------------------------
+    # 통계 / 종료
+    # ------------------------------------------------------------------
+
+    def get_shard_stats(self) -> List[Dict[str, Any]]:
+        """샤드별 처리량 통계 (EngineShard.get_stats 목록)"""
+        stats = []
+        for shard in self.shards:
+            with shard.lock:
+                stats.append(shard.get_stats())
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        레지스트리 전체 통계
+
+        Returns:
+            n_shards, engines, ticks, busy_seconds, lock_wait_seconds,
+            shards (샤드별 통계)
+        """
+        shards = self.get_shard_stats()
+        return {
+            'n_shards': self.n_shards,
+            'engines': sum(s['engines'] for s in shards),
+            'ticks': sum(s['ticks'] for s in shards),
+            'busy_seconds': sum(s['busy_seconds'] for s in shards),
+            'lock_wait_seconds': sum(s['lock_wait_seconds'] for s in shards),
+            'shards': shards,
+        }
+
+    def reset_stats(self) -> None:
+        """샤드 통계 초기화 (엔진 상태는 유지)"""
+        for shard in self.shards:
+            with shard.lock:
+                shard.ticks = 0
+                shard.batches = 0
+                shard.busy_ns = 0
+                shard.lock_wait_ns = 0
+                shard.max_batch_ns = 0
+
+    def close(self) -> None:
+        """스레드 풀 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> 'EngineRegistry':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
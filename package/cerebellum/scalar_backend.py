@@ -0,0 +1,85 @@
+"""
+Scalar Backend State
+작은 차원(memory_dim 3~8) 엔진용 Python float 상태
+
+================================================================================
+핵심 개념
+================================================================================
+5차원 벡터 연산 하나에 드는 NumPy 호출 오버헤드(약 1μs)는 산술 자체보다
+훨씬 큽니다. 스칼라 백엔드는 compute_correction의 단계를 원소별 Python float
+루프로 계산하고, 틱 사이 상태(오차/상태 링, 누적 합, 이전 상태·속도,
+filtered_error, 커널 입력)를 Python 리스트로 보관합니다.
+
+NumPy 버퍼에는 필요할 때만 기록합니다 (지연 동기화).
+- 스칼라 경로가 실행되면 리스트가 최신, NumPy 버퍼는 오래된 상태
+- error_history, prev_state, snapshot(), 오프라인 경로 등 버퍼를 읽는 곳은
+  먼저 CerebellumEngine._sync_arrays()로 리스트를 버퍼에 기록
+- 이후 스칼라 경로는 버퍼에서 리스트를 다시 읽어 이어서 실행
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, List, Optional
+
+
+class ScalarState:
+    """
+    스칼라 백엔드의 틱 사이 상태 (Python 리스트)
+
+    ring_index, ring_count, tick_count는 엔진 속성을 그대로 사용합니다.
+    """
+
+    __slots__ = (
+        'error_ring', 'state_ring', 'error_sum',
+        'prev_state', 'prev_velocity', 'filtered',
+        'errors', 'velocities', 'accelerations', 'scaled_bias',
+    )
+
+    def __init__(self, engine: Any):
+        """
+        엔진의 NumPy 버퍼에서 상태 읽기
+
+        Args:
+            engine: CerebellumEngine (버퍼가 최신인 상태)
+        """
+        self.error_ring: List[List[float]] = engine._error_ring.tolist()
+        self.state_ring: List[List[float]] = engine._state_ring.tolist()
+        self.error_sum: List[float] = engine._error_sum.tolist()
+        self.prev_state: Optional[List[float]] = (
+            None if engine._prev_state is None else engine._prev_state.tolist()
+        )
+        self.prev_velocity: Optional[List[float]] = (
+            None if engine._prev_velocity is None else engine._prev_velocity.tolist()
+        )
+        self.filtered: Optional[List[float]] = (
+            None if engine._filtered_error is None else engine._filtered_error.tolist()
+        )
+        self.errors, self.velocities, self.accelerations, _, self.scaled_bias = (
+            engine._kernel_inputs.tolist()
+        )
+
+    def store(self, engine: Any) -> None:
+        """
+        상태를 엔진의 NumPy 버퍼에 기록
+
+        Args:
+            engine: CerebellumEngine
+        """
+        engine._error_ring[...] = self.error_ring
+        engine._state_ring[...] = self.state_ring
+        engine._error_sum[...] = self.error_sum
+        engine._kernel_inputs[0] = self.errors
+        engine._kernel_inputs[1] = self.velocities
+        engine._kernel_inputs[2] = self.accelerations
+        if self.filtered is not None:
+            engine._filtered_buffer[...] = self.filtered
+            engine._filtered_error = engine._filtered_buffer
+        if self.prev_state is not None:
+            engine._prev_state_buffer[...] = self.prev_state
+            engine._prev_state = engine._prev_state_buffer
+        if self.prev_velocity is not None:
+            engine._prev_velocity_buffer[...] = self.prev_velocity
+            engine._prev_velocity = engine._prev_velocity_buffer
@@ -0,0 +1,97 @@
+"""
+Engine Snapshot
+소뇌 엔진 상태의 버전 있는 바이너리 직렬화 (pickle 없음)
+
+================================================================================
+형식 (리틀 엔디언)
+================================================================================
+   offset  크기   내용
+   0       4      매직 b'CBSN'
+   4       2      형식 버전 (uint16)
+   6       2      예약 (0)
+   8       4      헤더 길이 H (uint32)
+   12      H      헤더 (UTF-8 JSON): 설정, 스칼라 상태, 배열 목록 [이름, shape]
+   12+H    ...    배열 데이터 (float64, 헤더의 배열 순서대로 이어붙임)
+
+배열은 np.frombuffer로 복사 없이 읽은 뒤 엔진 버퍼에 np.copyto로 기록하므로
+복원 비용은 헤더 파싱 + 버퍼 복사뿐입니다. 같은 형식을 프로세스 간 핫 스탠바이
+복제(공유 메모리, 소켓)에 그대로 사용할 수 있습니다.
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, Dict, Sequence, Tuple
+import json
+import math
+import struct
+import numpy as np
+
+
+SNAPSHOT_MAGIC = b'CBSN'
+SNAPSHOT_VERSION = 1
+
+_PREAMBLE = struct.Struct('<4sHHI')
+_DTYPE = np.dtype('<f8')
+
+
+def encode_snapshot(header: Dict[str, Any], arrays: Sequence[Tuple[str, np.ndarray]]) -> bytes:
+    """
+    헤더와 배열을 스냅샷 바이트열로 인코딩
+
+    Args:
+        header: JSON으로 직렬화 가능한 헤더 (배열 목록은 자동 추가)
+        arrays: (이름, 배열) 목록
+
+    Returns:
+        스냅샷 바이트열
+    """
+    header = dict(header)
+    header['arrays'] = [[name, list(np.shape(array))] for name, array in arrays]
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    parts = [_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(header_bytes)), header_bytes]
+    parts.extend(np.ascontiguousarray(array, dtype=_DTYPE).tobytes() for _, array in arrays)
+    return b''.join(parts)
+
+
+def decode_snapshot(buffer: bytes) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    스냅샷 바이트열 디코딩
+
+    Args:
+        buffer: encode_snapshot의 결과 (bytes, bytearray, memoryview)
+
+    Returns:
+        (header, arrays) - arrays는 buffer를 참조하는 읽기 전용 배열
+
+    Raises:
+        ValueError: 매직/버전/길이가 맞지 않는 경우
+    """
+    view = memoryview(buffer)
+    if len(view) < _PREAMBLE.size:
+        raise ValueError("스냅샷이 너무 짧습니다")
+    magic, version, _, header_length = _PREAMBLE.unpack_from(view)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("소뇌 엔진 스냅샷이 아닙니다")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전: {version} (지원: {SNAPSHOT_VERSION})")
+
+    offset = _PREAMBLE.size + header_length
+    if len(view) < offset:
+        raise ValueError("스냅샷 헤더가 잘렸습니다")
+    header = json.loads(bytes(view[_PREAMBLE.size:offset]).decode('utf-8'))
+
+    counts = [math.prod(shape) for _, shape in header['arrays']]
+    if len(view) - offset != sum(counts) * _DTYPE.itemsize:
+        raise ValueError("스냅샷 데이터 길이가 헤더와 다릅니다")
+
+    # 데이터 전체를 한 번에 읽고 배열별 뷰로 나눔 (복사 없음)
+    payload = np.frombuffer(view, dtype=_DTYPE, offset=offset)
+    arrays = {}
+    start = 0
+    for (name, shape), count in zip(header['arrays'], counts):
+        arrays[name] = payload[start:start + count].reshape(shape)
+        start += count
+    return header, arrays
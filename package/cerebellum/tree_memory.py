@@ -0,0 +1,379 @@
+"""
+Tree Memory
+KD-tree 색인 + 선형 검색 버퍼를 사용하는 최근접 이웃 해마 메모리
+
+================================================================================
+핵심 개념
+================================================================================
+해시 격자(GridMemory)는 차원이 높거나 상태 분포가 한쪽에 몰리면 셀 수(3^D)나
+셀당 항목 수가 커져 느려집니다. TreeMemory는 분포에 맞춰 나누는 KD-tree를 씁니다.
+
+   store ──▶ 버퍼 (최근 삽입, 선형 검색)
+                │ 버퍼 > rebuild_threshold
+                ▼
+   백그라운드 스레드: 전체 키 복사본으로 새 트리 생성
+                │ 완료 후 다음 store/retrieve에서 교체
+                ▼
+   KD-tree (리프당 leaf_size개, 가장 넓게 퍼진 축의 중앙값으로 분할)
+
+- store: O(1) (버퍼에 추가)
+- retrieve: 트리 하강 O(log N) + 반경 안 가지만 되돌아가며 탐색 + 버퍼 선형 검색
+- 트리 생성 중의 삽입/삭제/이동은 로그에 쌓아 두었다가 새 트리 교체 시 재생
+
+트리 교체(_poll)는 검색에서도 일어나므로 store/검색/재생성은 모두 인스턴스 잠금
+안에서 실행됩니다 (prefetch 스레드의 검색과 제어 스레드의 store가 겹쳐도 생성 중
+기록된 삽입이 빠지지 않음). 트리 생성 자체는 복사본으로 잠금 밖에서 진행됩니다.
+
+트리는 행 번호(tree_rows)와 키 복사본(tree_keys)을 리프 순서로 보관하고,
+bias·confidence는 ArrayMemory 배열에서 읽습니다. 삭제된 행은 tree_keys를 inf로
+바꿔 건너뜁니다 (다음 재생성 때 제거).
+
+Author: GNJz
+Created: 2026-01-20
+Made in GNJz
+License: MIT License
+"""
+
+from typing import Any, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import math
+import numpy as np
+
+from .array_memory import ArrayMemory, synchronized
+
+
+class KDTree:
+    """
+    정적 KD-tree (완전 이진 트리, 배열 표현)
+
+    노드 i의 자식은 2i+1, 2i+2이며 리프 노드는 [lo, hi) 구간의 점을 가집니다.
+    """
+
+    def __init__(self, points: np.ndarray, rows: np.ndarray, leaf_size: int = 32):
+        """
+        Args:
+            points: (N, D) 키 (복사본, 트리가 소유)
+            rows: (N,) 각 키의 메모리 행 번호
+            leaf_size: 리프당 최대 점 수
+        """
+        n = len(points)
+        n_leaves = 1 << max(0, math.ceil(math.log2(max(n, 1) / leaf_size))) if n > leaf_size else 1
+        n_internal = n_leaves - 1
+        n_nodes = 2 * n_leaves - 1
+
+        order = np.arange(n)
+        lo = [0] * n_nodes
+        hi = [0] * n_nodes
+        split_dim = [0] * n_internal
+        split_val = [0.0] * n_internal
+        hi[0] = n
+
+        for node in range(n_internal):
+            a, b = lo[node], hi[node]
+            middle = (a + b) // 2
+            if b - a > 1:
+                subset = order[a:b]
+                subset_points = points[subset]
+                dim = int(np.argmax(subset_points.max(axis=0) - subset_points.min(axis=0)))
+                # 중앙값 분할: 왼쪽 ≤ split_val ≤ 오른쪽
+                partition = np.argpartition(subset_points[:, dim], middle - a)
+                order[a:b] = subset[partition]
+                split_dim[node] = dim
+                split_val[node] = float(points[order[middle], dim])
+            lo[2 * node + 1], hi[2 * node + 1] = a, middle
+            lo[2 * node + 2], hi[2 * node + 2] = middle, b
+
+        self.n_internal = n_internal
+        self.split_dim = split_dim
+        self.split_val = split_val
+        self.lo = lo
+        self.hi = hi
+        self.points = np.ascontiguousarray(points[order])
+        self.rows = np.asarray(rows)[order]
+        self.positions = {int(row): position for position, row in enumerate(self.rows.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def nearest(self, key: np.ndarray, best_squared: float) -> Tuple[int, float]:
+        """
+        거리 제곱이 best_squared 미만인 최근접 점
+
+        Args:
+            key: 질의 키
+            best_squared: 탐색 상한 (반경²)
+
+        Returns:
+            (메모리 행 번호, 거리 제곱) - 없으면 (-1, best_squared)
+        """
+        if len(self.rows) == 0:
+            return -1, best_squared
+        query = key.tolist()
+        best_position = -1
+        n_internal = self.n_internal
+        stack: List[Tuple[int, float]] = [(0, 0.0)]
+        while stack:
+            node, plane_squared = stack.pop()
+            if plane_squared >= best_squared:
+                continue
+            if node >= n_internal:
+                a, b = self.lo[node], self.hi[node]
+                if a == b:
+                    continue
+                diff = self.points[a:b] - key
+                distances = np.einsum('ij,ij->i', diff, diff)
+                index = int(distances.argmin())
+                if distances[index] < best_squared:
+                    best_squared = float(distances[index])
+                    best_position = a + index
+                continue
+            offset = query[self.split_dim[node]] - self.split_val[node]
+            if offset < 0:
+                near, far = 2 * node + 1, 2 * node + 2
+            else:
+                near, far = 2 * node + 2, 2 * node + 1
+            stack.append((far, offset * offset))
+            stack.append((near, 0.0))
+        if best_position < 0:
+            return -1, best_squared
+        return int(self.rows[best_position]), best_squared
+
+
+class TreeMemory(ArrayMemory):
+    """
+    KD-tree + 삽입 버퍼 메모리 (retrieve / store 계약은 ArrayMemory와 동일)
+    """
+
+    def __init__(
+        self,
+        radius: float = 0.1,
+        leaf_size: int = 32,
+        rebuild_threshold: int = 1024,
+        rebuild_ratio: float = 0.1,
+        background: bool = True,
+        initial_capacity: int = 1024
+    ):
+        """
+        Args:
+            radius: 검색 반경 (math.inf면 반경 제한 없음)
+            leaf_size: 리프당 최대 점 수
+            rebuild_threshold: 재생성을 시작할 최소 버퍼 크기
+            rebuild_ratio: 버퍼가 트리 크기 × 이 값을 넘어야 재생성
+            background: True면 백그라운드 스레드에서 트리 생성, False면 store 안에서 생성
+            initial_capacity: 초기 배열 행 수
+        """
+        super().__init__(radius=radius, initial_capacity=initial_capacity)
+        self.leaf_size = leaf_size
+        self.rebuild_threshold = rebuild_threshold
+        self.rebuild_ratio = rebuild_ratio
+        self.background = background
+
+        self.tree: Optional[KDTree] = None
+        self._buffer: List[int] = []  # 트리에 없는 행
+        self._pending: Optional[Future] = None  # 생성 중인 트리
+        self._log: Optional[List[Tuple[str, int, int]]] = None  # 생성 중 변경 기록
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 통계
+        self.rebuilds = 0
+
+    @property
+    def buffer_size(self) -> int:
+        """트리에 아직 들어가지 않은 행 수"""
+        return len(self._buffer)
+
+    @property
+    def rebuilding(self) -> bool:
+        """백그라운드 트리 생성 중 여부"""
+        return self._pending is not None
+
+    # ------------------------------------------------------------------
+    # 색인 갱신 훅
+    # ------------------------------------------------------------------
+
+    def _on_insert(self, row: int) -> None:
+        self._buffer.append(row)
+        if self._log is not None:
+            self._log.append(('insert', row, row))
+
+    def _on_remove(self, row: int) -> None:
+        self._apply_remove(row)
+        if self._log is not None:
+            self._log.append(('remove', row, row))
+
+    def _on_move(self, old_row: int, new_row: int) -> None:
+        self._apply_move(old_row, new_row)
+        if self._log is not None:
+            self._log.append(('move', old_row, new_row))
+
+    def _apply_remove(self, row: int) -> None:
+        tree = self.tree
+        position = tree.positions.pop(row, None) if tree is not None else None
+        if position is not None:
+            tree.points[position] = np.inf  # 검색에서 제외
+            tree.rows[position] = -1
+        else:
+            self._buffer.remove(row)
+
+    def _apply_move(self, old_row: int, new_row: int) -> None:
+        tree = self.tree
+        position = tree.positions.pop(old_row, None) if tree is not None else None
+        if position is not None:
+            tree.rows[position] = new_row
+            tree.positions[new_row] = position
+        else:
+            self._buffer[self._buffer.index(old_row)] = new_row
+
+    # ------------------------------------------------------------------
+    # 트리 재생성
+    # ------------------------------------------------------------------
+
+    def _needs_rebuild(self) -> bool:
+        tree_size = len(self.tree) if self.tree is not None else 0
+        buffered = len(self._buffer)
+        return buffered >= self.rebuild_threshold and buffered > tree_size * self.rebuild_ratio
+
+    @synchronized
+    def rebuild(self, wait: bool = True) -> None:
+        """
+        현재 모든 행으로 트리 재생성
+
+        Args:
+            wait: True면 완료될 때까지 기다려 교체 (background=False와 같음)
+        """
+        if self._pending is not None:
+            if not wait:
+                return
+            self._install(self._pending.result())
+        if self.size == 0:
+            return
+        points = self._keys[:self.size].copy()
+        rows = np.arange(self.size)
+        if wait or not self.background:
+            self._log = []
+            self._install(KDTree(points, rows, self.leaf_size))
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cerebellum-kdtree')
+        self._log = []
+        self._pending = self._executor.submit(KDTree, points, rows, self.leaf_size)
+
+    def _install(self, tree: KDTree) -> None:
+        """생성된 트리로 교체하고 생성 중 변경 기록 재생"""
+        log = self._log or []
+        self._pending = None
+        self._log = None
+        self.tree = tree
+        self._buffer = []
+        for operation, row, new_row in log:
+            if operation == 'insert':
+                self._buffer.append(row)
+            elif operation == 'remove':
+                self._apply_remove(row)
+            else:
+                self._apply_move(row, new_row)
+        self.rebuilds += 1
+
+    def _poll(self) -> None:
+        """백그라운드 생성이 끝났으면 교체, 버퍼가 크면 재생성 시작"""
+        if self._pending is not None:
+            if self._pending.done():
+                self._install(self._pending.result())
+        elif self._needs_rebuild():
+            self.rebuild(wait=not self.background)
+
+    # ------------------------------------------------------------------
+    # 저장/검색
+    # ------------------------------------------------------------------
+
+    @synchronized
+    def store(
+        self,
+        key: np.ndarray,
+        value: np.ndarray,
+        confidence: float = 0.9,
+        context: Optional[Any] = None
+    ) -> None:
+        """기억 저장 (버퍼에 추가, 필요하면 트리 재생성 시작)"""
+        super().store(key, value, confidence, context)
+        self._poll()
+
+    @synchronized
+    def nearest(self, key: np.ndarray) -> Tuple[int, float]:
+        """
+        반경 안의 최근접 항목 (트리 + 버퍼)
+
+        Returns:
+            (행 번호, 거리) - 반경 안에 없으면 (-1, inf)
+        """
+        self._poll()
+        key = np.asarray(key, dtype=float)
+        limit = self.radius * self.radius
+        best_row, best_squared = -1, limit
+        if self.tree is not None:
+            best_row, best_squared = self.tree.nearest(key, limit)
+
+        buffer = self._buffer
+        if buffer:
+            n = len(buffer)
+            diff, distances = self._scratch(n)
+            np.subtract(self._keys[buffer], key, out=diff)
+            np.einsum('ij,ij->i', diff, diff, out=distances)
+            index = int(distances.argmin())
+            if distances[index] < best_squared:
+                best_row, best_squared = buffer[index], float(distances[index])
+
+        if best_row < 0:
+            return -1, float('inf')
+        return best_row, math.sqrt(best_squared)
+
+    @synchronized
+    def nearest_many(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 키의 반경 안 최근접 항목 (트리는 키마다 탐색, 버퍼는 한 번에 벡터화)
+
+        Returns:
+            (행 번호 (N,), 거리 (N,)) - 반경 안에 없으면 -1, inf
+        """
+        self._poll()
+        limit = self.radius * self.radius
+        rows = np.full(len(keys), -1)
+        squared = np.full(len(keys), limit)
+        if self.tree is not None:
+            for i, key in enumerate(keys):
+                rows[i], squared[i] = self.tree.nearest(key, limit)
+
+        buffer = self._buffer
+        if buffer:
+            buffer_rows = np.asarray(buffer)
+            buffer_keys = self._keys[buffer_rows]
+            chunk = max(1, 4_000_000 // buffer_keys.size)  # (chunk, B, D) 차이 배열 크기 제한
+            for start in range(0, len(keys), chunk):
+                block = slice(start, start + chunk)
+                diff = buffer_keys[None, :, :] - keys[block, None, :]
+                buffer_squared = np.einsum('kij,kij->ki', diff, diff)
+                best = buffer_squared.argmin(axis=1)
+                best_squared = buffer_squared[np.arange(len(best)), best]
+                closer = best_squared < squared[block]
+                rows[block][closer] = buffer_rows[best[closer]]
+                squared[block][closer] = best_squared[closer]
+
+        distances = np.where(rows >= 0, np.sqrt(squared), np.inf)
+        return rows, distances
+
+    @synchronized
+    def clear(self) -> None:
+        """모든 기억 삭제 (생성 중인 트리는 버림)"""
+        if self._pending is not None:
+            self._pending.result()
+        super().clear()
+        self.tree = None
+        self._buffer = []
+        self._pending = None
+        self._log = None
+
+    def close(self) -> None:
+        """백그라운드 스레드 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
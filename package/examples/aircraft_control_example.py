@@ -14,38 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
 from cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig
-
-
-class MockMemory:
-    """해마 메모리 모의 객체"""
-    def __init__(self):
-        self.memories = {}
-    
-    def retrieve(self, key, context=None):
-        """기억 검색"""
-        if len(self.memories) == 0:
-            return []
-        
-        best_match = None
-        best_distance = float('inf')
-        
-        for stored_key, (value, conf) in self.memories.items():
-            distance = np.linalg.norm(key - np.array(stored_key))
-            if distance < best_distance:
-                best_distance = distance
-                adjusted_confidence = conf * (1.0 / (1.0 + distance))
-                best_match = {
-                    'bias': value,
-                    'confidence': adjusted_confidence
-                }
-        
-        if best_match and best_distance < 0.1:
-            return [best_match]
-        return []
-    
-    def store(self, key, value, confidence=0.9, context=None):
-        """기억 저장"""
-        self.memories[tuple(key)] = (value, confidence)
+from cerebellum.array_memory import ArrayMemory
+from cerebellum.context_registry import ContextRegistry
 
 
 class AircraftController:
@@ -53,7 +23,7 @@ class AircraftController:
     
     def __init__(self):
         # 해마 메모리
-        self.memory = MockMemory()
+        self.memory = ArrayMemory()
         
         # 소뇌 엔진 (공기역학적 지연 보정용)
         config = CerebellumConfig(
@@ -62,14 +32,20 @@ class AircraftController:
             trial_gain=0.3,
             variance_gain=0.2,
             memory_gain=0.4,
-            max_correction_norm=2.0
+            max_correction_norm=2.0,
+            derivative_estimator='alpha_beta_gamma'  # ⭐ v0.7: 잡음에 강한 속도/가속도 추정
         )
         self.cerebellum = CerebellumEngine(memory_dim=3, config=config, memory=self.memory)
         
+        # ⭐ v0.7: 맥락 ID 등록부 (고도 500ft, 속도 10kt 단위로 같은 맥락)
+        self.contexts = ContextRegistry(
+            fields=('altitude', 'airspeed', 'mode'),
+            quantize={'altitude': 500.0, 'airspeed': 10.0}
+        )
+        self.cerebellum.set_context_registry(self.contexts)
+        
         # 상태 추적 (자세: [roll, pitch, yaw])
         self.current_attitude = np.array([0.0, 0.0, 0.0])
-        self.velocity = np.array([0.0, 0.0, 0.0])
-        self.acceleration = np.array([0.0, 0.0, 0.0])
     
     def control_step(self, target_attitude, altitude=10000.0, airspeed=250.0, dt=0.01):
         """
@@ -91,9 +67,9 @@ class AircraftController:
         cerebellum_correction = self.cerebellum.compute_correction(
             current_state=self.current_attitude,
             target_state=target_attitude,
-            velocity=self.velocity,
-            acceleration=self.acceleration,
-            context={'altitude': altitude, 'airspeed': airspeed, 'mode': 'autopilot'},
+            velocity=None,  # ⭐ v0.7: 엔진의 추정기가 틱당 한 번 계산
+            acceleration=None,
+            context=self.contexts.intern_values(altitude, airspeed, 'autopilot'),  # ⭐ v0.7: 틱마다 dict 생성 없음
             dt=dt
         )
         
@@ -102,11 +78,6 @@ class AircraftController:
         
         # 상태 업데이트 (시뮬레이션)
         self.current_attitude += final_control * dt
-        self.velocity = (self.current_attitude - self.prev_attitude) / dt if hasattr(self, 'prev_attitude') else np.zeros(3)
-        self.acceleration = (self.velocity - self.prev_velocity) / dt if hasattr(self, 'prev_velocity') else np.zeros(3)
-        
-        self.prev_attitude = self.current_attitude.copy()
-        self.prev_velocity = self.velocity.copy()
         
         # 안정 구간에서 기억 저장
         if np.linalg.norm(error) < 0.01:
@@ -176,7 +147,7 @@ def demo_aircraft_control():
     print(f"평균 오차: {np.mean(errors):.6f} rad")
     print(f"최대 오차: {np.max(errors):.6f} rad")
     print(f"평균 보정: {np.mean(corrections):.6f} rad")
-    print(f"저장된 기억 수: {len(controller.memory.memories)}")
+    print(f"저장된 기억 수: {len(controller.memory)}")
     print("=" * 70)
     
     if np.mean(errors) < 0.01:
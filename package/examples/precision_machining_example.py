@@ -52,14 +52,13 @@ class PrecisionMachiningController:
             trial_gain=0.3,
             variance_gain=0.2,
             memory_gain=0.4,
-            max_correction_norm=1.0  # 정밀 가공용 작은 값
+            max_correction_norm=1.0,  # 정밀 가공용 작은 값
+            derivative_estimator='savitzky_golay'  # ⭐ v0.7: 잡음에 강한 속도/가속도 추정
         )
         self.cerebellum = CerebellumEngine(memory_dim=5, config=config)
         
         # 상태 추적
         self.current_position = np.array([0.0, 0.0, 0.0, 0.0, 0.0])  # [x, y, z, A, C]
-        self.velocity = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
-        self.acceleration = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
     
     def control_step(self, target_position, dt=0.001, context=None):
         """
@@ -83,8 +82,8 @@ class PrecisionMachiningController:
         cerebellum_correction = self.cerebellum.compute_correction(
             current_state=self.current_position,
             target_state=target_position,
-            velocity=self.velocity,
-            acceleration=self.acceleration,
+            velocity=None,  # ⭐ v0.7: 엔진의 추정기가 틱당 한 번 계산
+            acceleration=None,
             context=context or {},
             dt=dt
         )
@@ -94,11 +93,6 @@ class PrecisionMachiningController:
         
         # 상태 업데이트 (시뮬레이션)
         self.current_position += final_control * dt
-        self.velocity = (self.current_position - self.prev_position) / dt if hasattr(self, 'prev_position') else np.zeros(5)
-        self.acceleration = (self.velocity - self.prev_velocity) / dt if hasattr(self, 'prev_velocity') else np.zeros(5)
-        
-        self.prev_position = self.current_position.copy()
-        self.prev_velocity = self.velocity.copy()
         
         return final_control
 
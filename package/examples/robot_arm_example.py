@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
 from cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig
+from cerebellum.array_memory import ArrayMemory
 
 
 class SimplePID:
@@ -39,38 +40,6 @@ class SimplePID:
         return p_term + i_term + d_term
 
 
-class MockMemory:
-    """해마 메모리 모의 객체"""
-    def __init__(self):
-        self.memories = {}
-    
-    def retrieve(self, key, context=None):
-        """기억 검색"""
-        if len(self.memories) == 0:
-            return []
-        
-        best_match = None
-        best_distance = float('inf')
-        
-        for stored_key, (value, conf) in self.memories.items():
-            distance = np.linalg.norm(key - np.array(stored_key))
-            if distance < best_distance:
-                best_distance = distance
-                adjusted_confidence = conf * (1.0 / (1.0 + distance))
-                best_match = {
-                    'bias': value,
-                    'confidence': adjusted_confidence
-                }
-        
-        if best_match and best_distance < 0.1:
-            return [best_match]
-        return []
-    
-    def store(self, key, value, confidence=0.9, context=None):
-        """기억 저장"""
-        self.memories[tuple(key)] = (value, confidence)
-
-
 class RobotArmController:
     """로봇 팔 제어기 (PID + Cerebellum)"""
     
@@ -79,7 +48,7 @@ class RobotArmController:
         self.pid = SimplePID(kp=1.0, ki=0.1, kd=0.05)
         
         # 해마 메모리
-        self.memory = MockMemory()
+        self.memory = ArrayMemory()
         
         # 소뇌 엔진
         config = CerebellumConfig(
@@ -93,8 +62,6 @@ class RobotArmController:
         
         # 상태 추적 (6축 로봇 팔: [x, y, z, roll, pitch, yaw])
         self.current_joints = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
-        self.velocity = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
-        self.acceleration = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
     
     def control_step(self, target_joints, payload_weight=0.0, dt=0.001):
         """
@@ -118,8 +85,8 @@ class RobotArmController:
         cerebellum_correction = self.cerebellum.compute_correction(
             current_state=self.current_joints,
             target_state=target_joints,
-            velocity=self.velocity,
-            acceleration=self.acceleration,
+            velocity=None,  # ⭐ v0.7: 엔진의 추정기가 틱당 한 번 계산
+            acceleration=None,
             context={'payload': payload_weight, 'mode': 'robot_arm'},
             dt=dt
         )
@@ -129,11 +96,6 @@ class RobotArmController:
         
         # 상태 업데이트 (시뮬레이션)
         self.current_joints += final_control * dt
-        self.velocity = (self.current_joints - self.prev_joints) / dt if hasattr(self, 'prev_joints') else np.zeros(6)
-        self.acceleration = (self.velocity - self.prev_velocity) / dt if hasattr(self, 'prev_velocity') else np.zeros(6)
-        
-        self.prev_joints = self.current_joints.copy()
-        self.prev_velocity = self.velocity.copy()
         
         # 안정 구간에서 기억 저장
         if np.linalg.norm(error) < 0.01:
@@ -199,7 +161,7 @@ def demo_robot_arm():
     print(f"평균 오차: {np.mean(errors):.6f}")
     print(f"최대 오차: {np.max(errors):.6f}")
     print(f"평균 보정: {np.mean(corrections):.6f}")
-    print(f"저장된 기억 수: {len(controller.memory.memories)}")
+    print(f"저장된 기억 수: {len(controller.memory)}")
     print("=" * 70)
     
     if np.mean(errors) < 0.01:
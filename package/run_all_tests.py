@@ -44,6 +44,7 @@ def main():
     tests = [
         ("test_cerebellum_standalone.py", "독립 테스트"),
         ("test_v0.6_features.py", "v0.6 기능 테스트"),
+        ("test_performance.py", "v0.7 성능 기능 테스트"),
     ]
     
     results = []
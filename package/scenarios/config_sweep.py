@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+CerebellumConfig 병렬 탐색 (Config Sweep)
+
+목표: feedforward_gain, trial_gain, variance_gain, memory_gain,
+      max_correction_norm 등을 시나리오 스크립트를 고치지 않고 한 번에 탐색
+
+================================================================================
+구성
+================================================================================
+- grid_configs / random_configs: 파라미터 격자 또는 무작위 탐색 설정 목록
+- run_sweep: 설정마다 시나리오를 프로세스 풀에서 실행
+  - 작업마다 SeedSequence.spawn으로 독립 seed
+  - 완료되는 순서대로 결과 행을 스트리밍 (on_result 콜백, CSV)
+  - 명백히 나쁜 설정은 시행 도중 조기 종료 (발산, RMS 상한 초과)
+- SCENARIOS: 탐색 가능한 시나리오 (현재 'hovering')
+
+시나리오 함수 형식:
+    scenario(config, seed, n_trials, steps_per_trial, should_stop) -> metrics
+    should_stop(trial, trial_metrics) -> 종료 사유 문자열 또는 None
+
+실행:
+    python scenarios/config_sweep.py
+
+Author: GNJz
+Created: 2026-01-22
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import fields, replace
+import csv
+import itertools
+import math
+import numpy as np
+from cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig
+from hovering_learning import HoveringSimulator, HOVERING_CONFIG, make_hovering_memory, run_hovering_trial
+
+
+# 결과 표의 열 (params는 탐색한 파라미터 이름이 앞에 추가됨)
+RESULT_COLUMNS = ('rms_error', 'settling_time', 'overshoot', 'rms_correction', 'trials', 'stopped')
+
+_CONFIG_FIELDS = {f.name for f in fields(CerebellumConfig)}
+
+
+def _check_params(names):
+    unknown = [name for name in names if name not in _CONFIG_FIELDS]
+    if unknown:
+        raise ValueError(f"CerebellumConfig에 없는 파라미터: {unknown}")
+
+
+def grid_configs(grid, base=None):
+    """
+    파라미터 격자의 모든 조합
+
+    Args:
+        grid: {필드 이름: 값 목록}
+        base: 나머지 필드의 기준 설정 (None이면 기본값)
+
+    Returns:
+        [(params, config)] - params는 {필드 이름: 값}
+    """
+    _check_params(grid)
+    base = base or CerebellumConfig()
+    names = list(grid)
+    configs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = dict(zip(names, values))
+        configs.append((params, replace(base, **params)))
+    return configs
+
+
+def random_configs(space, n_samples, seed=0, base=None):
+    """
+    무작위 탐색 설정 (구간 내 균등 분포)
+
+    Args:
+        space: {필드 이름: (low, high)}
+        n_samples: 설정 개수
+        seed: 샘플링 seed
+        base: 나머지 필드의 기준 설정 (None이면 기본값)
+
+    Returns:
+        [(params, config)]
+    """
+    _check_params(space)
+    base = base or CerebellumConfig()
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(n_samples):
+        params = {name: float(rng.uniform(low, high)) for name, (low, high) in space.items()}
+        configs.append((params, replace(base, **params)))
+    return configs
+
+
+class EarlyStop:
+    """
+    조기 종료 기준 (시행 단위)
+
+    - RMS 오차가 유한하지 않음 (발산)
+    - RMS 오차 > max_rms_error
+    - min_trials 이후 RMS 오차 > 첫 시행 × divergence_ratio (학습할수록 악화)
+    """
+
+    def __init__(self, max_rms_error=math.inf, divergence_ratio=2.0, min_trials=3):
+        self.max_rms_error = max_rms_error
+        self.divergence_ratio = divergence_ratio
+        self.min_trials = min_trials
+        self.first_rms_error = None
+
+    def __call__(self, trial, trial_metrics):
+        rms_error = trial_metrics['rms_error']
+        if not math.isfinite(rms_error):
+            return 'diverged'
+        if rms_error > self.max_rms_error:
+            return 'rms_limit'
+        if self.first_rms_error is None:
+            self.first_rms_error = rms_error
+        elif trial + 1 >= self.min_trials and rms_error > self.first_rms_error * self.divergence_ratio:
+            return 'worsening'
+        return None
+
+
+def hovering_scenario(config, seed, n_trials, steps_per_trial, should_stop=None):
+    """
+    호버링 학습 시나리오 (출력 없음)
+
+    seed로 시행마다 초기 상태를 교란하므로 작업마다 다른 궤적을 봅니다.
+    해마 메모리는 learn_hovering과 같은 make_hovering_memory()를 씁니다.
+
+    Returns:
+        metrics: 마지막 시행들(최대 10개) 평균 rms_error, settling_time,
+                 overshoot, rms_correction + trials, stopped
+    """
+    rng = np.random.default_rng(seed)
+    memory = make_hovering_memory()
+    simulator = HoveringSimulator(CerebellumEngine(memory_dim=5, config=config, memory=memory))
+
+    history = []
+    stopped = None
+    with np.errstate(all='ignore'):
+        for trial in range(n_trials):
+            metrics = run_hovering_trial(simulator, memory, trial, steps_per_trial, rng=rng, noise_std=0.002)
+            if metrics['settling_time'] is None:
+                metrics['settling_time'] = steps_per_trial * 0.001
+            history.append(metrics)
+            if should_stop is not None:
+                stopped = should_stop(trial, metrics)
+                if stopped:
+                    break
+
+    tail = history[-10:]
+    summary = {
+        name: float(np.mean([m[name] for m in tail]))
+        for name in ('rms_error', 'settling_time', 'overshoot', 'rms_correction')
+    }
+    summary['trials'] = len(history)
+    summary['stopped'] = stopped or ''
+    return summary
+
+
+# 탐색 가능한 시나리오 (프로세스 풀로 보내므로 모듈 최상위 함수여야 함)
+SCENARIOS = {
+    'hovering': hovering_scenario,
+}
+
+
+def _run_one(index, scenario_name, params, config, seed, n_trials, steps_per_trial, early_stop):
+    """작업자 프로세스에서 설정 하나 실행"""
+    should_stop = EarlyStop(**early_stop) if early_stop is not None else None
+    metrics = SCENARIOS[scenario_name](config, seed, n_trials, steps_per_trial, should_stop)
+    return index, params, metrics
+
+
+def run_sweep(
+    configs,
+    scenario='hovering',
+    n_trials=10,
+    steps_per_trial=300,
+    seed=0,
+    max_workers=None,
+    early_stop=None,
+    on_result=None,
+    csv_path=None
+):
+    """
+    설정 목록을 프로세스 풀에서 실행
+
+    Args:
+        configs: [(params, config)] (grid_configs / random_configs 결과)
+        scenario: SCENARIOS의 키
+        n_trials: 설정당 학습 시행 수
+        steps_per_trial: 시행당 스텝 수
+        seed: 기준 seed (작업별 seed는 SeedSequence(seed).spawn으로 생성)
+        max_workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+        early_stop: EarlyStop 인자 dict (None이면 {}: 발산/악화만 종료, False면 비활성)
+        on_result: 완료된 행마다 호출 (row dict)
+        csv_path: 결과 행을 완료 순서대로 기록할 CSV 경로
+
+    Returns:
+        rows: 설정 순서대로 정렬한 결과 행 [{'index', 'seed', 파라미터..., 지표...}]
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"알 수 없는 시나리오: {scenario!r} (지원: {list(SCENARIOS)})")
+    if early_stop is None:
+        early_stop = {}
+    elif early_stop is False:
+        early_stop = None
+
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(len(configs))]
+    param_names = list(dict.fromkeys(name for params, _ in configs for name in params))
+    jobs = [
+        (index, scenario, params, config, seeds[index], n_trials, steps_per_trial, early_stop)
+        for index, (params, config) in enumerate(configs)
+    ]
+
+    rows = []
+    csv_file = open(csv_path, 'w', newline='') if csv_path else None
+    try:
+        writer = None
+        if csv_file is not None:
+            writer = csv.DictWriter(csv_file, fieldnames=['index', 'seed', *param_names, *RESULT_COLUMNS])
+            writer.writeheader()
+
+        def collect(index, params, metrics):
+            row = {'index': index, 'seed': seeds[index], **params, **metrics}
+            rows.append(row)
+            if writer is not None:
+                writer.writerow(row)
+                csv_file.flush()
+            if on_result is not None:
+                on_result(row)
+
+        if max_workers == 1:
+            for job in jobs:
+                collect(*_run_one(*job))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_run_one, *job) for job in jobs]
+                for future in as_completed(futures):
+                    collect(*future.result())
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+
+    rows.sort(key=lambda row: row['index'])
+    return rows
+
+
+def format_row(row, param_names):
+    """결과 표 한 줄"""
+    params = ' '.join(f"{row[name]:>8.3f}" for name in param_names)
+    return (f"{row['index']:>4} | {params} | {row['rms_error']:>10.6f} | {row['settling_time']:>8.3f}s | "
+            f"{row['overshoot']:>8.2f}% | {row['trials']:>6} {row['stopped']}")
+
+
+def main():
+    """메인 함수: 호버링 설정 격자 탐색"""
+    grid = {
+        'feedforward_gain': [0.2, 0.5, 0.8],
+        'trial_gain': [0.1, 0.3],
+        'memory_gain': [0.2, 0.4],
+    }
+    configs = grid_configs(grid, base=HOVERING_CONFIG)
+    param_names = list(grid)
+
+    print("=" * 70)
+    print(f"CerebellumConfig 탐색: 호버링, {len(configs)}개 설정")
+    print("=" * 70)
+    print(f"{'#':>4} | {' '.join(f'{name[:8]:>8}' for name in param_names)} | "
+          f"{'RMS Error':>10} | {'Settling':>9} | {'Overshoot':>9} | {'Trials':>6}")
+    print("-" * 70)
+
+    rows = run_sweep(
+        configs,
+        n_trials=10,
+        steps_per_trial=300,
+        early_stop={'divergence_ratio': 1.5},
+        on_result=lambda row: print(format_row(row, param_names), flush=True),
+    )
+
+    best = min(rows, key=lambda row: row['rms_error'])
+    print("-" * 70)
+    print("최적 설정 (RMS Error 기준):")
+    print(format_row(best, param_names))
+
+
+if __name__ == "__main__":
+    main()
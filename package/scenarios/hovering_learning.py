@@ -14,63 +14,22 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
 from cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig
+from cerebellum.bounded_memory import BoundedMemory
 
 
-class MockMemory:
-    """
-    해마 메모리 모의 객체 (Hovering 시뮬레이터용)
-    
-    실제 해마 메모리 대신 간단한 구현을 사용하여
-    소뇌 엔진의 기억 기반 적응 기능을 테스트합니다.
-    """
-    def __init__(self):
-        self.memories = {}  # {tuple(state): (bias, confidence)}
-    
-    def retrieve(self, key, context=None):
-        """
-        기억 검색
-        
-        Args:
-            key: 현재 상태 (검색 키)
-            context: 맥락 정보 (선택적)
-        
-        Returns:
-            memories: 기억 리스트 [{'bias': ..., 'confidence': ...}]
-        """
-        if len(self.memories) == 0:
-            return []
-        
-        best_match = None
-        best_distance = float('inf')
-        
-        # 유클리드 거리 기반 최근접 이웃 검색
-        for stored_key, (value, conf) in self.memories.items():
-            distance = np.linalg.norm(key - np.array(stored_key))
-            if distance < best_distance:
-                best_distance = distance
-                # 거리에 따라 confidence 감소
-                adjusted_confidence = conf * (1.0 / (1.0 + distance))
-                best_match = {
-                    'bias': value,
-                    'confidence': adjusted_confidence
-                }
-        
-        # 거리 임계값 이내면 반환
-        if best_match and best_distance < 0.1:
-            return [best_match]
-        return []
-    
-    def store(self, key, value, confidence=0.9, context=None):
-        """
-        기억 저장
-        
-        Args:
-            key: 상태 (저장 키)
-            value: bias 값
-            confidence: 신뢰도 [0.0, 1.0]
-            context: 맥락 정보 (선택적)
-        """
-        self.memories[tuple(key)] = (value, confidence)
+# 호버링 기본 설정
+HOVERING_CONFIG = CerebellumConfig(
+    feedforward_gain=0.5,
+    trial_gain=0.3,
+    variance_gain=0.2,
+    memory_gain=0.4,
+    max_correction_norm=1.0  # 호버링용 작은 값
+)
+
+
+def make_hovering_memory():
+    """호버링 학습용 해마 메모리 (안정 구간마다 저장하므로 용량 제한 + LRU 퇴출)"""
+    return BoundedMemory(max_entries=20000, eviction='lru')
 
 
 class HoveringSimulator:
@@ -137,8 +96,79 @@ class HoveringSimulator:
         }
 
 
-def learn_hovering(n_trials=100, steps_per_trial=1000):
-    """호버링 학습"""
+def run_hovering_trial(simulator, memory, trial, steps_per_trial=1000, dt=0.001, rng=None, noise_std=0.0):
+    """
+    호버링 시행 한 번 실행 (시뮬레이터 리셋 → 스텝 반복 → 안정 구간 기억 저장)
+    
+    Args:
+        simulator: HoveringSimulator
+        memory: 해마 메모리 (store 지원)
+        trial: 시행 번호 (기억의 context에 기록)
+        steps_per_trial: 시행당 스텝 수
+        dt: 시간 간격
+        rng: 초기 상태 교란용 np.random.Generator (None이면 교란 없음)
+        noise_std: 초기 상태 교란 표준편차
+    
+    Returns:
+        metrics: rms_error, rms_correction, settling_time (None이면 미수렴),
+                 overshoot (목표 높이 대비 %), last_step (마지막 스텝 결과)
+    """
+    # 시뮬레이터 리셋
+    simulator.current_state = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
+    if rng is not None and noise_std > 0:
+        simulator.current_state += rng.normal(0.0, noise_std, 5)
+    simulator.velocity = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
+    simulator.acceleration = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
+    
+    error_squared_sum = 0.0
+    correction_squared_sum = 0.0
+    settling_time = None
+    target_threshold = 0.01  # 목표 오차 임계값
+    target_height = simulator.target_state[2]
+    max_height = -np.inf
+    
+    for step in range(steps_per_trial):
+        result = simulator.step(dt=dt)
+        error_norm = np.linalg.norm(result['error'])
+        correction_norm = np.linalg.norm(result['correction'])
+        
+        error_squared_sum += error_norm ** 2
+        correction_squared_sum += correction_norm ** 2
+        max_height = max(max_height, result['state'][2])
+        
+        # ⭐ 해마에 기억 저장 (안정 구간에서만)
+        # 목표 오차가 작을 때만 저장하여 정확한 기억 형성
+        if error_norm < 0.05:  # 안정 구간
+            # 현재 상태와 오차를 기억으로 저장
+            memory.store(
+                key=simulator.current_state,
+                value=result['error'],  # 오차를 bias로 저장
+                confidence=0.9 - error_norm * 10,  # 오차가 작을수록 높은 confidence
+                context={'mode': 'hovering', 'trial': trial}
+            )
+        
+        # Settling time 계산 (목표 오차 이하로 떨어지는 시간)
+        if settling_time is None and error_norm < target_threshold:
+            settling_time = step * dt  # 초 단위
+    
+    return {
+        'rms_error': np.sqrt(error_squared_sum / steps_per_trial),
+        'rms_correction': np.sqrt(correction_squared_sum / steps_per_trial),
+        'settling_time': settling_time,
+        'overshoot': max(0.0, (max_height - target_height) / abs(target_height) * 100),
+        'last_step': result,
+    }
+
+
+def learn_hovering(n_trials=100, steps_per_trial=1000, config=None):
+    """
+    호버링 학습
+    
+    Args:
+        n_trials: 학습 시행 수
+        steps_per_trial: 시행당 스텝 수
+        config: CerebellumConfig (None이면 호버링 기본 설정, config_sweep.py로 탐색)
+    """
     print("\n" + "=" * 70)
     print("호버링 학습 시나리오")
     print("=" * 70)
@@ -148,16 +178,10 @@ def learn_hovering(n_trials=100, steps_per_trial=1000):
     print("=" * 70)
     
     # 해마 메모리 생성 (학습용)
-    memory = MockMemory()
+    memory = make_hovering_memory()
     
     # 소뇌 엔진 생성 (해마 메모리 연결)
-    config = CerebellumConfig(
-        feedforward_gain=0.5,
-        trial_gain=0.3,
-        variance_gain=0.2,
-        memory_gain=0.4,
-        max_correction_norm=1.0  # 호버링용 작은 값
-    )
+    config = config or HOVERING_CONFIG
     cerebellum = CerebellumEngine(memory_dim=5, config=config, memory=memory)
     
     # 시뮬레이터 생성
@@ -173,48 +197,11 @@ def learn_hovering(n_trials=100, steps_per_trial=1000):
     print("-" * 70)
     
     for trial in range(n_trials):
-        # 시뮬레이터 리셋
-        simulator.current_state = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
-        simulator.velocity = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
-        simulator.acceleration = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
-        
-        trial_error_sum = 0.0
-        trial_correction_sum = 0.0
-        error_squared_sum = 0.0
-        correction_squared_sum = 0.0
-        settling_time = None
-        target_threshold = 0.01  # 목표 오차 임계값
-        
-        for step in range(steps_per_trial):
-            result = simulator.step(dt=0.001)
-            error_norm = np.linalg.norm(result['error'])
-            correction_norm = np.linalg.norm(result['correction'])
-            
-            trial_error_sum += error_norm
-            trial_correction_sum += correction_norm
-            error_squared_sum += error_norm ** 2
-            correction_squared_sum += correction_norm ** 2
-            
-            # ⭐ 해마에 기억 저장 (안정 구간에서만)
-            # 목표 오차가 작을 때만 저장하여 정확한 기억 형성
-            if error_norm < 0.05:  # 안정 구간
-                # 현재 상태와 오차를 기억으로 저장
-                memory.store(
-                    key=simulator.current_state,
-                    value=result['error'],  # 오차를 bias로 저장
-                    confidence=0.9 - error_norm * 10,  # 오차가 작을수록 높은 confidence
-                    context={'mode': 'hovering', 'trial': trial}
-                )
-            
-            # Settling time 계산 (목표 오차 이하로 떨어지는 시간)
-            if settling_time is None and error_norm < target_threshold:
-                settling_time = step * 0.001  # 초 단위
-        
-        # RMS 계산
-        avg_error = trial_error_sum / steps_per_trial
-        rms_error = np.sqrt(error_squared_sum / steps_per_trial)
-        avg_correction = trial_correction_sum / steps_per_trial
-        rms_correction = np.sqrt(correction_squared_sum / steps_per_trial)
+        metrics = run_hovering_trial(simulator, memory, trial, steps_per_trial)
+        rms_error = metrics['rms_error']
+        rms_correction = metrics['rms_correction']
+        settling_time = metrics['settling_time']
+        result = metrics['last_step']
         
         trial_errors.append(rms_error)
         trial_corrections.append(rms_correction)
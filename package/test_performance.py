@@ -0,0 +1,2037 @@
+#!/usr/bin/env python3
+"""
+v0.7 성능 기능 테스트
+
+1. 링 버퍼 이동 평균 (Variance 감소)
+2. Batch 엔진 (N개 독립 엔진과 동일성)
+3. 오프라인 궤적 모드 (compute_corrections)
+4. 할당 없는 compute_correction (out=, tracemalloc 검증)
+5. 융합 보정 커널 (설정 변경 시 재컴파일)
+6. 단계별 지연 시간 계측
+7. 데드라인 모드 (기억 검색 시간 예산)
+8. 비동기 기억 prefetch (bounded staleness)
+9. 양자화 상태 LRU 캐시
+10. 메모리 장애 회로 차단기
+11. IIR 저주파 필터 (low_pass_cutoff)
+12. 속도/가속도 추정기 (alpha-beta-gamma, Savitzky-Golay)
+13. 다중 시간 스케일 (단계별 갱신 주기)
+14. 바이너리 스냅샷/복원 (웜 재시작)
+15. 저차원 스칼라 백엔드 (NumPy 백엔드와 동일성)
+16. 샤딩된 엔진 레지스트리 (스레드 안전, step_all, 해마 메모리 공유)
+17. 병렬 설정 탐색 (프로세스 풀, 조기 종료)
+18. 배열 기반 최근접 이웃 메모리 (MockMemory와 동일성, 스레드별 작업 버퍼로 동시 검색)
+19. 해시 격자 메모리 (삽입/삭제, 저장 개수와 무관한 검색 시간)
+20. KD-tree 메모리 (삽입 버퍼, 백그라운드 재생성, 검색 중 store)
+21. 용량 제한 메모리 (퇴출 정책, 근접 기억 통합)
+22. 일괄 기억 검색 retrieve_many (백엔드별 retrieve와 동일성, 엔진 통합)
+23. 파일 매핑 메모리 (지연 열기, 덧붙이기 확장, 다른 프로세스의 스냅샷)
+24. 맥락 분할 메모리 (분할 검색, 이웃 구간 대체, 엔진의 맥락 일치도 사용)
+25. 맥락 ID 등록부 (정규화/양자화, ID 입력과 dict 입력의 동일 출력, 분할 키로 사용)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import time
+import threading
+import tempfile
+import tracemalloc
+import numpy as np
+from collections import deque
+from dataclasses import FrozenInstanceError, replace
+from cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig
+from cerebellum.batch_engine import BatchCerebellumEngine
+from cerebellum.registry import EngineRegistry
+from cerebellum.prefetch import MemoryPrefetcher
+from cerebellum.array_memory import ArrayMemory
+from cerebellum.grid_memory import GridMemory
+from cerebellum.tree_memory import TreeMemory
+from cerebellum.bounded_memory import BoundedMemory
+from cerebellum.mapped_memory import MappedMemory
+from cerebellum.context_memory import ContextMemory
+from cerebellum.context_registry import ContextRegistry, NO_CONTEXT
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scenarios'))
+from config_sweep import grid_configs, random_configs, run_sweep, RESULT_COLUMNS
+from cerebellum.instrumentation import LatencyHistogram, STAGES
+from cerebellum import filters
+from cerebellum.estimators import (
+    FiniteDifferenceEstimator, AlphaBetaEstimator, SavitzkyGolayEstimator
+)
+
+
+class MockMemory:
+    """dict + Python 루프 최근접 이웃 메모리 (테스트 18에서 ArrayMemory와 비교하는 기준 구현)"""
+    def __init__(self):
+        self.memories = {}
+
+    def retrieve(self, key, context=None):
+        """기억 검색 (confidence 포함)"""
+        if len(self.memories) == 0:
+            return []
+
+        best_match = None
+        best_distance = float('inf')
+
+        for stored_key, (value, conf) in self.memories.items():
+            distance = np.linalg.norm(key - np.array(stored_key))
+            if distance < best_distance:
+                best_distance = distance
+                best_match = {
+                    'bias': value,
+                    'confidence': conf * (1.0 / (1.0 + distance))
+                }
+
+        if best_match and best_distance < 0.1:
+            return [best_match]
+        return []
+
+    def store(self, key, value, confidence=0.9, context=None):
+        """기억 저장 (confidence 포함)"""
+        self.memories[tuple(key)] = (value, confidence)
+
+
+class CountingMemory(ArrayMemory):
+    """retrieve 호출 횟수를 세는 ArrayMemory (캐시/prefetch/다중 주기 테스트용)"""
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def retrieve(self, key, context=None):
+        self.calls += 1
+        return super().retrieve(key, context)
+
+
+class FailingMemory:
+    """healthy가 False인 동안 예외를 던지는 메모리 (회로 차단기 테스트용)"""
+    def __init__(self, bias):
+        self.bias = bias
+        self.healthy = False
+        self.calls = 0
+
+    def retrieve(self, key, context=None):
+        self.calls += 1
+        if not self.healthy:
+            raise ConnectionError("memory backend unavailable")
+        return [{'bias': self.bias, 'confidence': 0.9}]
+
+
+class SlowMemory:
+    """검색마다 지정 시간만큼 지연되는 메모리 (데드라인 테스트용)"""
+    def __init__(self, delay, bias):
+        self.delay = delay
+        self.bias = bias
+        self.calls = 0
+
+    def retrieve(self, key, context=None):
+        self.calls += 1
+        time.sleep(self.delay)
+        return [{'bias': self.bias, 'confidence': 0.9}]
+
+
+def make_trajectory(n_steps, memory_dim=5, seed=0):
+    """테스트용 잡음 섞인 반복 궤적 (states, targets)"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_steps)[:, None] * 0.001
+    targets = np.sin(2 * np.pi * 5.0 * t + np.arange(memory_dim)) * 0.05
+    states = targets + rng.normal(0, 0.002, (n_steps, memory_dim))
+    return states, targets
+
+
+def test_ring_buffer_moving_average():
+    """링 버퍼 이동 평균이 기존 deque 평균과 일치하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 1: 링 버퍼 이동 평균")
+    print("=" * 70)
+
+    rng = np.random.default_rng(0)
+    for window in (1, 3, 5, 16):
+        engine = CerebellumEngine(memory_dim=5, config=CerebellumConfig(variance_window=window))
+        history = deque(maxlen=window)
+        target_state = np.array([1.0, 0.5, 0.3, 10.0, 5.0])
+
+        max_diff = 0.0
+        for _ in range(500):
+            current_state = target_state + rng.normal(0, 0.01, 5)
+            engine.compute_correction(current_state, target_state, dt=0.001)
+
+            error = target_state - current_state
+            history.append(error)
+            if len(history) < window:
+                expected = error
+            else:
+                expected = np.mean(np.array(list(history)), axis=0)
+            max_diff = max(max_diff, np.max(np.abs(engine.filtered_error - expected)))
+
+        print(f"   window={window:2d}: max |filtered - reference| = {max_diff:.3e}")
+        assert max_diff < 1e-12
+        assert len(engine.error_history) == window
+        assert np.allclose(engine.error_history[-1], history[-1])
+
+    engine.reset()
+    assert len(engine.error_history) == 0
+    print("✅ 링 버퍼 이동 평균 일치 확인!")
+
+
+def test_batch_engine_equivalence():
+    """Batch 엔진이 N개의 독립 CerebellumEngine과 같은 값을 내는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 2: Batch 엔진 동일성")
+    print("=" * 70)
+
+    configs = [
+        CerebellumConfig(),
+        CerebellumConfig(variance_window=3, feedforward_gain=0.7, max_correction_norm=0.05),
+        CerebellumConfig(variance_window=8, context_weight_enabled=False, memory_gain=0.8),
+        CerebellumConfig(variance_window=1, trial_gain=0.1, min_confidence=0.3),
+    ]
+    n = len(configs)
+    memory = ArrayMemory()
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        memory.store(rng.normal(0, 0.05, 5), rng.normal(0, 0.001, 5), confidence=0.8)
+
+    engines = [CerebellumEngine(memory_dim=5, config=c, memory=memory) for c in configs]
+    batch = BatchCerebellumEngine(n, memory_dim=5, configs=configs, memory=memory)
+    contexts = [None, {'tool': 'A'}, {'tool': 'B', 'temperature': 25.0}, {}]
+
+    states, targets = make_trajectory(300, seed=2)
+    max_diff = 0.0
+    for step in range(300):
+        if step == 150:
+            # 마스크 리셋: 0, 2번 행만 초기화
+            engines[0].reset()
+            engines[2].reset()
+            batch.reset(np.array([True, False, True, False]))
+        current = np.stack([states[step] + 0.01 * i for i in range(n)])
+        target = np.stack([targets[step]] * n)
+        expected = np.stack([
+            e.compute_correction(current[i], target[i], context=contexts[i], dt=0.001)
+            for i, e in enumerate(engines)
+        ])
+        actual = batch.compute_correction(current, target, contexts=contexts, dt=0.001)
+        max_diff = max(max_diff, np.max(np.abs(actual - expected)))
+
+    print(f"   max |batch - independent| = {max_diff:.3e}")
+    assert max_diff < 1e-12
+    print("✅ Batch 엔진 동일성 확인!")
+
+
+def test_offline_trajectory_mode():
+    """compute_corrections가 단계별 compute_correction과 같은 값/상태를 내는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 3: 오프라인 궤적 모드")
+    print("=" * 70)
+
+    memory = ArrayMemory()
+    rng = np.random.default_rng(3)
+    for _ in range(50):
+        memory.store(rng.normal(0, 0.05, 5), rng.normal(0, 0.001, 5), confidence=0.8)
+
+    config = CerebellumConfig(variance_window=7, max_correction_norm=0.5)
+    states, targets = make_trajectory(400, seed=4)
+    contexts = [{'tool': 'A'} if t % 3 else None for t in range(400)]
+
+    stepwise = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+    offline = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+
+    # 앞부분 몇 스텝은 두 엔진 모두 단계별로 진행 (이전 기록 이어받기 확인)
+    for t in range(3):
+        stepwise.compute_correction(states[t], targets[t], context=contexts[t], dt=0.001)
+        offline.compute_correction(states[t], targets[t], context=contexts[t], dt=0.001)
+
+    expected = np.array([
+        stepwise.compute_correction(states[t], targets[t], context=contexts[t], dt=0.001)
+        for t in range(3, 400)
+    ])
+    actual = offline.compute_corrections(states[3:], targets[3:], contexts=contexts[3:], dt=0.001)
+
+    max_diff = np.max(np.abs(actual - expected))
+    print(f"   max |offline - stepwise| = {max_diff:.3e}")
+    assert max_diff < 1e-9
+    assert np.allclose(offline.prev_state, stepwise.prev_state)
+    assert np.allclose(offline.prev_velocity, stepwise.prev_velocity)
+    assert np.allclose(offline.filtered_error, stepwise.filtered_error)
+    assert np.allclose(np.array(offline.error_history), np.array(stepwise.error_history))
+
+    # 이어지는 단계별 호출도 같은 결과
+    next_offline = offline.compute_correction(targets[0] + 0.001, targets[0], dt=0.001)
+    next_stepwise = stepwise.compute_correction(targets[0] + 0.001, targets[0], dt=0.001)
+    assert np.allclose(next_offline, next_stepwise, atol=1e-9)
+    print("✅ 오프라인 궤적 모드 동일성 확인!")
+
+
+def count_engine_blocks(snapshot):
+    """스냅샷에서 cerebellum 패키지가 할당한 블록 수"""
+    package_filter = tracemalloc.Filter(True, os.path.join('*', 'cerebellum', '*'))
+    return sum(stat.count for stat in snapshot.filter_traces([package_filter]).statistics('filename'))
+
+
+def test_allocation_free_correction():
+    """out=을 사용하면 정상 상태 틱에서 새 블록을 할당하지 않는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 4: 할당 없는 compute_correction")
+    print("=" * 70)
+
+    # 기본 백엔드('auto')도 out=을 받으면 NumPy 경로 (스칼라 경로는 Python float를 할당)
+    config = CerebellumConfig(max_correction_norm=0.01)
+    engine = CerebellumEngine(memory_dim=5, config=config)
+    assert engine.backend == 'scalar'
+    reference = CerebellumEngine(memory_dim=5, config=replace(config, backend='numpy'))
+    states, targets = make_trajectory(2000, seed=5)
+    out = np.empty(5)
+
+    # 결과는 out 없이 계산한 값과 같아야 함
+    for t in range(50):
+        result = engine.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001, out=out)
+        assert result is out
+        expected = reference.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+        assert np.array_equal(out, expected)
+
+    # 정상 상태까지 진행 (틱 카운터가 작은 정수 캐시를 벗어날 때까지)
+    context = {'tool': 'A'}
+    for t in range(50, 300):
+        engine.compute_correction(states[t], targets[t], context=context, dt=0.001, out=out)
+
+    tracemalloc.start()
+    try:
+        for t in range(300, 310):
+            engine.compute_correction(states[t], targets[t], context=context, dt=0.001, out=out)
+        before = count_engine_blocks(tracemalloc.take_snapshot())
+        for t in range(310, 2000):
+            engine.compute_correction(states[t], targets[t], context=context, dt=0.001, out=out)
+        after = count_engine_blocks(tracemalloc.take_snapshot())
+    finally:
+        tracemalloc.stop()
+
+    print(f"   1690 틱 동안 새로 할당된 블록: {after - before}")
+    assert after - before == 0
+
+    # 공개 상태는 복사본: 보관한 값이 다음 틱의 버퍼 갱신으로 바뀌지 않음
+    for backend in ('numpy', 'scalar'):
+        engine = CerebellumEngine(memory_dim=5, config=replace(config, backend=backend))
+        engine.compute_correction(states[0], targets[0], dt=0.001)
+        engine.compute_correction(states[1], targets[1], dt=0.001)
+        kept = (engine.prev_state, engine.prev_velocity, engine.filtered_error)
+        copies = [value.copy() for value in kept]
+        engine.compute_correction(states[2], targets[2], dt=0.001, out=out)
+        assert all(np.array_equal(value, copy) for value, copy in zip(kept, copies))
+        assert np.array_equal(engine.prev_state, states[2])
+        kept[0][:] = 99.0  # 반환값을 바꿔도 엔진 상태는 그대로
+        assert np.array_equal(engine.prev_state, states[2])
+    print("✅ 할당 없는 compute_correction 확인!")
+
+
+def test_fused_kernel_recompile():
+    """설정을 바꾸면 융합 커널이 새 설정으로 다시 만들어지는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 5: 융합 보정 커널 재컴파일")
+    print("=" * 70)
+
+    old_config = CerebellumConfig()
+    new_config = CerebellumConfig(feedforward_gain=0.8, trial_gain=0.1, variance_gain=0.4,
+                                  prediction_horizon=0.02, correction_weight=0.7)
+    switched = CerebellumEngine(memory_dim=5, config=old_config)
+    fresh = CerebellumEngine(memory_dim=5, config=new_config)
+    states, targets = make_trajectory(100, seed=6)
+
+    for t in range(50):
+        switched.compute_correction(states[t], targets[t], dt=0.001)
+        fresh.compute_correction(states[t], targets[t], dt=0.001)
+
+    kernel_before = switched._kernel
+    switched.update_config(feedforward_gain=0.8, trial_gain=0.1, variance_gain=0.4,
+                           prediction_horizon=0.02, correction_weight=0.7)
+    assert switched._kernel is not kernel_before
+    assert switched.config == new_config
+
+    for t in range(50, 100):
+        a = switched.compute_correction(states[t], targets[t], dt=0.001)
+        b = fresh.compute_correction(states[t], targets[t], dt=0.001)
+        assert np.array_equal(a, b)
+
+    # variance_window 변경: 최근 기록 유지
+    switched.update_config(variance_window=3)
+    assert len(switched.error_history) == 3
+    assert np.array_equal(switched.error_history[-1], fresh.error_history[-1])
+
+    # 설정은 불변: 제자리 수정은 커널에 반영되지 않고 무시되는 대신 바로 실패
+    try:
+        switched.config.trial_gain = 0.5
+        raise AssertionError("설정 필드 대입이 허용됨")
+    except FrozenInstanceError:
+        pass
+    assert switched.config.trial_gain == 0.1
+    print("✅ 융합 커널 재컴파일 확인!")
+
+
+def test_stage_profiling():
+    """단계별 계측이 모든 단계를 기록하고 스냅샷을 제공하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 6: 단계별 지연 시간 계측")
+    print("=" * 70)
+
+    histogram = LatencyHistogram()
+    for ns in range(1, 10001):
+        histogram.record(ns)
+    # 로그 구간 해상도(25%) 이내
+    assert 5000 <= histogram.percentile(50) <= 5000 * 1.25
+    assert 9900 <= histogram.percentile(99) <= 9900 * 1.25
+    assert histogram.max_ns == 10000
+
+    engine = CerebellumEngine(memory_dim=5, memory=ArrayMemory())
+    states, targets = make_trajectory(200, seed=7)
+    engine.compute_correction(states[0], targets[0], dt=0.001)
+    assert engine.profiler is None
+
+    profiler = engine.enable_profiling()
+    for t in range(1, 200):
+        engine.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+
+    stats = profiler.snapshot()
+    for stage in STAGES:
+        print(f"   {stage:12s}: p50={stats[stage]['p50_us']:8.2f}us  "
+              f"p99={stats[stage]['p99_us']:8.2f}us  max={stats[stage]['max_us']:8.2f}us")
+        assert stats[stage]['count'] == 199
+        assert stats[stage]['p50_us'] <= stats[stage]['p99_us']
+    assert stats['total']['max_us'] >= stats['memory']['max_us']
+
+    engine.disable_profiling()
+    engine.compute_correction(states[0], targets[0], dt=0.001)
+    assert profiler.snapshot()['total']['count'] == 199
+    print("✅ 단계별 지연 시간 계측 확인!")
+
+
+def test_deadline_mode():
+    """기억 검색이 예산을 넘으면 마지막 기억/0 벡터로 대체하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 7: 데드라인 모드")
+    print("=" * 70)
+
+    bias = np.array([0.01, -0.02, 0.0, 0.0, 0.005])
+    states, targets = make_trajectory(120, seed=8)
+
+    for fallback in ('last', 'zero'):
+        config = CerebellumConfig(memory_deadline=0.0005, deadline_fallback=fallback,
+                                  deadline_probe_interval=50)
+        memory = SlowMemory(delay=0.002, bias=bias)
+        engine = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+
+        # 대체값을 직접 넣은 기준 엔진 (검색 없이 같은 bias/confidence)
+        fallback_bias = bias if fallback == 'last' else np.zeros(5)
+        fallback_conf = 0.9 if fallback == 'last' else 0.0
+        reference = CerebellumEngine(memory_dim=5, config=CerebellumConfig())
+
+        for t in range(120):
+            actual = engine.compute_correction(states[t], targets[t], dt=0.001)
+            if t in (0, 51, 102):
+                # 첫 틱과 재측정(probe) 틱은 실제 검색
+                reference._get_memory_bias = lambda *_: (bias, 0.9, None)
+            else:
+                reference._get_memory_bias = lambda *_: (fallback_bias, fallback_conf, None)
+            expected = reference.compute_correction(states[t], targets[t], dt=0.001)
+            assert np.allclose(actual, expected, atol=1e-15), t
+
+        stats = engine.get_deadline_stats()
+        print(f"   fallback={fallback}: 검색 {memory.calls}회, degraded={stats['degraded']}, "
+              f"overruns={stats['overruns']}, ratio={stats['degraded_ratio']:.2f}")
+        assert memory.calls == 3
+        assert stats['ticks'] == 120
+        assert stats['degraded'] == 117
+        assert stats['overruns'] == 3
+
+    # 빠른 메모리는 건너뛰지 않음
+    engine = CerebellumEngine(memory_dim=5, config=CerebellumConfig(memory_deadline=0.5),
+                              memory=SlowMemory(delay=0.0, bias=bias))
+    for t in range(20):
+        engine.compute_correction(states[t], targets[t], dt=0.001)
+    assert engine.get_deadline_stats()['degraded'] == 0
+    print("✅ 데드라인 모드 확인!")
+
+
+def test_async_prefetch():
+    """백그라운드 검색 결과를 staleness 한도 안에서만 사용하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 8: 비동기 기억 prefetch")
+    print("=" * 70)
+
+    bias = np.array([0.01, -0.02, 0.0, 0.0, 0.005])
+    memory = SlowMemory(delay=0.002, bias=bias)
+    engine = CerebellumEngine(memory_dim=5, memory=memory)
+    prefetcher = engine.enable_prefetch(max_staleness=3)
+    states, targets = make_trajectory(200, seed=9)
+
+    call_times = []
+    staleness_seen = []
+    try:
+        for t in range(200):
+            start = time.perf_counter()
+            engine.compute_correction(states[t], targets[t], dt=0.001)
+            call_times.append(time.perf_counter() - start)
+            staleness_seen.append(engine.last_memory_staleness)
+            time.sleep(0.001)  # 1 kHz 제어 주기 흉내
+    finally:
+        engine.disable_prefetch()
+
+    stats = prefetcher.get_stats()
+    print(f"   검색 완료 {stats['completed']}회, 사용 {stats['used']}회, 버림 {stats['dropped']}회")
+    print(f"   staleness 분포: {stats['staleness_histogram']}, 평균 {stats['mean_staleness']:.2f}")
+    print(f"   compute_correction 중앙값: {np.median(call_times) * 1e6:.1f}us (검색 지연 2000us)")
+
+    assert stats['used'] > 0
+    assert stats['used'] + stats['dropped'] == 200
+    assert engine.tick_count == 200
+    assert not prefetcher.running
+    # 검색 지연이 제어 스레드에 나타나지 않아야 함
+    assert np.median(call_times) < memory.delay / 2
+
+    # lookup 예외: 스레드는 계속 동작하고 미적중(최신 틱)을 게시
+    failures = [2]
+
+    def flaky_lookup(state, context):
+        if failures[0] > 0:
+            failures[0] -= 1
+            raise RuntimeError("lookup failed")
+        return bias, 0.9, None
+
+    flaky = MemoryPrefetcher(flaky_lookup, max_staleness=3).start()
+    try:
+        for tick in range(3):
+            flaky.submit(np.zeros(5), None, tick)
+            deadline = time.perf_counter() + 1.0
+            while flaky.completed <= tick and time.perf_counter() < deadline:
+                time.sleep(0.0005)
+            result = flaky.consume(tick)
+            assert result is not None and result[3] == 0  # 오래된 결과가 아닌 이번 요청의 결과
+            if tick < 2:
+                assert result[1] == 0.0 and not result[0].any()
+            else:
+                assert np.array_equal(result[0], bias) and result[1] == 0.9
+        assert flaky.running and flaky.get_stats()['errors'] == 2
+        assert 'lookup failed' in flaky.get_stats()['last_error']
+    finally:
+        flaky.stop()
+
+    # 캐시/차단기는 prefetch 스레드와 제어 스레드가 동시에 써도 일관됨
+    shared = CountingMemory()
+    rng = np.random.default_rng(8)
+    for _ in range(20):
+        shared.store(rng.normal(0, 0.05, 5), rng.normal(0, 0.001, 5), confidence=0.8)
+    engine = CerebellumEngine(memory_dim=5, memory=shared)
+    engine.enable_memory_cache(resolution=1e-6)
+    engine.enable_prefetch(max_staleness=3)
+    try:
+        for t in range(2000):
+            engine.compute_correction(states[t % 200], targets[t % 200], dt=0.001)  # 백그라운드 검색
+            engine._get_memory_bias(states[(t * 7) % 200], None)  # 제어 스레드에서도 검색
+            if t % 50 == 0:
+                engine.invalidate_memory_cache()
+    finally:
+        engine.disable_prefetch()
+    breaker = engine.memory_breaker
+    assert breaker.total_successes == shared.calls and breaker.total_failures == 0
+    print("✅ 비동기 기억 prefetch 확인!")
+
+
+def test_memory_bias_cache():
+    """반복 궤적에서 캐시가 검색을 건너뛰고, 기록 시 무효화되는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 9: 양자화 상태 LRU 캐시")
+    print("=" * 70)
+
+    memory = CountingMemory()
+    rng = np.random.default_rng(10)
+    for _ in range(50):
+        memory.store(rng.normal(0, 0.05, 5), rng.normal(0, 0.001, 5), confidence=0.8)
+
+    cached = CerebellumEngine(memory_dim=5, memory=memory)
+    uncached = CerebellumEngine(memory_dim=5, memory=memory)
+    cache = cached.enable_memory_cache(resolution=1e-4, max_entries=1000)
+    states, targets = make_trajectory(100, seed=11)
+
+    for repeat in range(3):
+        for t in range(100):
+            a = cached.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+            b = uncached.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+            assert np.array_equal(a, b)
+
+    stats = cache.get_stats()
+    print(f"   반복 3회: hits={stats['hits']}, misses={stats['misses']}, hit_rate={stats['hit_rate']:.2f}")
+    assert stats['misses'] == 100
+    assert stats['hits'] == 200
+
+    # 기록 → version 변경 → 무효화
+    memory.store(states[0], np.full(5, 0.003), confidence=0.95)
+    calls_before = memory.calls
+    cached.compute_correction(states[0], targets[0], context={'tool': 'A'}, dt=0.001)
+    assert memory.calls == calls_before + 1
+    assert len(cache) == 1
+
+    # 다른 맥락은 다른 키
+    cached.compute_correction(states[0], targets[0], context={'tool': 'B'}, dt=0.001)
+    assert len(cache) == 2
+
+    # LRU 크기 제한
+    small = CerebellumEngine(memory_dim=5, memory=memory)
+    small_cache = small.enable_memory_cache(resolution=1e-4, max_entries=10)
+    for t in range(100):
+        small.compute_correction(states[t], targets[t], dt=0.001)
+    assert len(small_cache) == 10
+    assert small_cache.get_stats()['evictions'] == 90
+    print("✅ 양자화 상태 LRU 캐시 확인!")
+
+
+def test_memory_circuit_breaker():
+    """연속 실패 시 차단하고, cooldown 후 시험 검색(지수 backoff)하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 10: 메모리 장애 회로 차단기")
+    print("=" * 70)
+
+    config = CerebellumConfig(memory_failure_threshold=3, memory_breaker_cooldown=10,
+                              memory_breaker_backoff=2.0, memory_breaker_max_cooldown=30)
+    memory = FailingMemory(bias=np.full(5, 0.001))
+    engine = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+    breaker = engine.memory_breaker
+    state, target = np.zeros(5), np.full(5, 0.001)
+
+    def run(n_ticks):
+        for _ in range(n_ticks):
+            engine.compute_correction(state, target, dt=0.001)
+
+    run(3)  # 틱 0-2 실패 → 틱 2에 차단
+    assert breaker.state == 'open' and memory.calls == 3
+    run(9)  # 틱 3-11: 차단 중
+    assert memory.calls == 3
+    run(1)  # 틱 12: 시험 실패 → cooldown 20
+    assert memory.calls == 4 and breaker.current_cooldown == 20
+    run(19)  # 틱 13-31: 차단 중
+    assert memory.calls == 4
+    run(1)  # 틱 32: 시험 실패 → cooldown 30 (상한)
+    assert memory.calls == 5 and breaker.current_cooldown == 30
+
+    memory.healthy = True
+    run(30)  # 틱 33-61 차단, 틱 62에 시험 성공
+    assert memory.calls == 6 and breaker.state == 'closed'
+    run(5)
+    assert memory.calls == 11
+
+    stats = breaker.get_stats()
+    print(f"   state={stats['state']}, trips={stats['trips']}, skipped={stats['skipped']}, "
+          f"failures={stats['total_failures']}, last_error={stats['last_error']}")
+    assert stats['trips'] == 3
+    assert stats['total_failures'] == 5
+    assert 'ConnectionError' in stats['last_error']
+
+    # Batch 엔진: 행별 차단기 (장애 행만 차단, 정상 행은 계속 검색)
+    failing = FailingMemory(bias=np.full(5, 0.001))
+    healthy = FailingMemory(bias=np.full(5, 0.001))
+    healthy.healthy = True
+    batch = BatchCerebellumEngine(2, memory_dim=5, configs=config, memory=[failing, healthy])
+    states, targets = np.zeros((2, 5)), np.full((2, 5), 0.001)
+    for _ in range(12):
+        batch.compute_correction(states, targets, dt=0.001)
+    failed, ok = batch.memory_breakers
+    assert failing.calls == 3 and failed.state == 'open' and failed.total_failures == 3
+    assert 'ConnectionError' in failed.last_error
+    assert healthy.calls == 12 and ok.state == 'closed' and ok.total_successes == 12
+    batch.compute_correction(states, targets, dt=0.001)  # 틱 12: 시험 검색
+    assert failing.calls == 4 and failed.current_cooldown == 20
+    print("✅ 메모리 장애 회로 차단기 확인!")
+
+
+def test_iir_low_pass_filter():
+    """IIR 필터가 low_pass_cutoff를 따르고, 오프라인/배치 경로와 일치하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 11: IIR 저주파 필터")
+    print("=" * 70)
+
+    dt = 0.001
+    t = np.arange(4000) * dt
+
+    def filtered_amplitude(mode, frequency):
+        config = CerebellumConfig(variance_filter=mode, low_pass_cutoff=10.0)
+        engine = CerebellumEngine(memory_dim=5, config=config)
+        outputs = []
+        for value in np.sin(2 * np.pi * frequency * t):
+            engine.compute_correction(np.full(5, value), np.zeros(5), dt=dt)
+            outputs.append(engine.filtered_error[0])
+        return np.max(np.abs(outputs[2000:]))
+
+    for mode, max_high in (('iir1', 0.06), ('iir2', 0.005)):
+        low = filtered_amplitude(mode, 1.0)
+        high = filtered_amplitude(mode, 200.0)
+        print(f"   {mode}: 1Hz 이득 {low:.3f}, 200Hz 이득 {high:.4f}")
+        assert low > 0.95 and high < max_high
+
+    # 계수는 dt가 바뀔 때만 다시 계산
+    engine = CerebellumEngine(memory_dim=5, config=CerebellumConfig(variance_filter='iir2'))
+    calls = []
+    original = filters.butterworth2_coefficients
+    import cerebellum.cerebellum_engine as engine_module
+    engine_module.butterworth2_coefficients = lambda *a: calls.append(a) or original(*a)
+    try:
+        for dt_step in (0.001, 0.001, 0.001, 0.002, 0.002):
+            engine.compute_correction(np.ones(5), np.zeros(5), dt=dt_step)
+            if dt_step == 0.001:
+                # 첫 스텝은 정상 상태에서 시작: 상수 입력이면 출력도 상수
+                assert np.allclose(engine.filtered_error, -1.0)
+    finally:
+        engine_module.butterworth2_coefficients = original
+    assert len(calls) == 2
+
+    # 오프라인 = 단계별, Batch = 독립 엔진
+    states, targets = make_trajectory(200, seed=7)
+    configs = [CerebellumConfig(variance_filter='iir1', low_pass_cutoff=20.0),
+               CerebellumConfig(variance_filter='iir2', low_pass_cutoff=15.0),
+               CerebellumConfig(variance_window=4)]
+    for config in configs:
+        stepwise = CerebellumEngine(memory_dim=5, config=config)
+        offline = CerebellumEngine(memory_dim=5, config=config)
+        expected = np.stack([stepwise.compute_correction(s, g, dt=dt) for s, g in zip(states, targets)])
+        actual = offline.compute_corrections(states, targets, dt=dt)
+        assert np.max(np.abs(actual - expected)) < 1e-12
+        assert np.allclose(offline.filtered_error, stepwise.filtered_error, atol=1e-15)
+
+    engines = [CerebellumEngine(memory_dim=5, config=c) for c in configs]
+    batch = BatchCerebellumEngine(len(configs), memory_dim=5, configs=configs)
+    max_diff = 0.0
+    for step in range(200):
+        if step == 100:
+            engines[1].reset()
+            batch.reset(np.array([False, True, False]))
+        current = np.stack([states[step] + 0.01 * i for i in range(len(configs))])
+        target = np.stack([targets[step]] * len(configs))
+        expected = np.stack([e.compute_correction(current[i], target[i], dt=dt) for i, e in enumerate(engines)])
+        actual = batch.compute_correction(current, target, dt=dt)
+        max_diff = max(max_diff, np.max(np.abs(actual - expected)))
+    print(f"   max |batch - independent| = {max_diff:.3e}")
+    assert max_diff < 1e-12
+
+    # Batch 엔진도 dt가 바뀐 행만 계수 재계산 (행별 dt, 독립 엔진과 동일)
+    import cerebellum.batch_engine as batch_module
+    configs = [CerebellumConfig(variance_filter='iir2', low_pass_cutoff=15.0)] * 3
+    engines = [CerebellumEngine(memory_dim=5, config=c) for c in configs]
+    batch = BatchCerebellumEngine(len(configs), memory_dim=5, configs=configs)
+    calls = []
+    original = batch_module.butterworth2_coefficients
+    batch_module.butterworth2_coefficients = lambda cutoff, dt: calls.append(len(dt)) or original(cutoff, dt)
+    try:
+        max_diff = 0.0
+        for step in range(60):
+            row_dt = np.array([0.001, 0.001 if step < 30 else 0.002, 0.001 * (1 + step % 2)])
+            current = np.stack([states[step] + 0.01 * i for i in range(len(configs))])
+            target = np.stack([targets[step]] * len(configs))
+            expected = np.stack([e.compute_correction(current[i], target[i], dt=row_dt[i])
+                                 for i, e in enumerate(engines)])
+            actual = batch.compute_correction(current, target, dt=row_dt)
+            max_diff = max(max_diff, np.max(np.abs(actual - expected)))
+    finally:
+        batch_module.butterworth2_coefficients = original
+    # 첫 스텝 3행, 이후 매 스텝 교대 행 1개, 30번째 스텝에 행 1 추가
+    assert calls == [3] + [1] * 29 + [2] + [1] * 29, calls
+    assert max_diff < 1e-12
+
+    try:
+        CerebellumEngine(memory_dim=5, config=CerebellumConfig(variance_filter='kalman'))
+        raise AssertionError("알 수 없는 variance_filter가 허용됨")
+    except ValueError:
+        pass
+    print("✅ IIR 저주파 필터 확인!")
+
+
+def test_derivative_estimators():
+    """추정기가 유한 차분보다 잡음에 강하고, 엔진에서 틱당 한 번만 갱신되는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 12: 속도/가속도 추정기")
+    print("=" * 70)
+
+    dt = 0.001
+    t = np.arange(3000) * dt
+    true_position = np.sin(2 * np.pi * 2.0 * t)[:, None] * np.ones(3)
+    true_velocity = (2 * np.pi * 2.0) * np.cos(2 * np.pi * 2.0 * t)[:, None] * np.ones(3)
+    measured = true_position + np.random.default_rng(3).normal(0, 1e-5, true_position.shape)
+
+    def velocity_rmse(estimator):
+        velocities = np.array([estimator.update(x, dt)[0].copy() for x in measured])
+        return np.sqrt(np.mean((velocities[500:] - true_velocity[500:]) ** 2))
+
+    rmse_fd = velocity_rmse(FiniteDifferenceEstimator(3))
+    rmse_abg = velocity_rmse(AlphaBetaEstimator(3, alpha=0.5, beta=0.1, gamma=0.01))
+    rmse_sg = velocity_rmse(SavitzkyGolayEstimator(3, window=15, order=2))
+    print(f"   속도 RMSE: 유한 차분 {rmse_fd:.4f}, alpha-beta-gamma {rmse_abg:.4f}, "
+          f"Savitzky-Golay {rmse_sg:.4f}")
+    assert rmse_abg < rmse_fd and rmse_sg < rmse_fd
+
+    # Savitzky-Golay (p=2)는 2차 다항식의 미분을 정확히 복원
+    estimator = SavitzkyGolayEstimator(2, window=5, order=2)
+    for k in range(12):
+        x = k * dt
+        velocity, acceleration = estimator.update(np.array([3.0 * x * x, -x]), dt)
+    assert np.allclose(velocity, [6.0 * x, -1.0]) and np.allclose(acceleration, [6.0, 0.0])
+
+    # 엔진: 틱당 한 번만 갱신
+    config = CerebellumConfig(derivative_estimator='alpha_beta_gamma')
+    engine = CerebellumEngine(memory_dim=3, config=config)
+    updates = []
+    original_update = engine.estimator.update
+    engine.estimator.update = lambda *a: updates.append(1) or original_update(*a)
+    for x in measured[:100]:
+        engine.compute_correction(x, np.zeros(3), dt=dt)
+    assert len(updates) == 100
+
+    # 오프라인 = 단계별
+    states, targets = make_trajectory(200, seed=8)
+    for kind in ('alpha_beta', 'alpha_beta_gamma', 'savitzky_golay'):
+        config = CerebellumConfig(derivative_estimator=kind)
+        stepwise = CerebellumEngine(memory_dim=5, config=config)
+        offline = CerebellumEngine(memory_dim=5, config=config)
+        expected = np.stack([stepwise.compute_correction(s, g, dt=dt) for s, g in zip(states, targets)])
+        actual = offline.compute_corrections(states, targets, dt=dt)
+        assert np.max(np.abs(actual - expected)) < 1e-12, kind
+
+    # 설정 변경 시 추정기 교체, 유한 차분이면 None
+    engine.update_config(derivative_estimator='savitzky_golay', savgol_window=9)
+    assert isinstance(engine.estimator, SavitzkyGolayEstimator) and engine.estimator.window == 9
+    engine.update_config(derivative_estimator='finite_difference')
+    assert engine.estimator is None
+
+    # 추정기 사용 시에도 정상 상태 틱은 할당 없음
+    engine = CerebellumEngine(memory_dim=5, config=CerebellumConfig(derivative_estimator='savitzky_golay'))
+    out = np.empty(5)
+    for _ in range(2):
+        for s, g in zip(states, targets):
+            engine.compute_correction(s, g, dt=dt, out=out)
+    tracemalloc.start()
+    try:
+        for s, g in zip(states[:10], targets[:10]):
+            engine.compute_correction(s, g, dt=dt, out=out)
+        before = count_engine_blocks(tracemalloc.take_snapshot())
+        for s, g in zip(states, targets):
+            engine.compute_correction(s, g, dt=dt, out=out)
+        after = count_engine_blocks(tracemalloc.take_snapshot())
+    finally:
+        tracemalloc.stop()
+    assert after - before == 0
+
+    try:
+        BatchCerebellumEngine(2, configs=CerebellumConfig(derivative_estimator='alpha_beta'))
+        raise AssertionError("Batch 엔진이 지원하지 않는 추정기를 허용함")
+    except ValueError:
+        pass
+    print("✅ 속도/가속도 추정기 확인!")
+
+
+def test_multi_rate_stages():
+    """기억/Variance 단계가 설정한 주기로만 갱신되고 사이 틱은 마지막 출력을 재사용하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 13: 다중 시간 스케일")
+    print("=" * 70)
+
+    memory = CountingMemory()
+    rng = np.random.default_rng(9)
+    for _ in range(200):
+        memory.store(rng.normal(0, 0.05, 5), rng.normal(0, 0.001, 5), confidence=0.8)
+    states, targets = make_trajectory(400, seed=10)
+
+    config = CerebellumConfig(memory_update_interval=10, variance_update_interval=2)
+    engine = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+    reference = CerebellumEngine(memory_dim=5, memory=memory)
+
+    memory.calls = 0
+    filtered_changes = 0
+    previous_filtered = None
+    for t in range(100):
+        engine.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+        if previous_filtered is not None and not np.array_equal(previous_filtered, engine.filtered_error):
+            assert engine.tick_count % 2 == 1  # 갱신은 짝수 틱(0, 2, ...)에서만
+            filtered_changes += 1
+        previous_filtered = engine.filtered_error.copy()
+    assert memory.calls == 10 and engine.tick_count == 100
+    assert filtered_changes <= 49
+
+    start = time.perf_counter()
+    for t in range(100, 400):
+        engine.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+    multi_rate_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for t in range(100, 400):
+        reference.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+    full_rate_time = time.perf_counter() - start
+    print(f"   틱당 시간: 전체 주기 {full_rate_time / 300 * 1e6:.1f}us, "
+          f"다중 주기 {multi_rate_time / 300 * 1e6:.1f}us (기억 1/10, Variance 1/2)")
+
+    # 주기 1이면 기존 결과와 동일, 설정 변경 시 다음 틱에 즉시 갱신
+    a = CerebellumEngine(memory_dim=5, memory=memory)
+    b = CerebellumEngine(memory_dim=5, config=CerebellumConfig(memory_update_interval=7), memory=memory)
+    b.update_config(memory_update_interval=1)
+    for t in range(50):
+        assert np.array_equal(a.compute_correction(states[t], targets[t], dt=0.001),
+                              b.compute_correction(states[t], targets[t], dt=0.001))
+
+    # 오프라인 = 단계별 (주기 중간에서 시작하는 구간 포함)
+    for variance_filter in ('moving_average', 'iir2'):
+        config = CerebellumConfig(memory_update_interval=7, variance_update_interval=3,
+                                  variance_filter=variance_filter)
+        stepwise = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+        offline = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+        expected = np.stack([stepwise.compute_correction(s, g, dt=0.001) for s, g in zip(states, targets)])
+        actual = np.concatenate([
+            offline.compute_corrections(states[:45], targets[:45], dt=0.001),
+            offline.compute_corrections(states[45:], targets[45:], dt=0.001),
+        ])
+        max_diff = np.max(np.abs(actual - expected))
+        print(f"   {variance_filter}: max |offline - stepwise| = {max_diff:.3e}")
+        assert max_diff < 1e-12
+        assert offline.tick_count == stepwise.tick_count == 400
+
+    try:
+        BatchCerebellumEngine(2, configs=CerebellumConfig(memory_update_interval=10))
+        raise AssertionError("Batch 엔진이 다중 시간 스케일 설정을 허용함")
+    except ValueError:
+        pass
+    print("✅ 다중 시간 스케일 확인!")
+
+
+def test_snapshot_restore():
+    """스냅샷에서 복원한 엔진이 원래 엔진과 같은 보정값을 이어서 내는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 14: 바이너리 스냅샷/복원")
+    print("=" * 70)
+
+    memory = ArrayMemory()
+    rng = np.random.default_rng(11)
+    for _ in range(100):
+        memory.store(rng.normal(0, 0.05, 5), rng.normal(0, 0.001, 5), confidence=0.8)
+    states, targets = make_trajectory(400, seed=12)
+
+    configs = [
+        CerebellumConfig(),
+        CerebellumConfig(variance_filter='iir2', derivative_estimator='savitzky_golay',
+                         memory_update_interval=4, variance_update_interval=3, variance_window=7),
+        CerebellumConfig(variance_filter='iir1', derivative_estimator='alpha_beta_gamma'),
+    ]
+    for config in configs:
+        engine = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+        for t in range(250):
+            engine.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+        buffer = engine.snapshot()
+        assert isinstance(buffer, bytes) and buffer[:4] == b'CBSN'
+
+        standby = CerebellumEngine.from_snapshot(buffer, memory=memory)
+        assert standby.config == config and standby.tick_count == 250
+        assert list(map(tuple, standby.error_history)) == list(map(tuple, engine.error_history))
+        for t in range(250, 400):
+            expected = engine.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+            actual = standby.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=0.001)
+            assert np.array_equal(actual, expected)
+
+    # 다른 설정의 엔진에 복원하면 설정도 교체
+    target_engine = CerebellumEngine(memory_dim=5, memory=memory)
+    target_engine.restore(buffer)
+    assert target_engine.config == configs[-1] and target_engine.estimator is not None
+
+    # 콜드 엔진 복원 (prev_state 등 None 유지)
+    cold = CerebellumEngine(memory_dim=5)
+    restored = CerebellumEngine.from_snapshot(cold.snapshot())
+    assert restored.prev_state is None and restored.filtered_error is None
+
+    # 복원 시간
+    restore_times = []
+    for _ in range(200):
+        start = time.perf_counter_ns()
+        target_engine.restore(buffer)
+        restore_times.append(time.perf_counter_ns() - start)
+    print(f"   스냅샷 {len(buffer)} bytes, 복원 중앙값 {np.median(restore_times) / 1000:.1f}us")
+
+    # 잘못된 입력
+    for bad in (b'XXXX' + buffer[4:], buffer[:4] + b'\x63\x00' + buffer[6:], buffer[:-8], buffer[:5]):
+        try:
+            target_engine.restore(bad)
+            raise AssertionError("잘못된 스냅샷이 허용됨")
+        except ValueError:
+            pass
+    try:
+        CerebellumEngine(memory_dim=3).restore(buffer)
+        raise AssertionError("memory_dim이 다른 스냅샷이 허용됨")
+    except ValueError:
+        pass
+    print("✅ 바이너리 스냅샷/복원 확인!")
+
+
+def test_scalar_backend():
+    """스칼라 백엔드가 NumPy 백엔드와 같은 보정값을 내는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 15: 저차원 스칼라 백엔드")
+    print("=" * 70)
+
+    assert CerebellumEngine(memory_dim=3).backend == 'scalar'
+    assert CerebellumEngine(memory_dim=64).backend == 'numpy'
+    assert CerebellumEngine(memory_dim=3, config=CerebellumConfig(backend='numpy')).backend == 'numpy'
+
+    for dim in (3, 5, 6):
+        memory = ArrayMemory()
+        rng = np.random.default_rng(dim)
+        for _ in range(100):
+            memory.store(rng.normal(0, 0.05, dim), rng.normal(0, 0.001, dim), confidence=0.8)
+        states = rng.normal(0, 0.05, (600, dim))
+        targets = states + rng.normal(0, 0.002, (600, dim))
+
+        config = CerebellumConfig(variance_window=7, memory_update_interval=3, max_correction_norm=0.002)
+        scalar = CerebellumEngine(memory_dim=dim, config=config, memory=memory)
+        reference = CerebellumEngine(memory_dim=dim, config=replace(config, backend='numpy'), memory=memory)
+        assert scalar.backend == 'scalar' and reference.backend == 'numpy'
+
+        out = np.empty(dim)
+        for t in range(600):
+            dt = 0.001 if t % 97 else 0.0
+            expected = reference.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=dt)
+            actual = scalar.compute_correction(states[t], targets[t], context={'tool': 'A'}, dt=dt, out=out)
+            assert actual is out
+            assert np.allclose(actual, expected, rtol=1e-12, atol=1e-15)
+
+            # 중간에 NumPy 버퍼를 읽는 API를 섞어도 상태가 이어져야 함
+            if t == 150:
+                assert np.allclose(np.array(scalar.error_history), np.array(reference.error_history))
+                assert np.allclose(scalar.prev_state, reference.prev_state)
+            elif t == 300:
+                restored = CerebellumEngine.from_snapshot(scalar.snapshot(), memory=memory)
+                assert np.allclose(restored.filtered_error, reference.filtered_error)
+            elif t == 400:
+                scalar.compute_corrections(states[t:t + 5], targets[t:t + 5], contexts={'tool': 'A'}, dt=0.001)
+                reference.compute_corrections(states[t:t + 5], targets[t:t + 5], contexts={'tool': 'A'}, dt=0.001)
+            elif t == 500:
+                scalar.update_config(variance_window=4)
+                reference.update_config(variance_window=4)
+        assert scalar.tick_count == reference.tick_count
+
+    # IIR 필터, 추정기, 계측 사용 시에는 NumPy 경로로 동작 (결과 동일)
+    states, targets = make_trajectory(100, seed=15)
+    for config in (CerebellumConfig(variance_filter='iir1'),
+                   CerebellumConfig(derivative_estimator='alpha_beta')):
+        scalar = CerebellumEngine(memory_dim=5, config=config)
+        reference = CerebellumEngine(memory_dim=5, config=replace(config, backend='numpy'))
+        for t in range(100):
+            expected = reference.compute_correction(states[t], targets[t], dt=0.001)
+            assert np.array_equal(scalar.compute_correction(states[t], targets[t], dt=0.001), expected)
+
+    # 틱 시간 비교
+    states, targets = make_trajectory(3000, seed=16)
+    timings = {}
+    for backend in ('numpy', 'scalar'):
+        engine = CerebellumEngine(memory_dim=5, config=CerebellumConfig(backend=backend))
+        out = np.empty(5)
+        start = time.perf_counter()
+        for t in range(3000):
+            engine.compute_correction(states[t], targets[t], dt=0.001, out=out)
+        timings[backend] = (time.perf_counter() - start) / 3000 * 1e6
+    print(f"   memory_dim=5: numpy {timings['numpy']:.1f}us, scalar {timings['scalar']:.1f}us")
+    print("✅ 스칼라 백엔드 확인!")
+
+
+def test_engine_registry():
+    """레지스트리의 step_all/step이 독립 엔진과 같은 결과를 내고 동시 호출에 안전한지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 16: 샤딩된 엔진 레지스트리")
+    print("=" * 70)
+
+    keys = [f'axis-{i}' for i in range(12)]
+    states, targets = make_trajectory(200, seed=17)
+    config = CerebellumConfig(variance_window=5)
+
+    with EngineRegistry(n_shards=4, max_workers=4) as registry:
+        references = {}
+        for i, key in enumerate(keys):
+            registry.create(key, memory_dim=5, config=config)
+            references[key] = CerebellumEngine(memory_dim=5, config=config)
+        assert len(registry) == 12 and 'axis-3' in registry and sorted(registry.keys()) == sorted(keys)
+        try:
+            registry.create('axis-0')
+            raise AssertionError("중복 키가 허용됨")
+        except ValueError:
+            pass
+
+        # step_all == 엔진별 직렬 계산
+        for t in range(200):
+            inputs = {key: (states[t] * (i + 1), targets[t]) for i, key in enumerate(keys)}
+            contexts = {key: {'axis': key} for key in keys}
+            results = registry.step_all(inputs, contexts=contexts, dt=0.001)
+            assert set(results) == set(keys)
+            for key in keys:
+                expected = references[key].compute_correction(*inputs[key], context=contexts[key], dt=0.001)
+                assert np.array_equal(results[key], expected)
+
+        stats = registry.get_stats()
+        assert stats['ticks'] == 200 * 12 and stats['engines'] == 12
+        assert sum(s['engines'] for s in stats['shards']) == 12
+
+        # 등록되지 않은 키가 있으면 아무 엔진도 계산하지 않음
+        try:
+            registry.step_all({'axis-0': (states[0], targets[0]), 'missing': (states[0], targets[0])})
+            raise AssertionError("등록되지 않은 키가 허용됨")
+        except KeyError:
+            pass
+        with registry.locked('axis-0') as engine:
+            assert engine.tick_count == 200
+
+        # 여러 스레드가 같은 엔진들을 동시에 호출
+        registry.reset_stats()
+        errors = []
+
+        def worker(seed):
+            rng = np.random.default_rng(seed)
+            try:
+                for _ in range(200):
+                    key = keys[rng.integers(0, 4)]
+                    registry.step(key, rng.normal(0, 0.05, 5), rng.normal(0, 0.05, 5), dt=0.001)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert sum(registry.get(key).tick_count for key in keys[:4]) == 4 * 200 + 8 * 200
+        assert registry.get_stats()['ticks'] == 8 * 200
+
+        removed = registry.remove('axis-11')
+        assert removed.tick_count == 200 and 'axis-11' not in registry
+
+        for shard in registry.get_shard_stats():
+            print(f"   shard {shard['shard']}: {shard['engines']} engines, {shard['ticks']} ticks, "
+                  f"{shard['ticks_per_second']:.0f} ticks/s, lock wait {shard['lock_wait_seconds'] * 1e3:.2f}ms")
+
+    # 여러 샤드의 엔진이 해마 메모리 하나를 공유 (다른 스레드가 store하는 중에도 직렬 계산과 동일)
+    rng = np.random.default_rng(16)
+    stored = [(states[t] * (i + 1), rng.normal(0, 0.01, 5)) for t in range(0, 200, 2) for i in range(12)]
+    factories = (
+        ('ArrayMemory', ArrayMemory),
+        ('BoundedMemory', lambda: BoundedMemory(max_entries=100000)),
+        ('ContextMemory', lambda: ContextMemory(partition_keys=())),
+    )
+    for name, factory in factories:
+        shared, serial = factory(), factory()
+        for key, value in stored:
+            shared.store(key, value)
+            serial.store(key, value)
+        with EngineRegistry(n_shards=4, max_workers=4) as registry:
+            references = {}
+            for key in keys:
+                registry.create(key, memory_dim=5, config=config, memory=shared)
+                references[key] = CerebellumEngine(memory_dim=5, config=config, memory=serial)
+            stop = threading.Event()
+
+            def writer():
+                far = np.random.default_rng(160)
+                while not stop.is_set():
+                    # 검색 반경 밖 키를 저장/삭제 (결과에 영향 없음, 행 추가·확장·이동은 계속 일어남)
+                    far_keys = far.uniform(50, 100, (512, 5))
+                    for far_key in far_keys:
+                        shared.store(far_key, np.ones(5))
+                    for far_key in far_keys:
+                        shared.remove(far_key)
+
+            switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-5)  # 스레드 전환을 잦게 해서 경합 구간을 드러냄
+            thread = threading.Thread(target=writer)
+            thread.start()
+            try:
+                for t in range(200):
+                    inputs = {key: (states[t] * (i + 1), targets[t]) for i, key in enumerate(keys)}
+                    contexts = {key: {'axis': key} for key in keys}
+                    results = registry.step_all(inputs, contexts=contexts, dt=0.001)
+                    for key in keys:
+                        expected = references[key].compute_correction(*inputs[key], context=contexts[key], dt=0.001)
+                        assert np.array_equal(results[key], expected), f"{name}: 공유 메모리 결과 불일치 (t={t})"
+            finally:
+                stop.set()
+                thread.join()
+                sys.setswitchinterval(switch_interval)
+        print(f"   {name} 공유 + 동시 store/remove: step_all == 직렬 계산")
+
+    # 검색과 삭제가 겹쳐도 다른 항목의 bias를 돌려주지 않음 (삭제는 마지막 행을 빈 자리로 옮김)
+    memory = ArrayMemory()
+    near, moved = np.zeros(5), np.full(5, 10.0)
+    stop = threading.Event()
+
+    def toggler():
+        while not stop.is_set():
+            memory.store(near, np.ones(5))
+            memory.store(moved, np.full(5, -1.0))
+            memory.remove(near)  # moved가 near의 행으로 이동
+            memory.remove(moved)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    thread = threading.Thread(target=toggler)
+    thread.start()
+    try:
+        found = [memory.retrieve(near) for _ in range(20000)]
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    biases = [tuple(memories[0]['bias']) for memories in found if memories]
+    assert biases and set(biases) == {(1.0,) * 5}, f"다른 항목의 bias 반환: {set(biases)}"
+    print(f"   검색/삭제 동시 실행: {len(biases)}회 적중, 모두 올바른 bias")
+    print("✅ 샤딩된 엔진 레지스트리 확인!")
+
+
+def test_config_sweep():
+    """설정 탐색이 프로세스 풀/직렬 실행에서 같은 결과를 내고 나쁜 설정을 조기 종료하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 17: 병렬 설정 탐색")
+    print("=" * 70)
+
+    configs = grid_configs({'feedforward_gain': [0.2, 0.8], 'memory_gain': [0.2, 0.4]})
+    assert len(configs) == 4
+    assert configs[3][1].feedforward_gain == 0.8 and configs[3][1].memory_gain == 0.4
+    sampled = random_configs({'trial_gain': (0.1, 0.5), 'max_correction_norm': (0.5, 2.0)}, 5, seed=1)
+    assert len(sampled) == 5 and all(0.1 <= c.trial_gain <= 0.5 for _, c in sampled)
+    try:
+        grid_configs({'no_such_gain': [1.0]})
+        raise AssertionError("없는 파라미터가 허용됨")
+    except ValueError:
+        pass
+
+    streamed = []
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'sweep.csv')
+        parallel = run_sweep(configs, n_trials=3, steps_per_trial=100, max_workers=2,
+                             on_result=streamed.append, csv_path=csv_path)
+        with open(csv_path) as f:
+            lines = f.read().splitlines()
+    assert len(streamed) == 4 and len(lines) == 5
+    assert [row['index'] for row in parallel] == [0, 1, 2, 3]
+    assert len({row['seed'] for row in parallel}) == 4
+    assert all(name in parallel[0] for name in RESULT_COLUMNS)
+
+    # 같은 seed면 직렬 실행과 동일
+    serial = run_sweep(configs, n_trials=3, steps_per_trial=100, max_workers=1)
+    assert serial == parallel
+
+    # RMS 상한을 넘으면 첫 시행 후 종료
+    stopped = run_sweep(configs[:1], n_trials=5, steps_per_trial=100, max_workers=1,
+                        early_stop={'max_rms_error': 1e-6})
+    assert stopped[0]['trials'] == 1 and stopped[0]['stopped'] == 'rms_limit'
+
+    for row in parallel:
+        print(f"   gain ff={row['feedforward_gain']}, mem={row['memory_gain']}: "
+              f"RMS {row['rms_error']:.5f}, settling {row['settling_time']:.3f}s")
+    print("✅ 병렬 설정 탐색 확인!")
+
+
+def test_array_memory():
+    """ArrayMemory가 MockMemory와 같은 검색 결과를 내는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 18: 배열 기반 최근접 이웃 메모리")
+    print("=" * 70)
+
+    reference = MockMemory()
+    memory = ArrayMemory(initial_capacity=4)
+    assert memory.retrieve(np.zeros(5)) == [] and len(memory) == 0
+
+    rng = np.random.default_rng(18)
+    keys = rng.normal(0, 0.1, (300, 5))
+    for i, key in enumerate(keys):
+        value = rng.normal(0, 0.001, 5)
+        reference.store(key, value, confidence=0.5 + 0.001 * i)
+        memory.store(key, value, confidence=0.5 + 0.001 * i)
+    # 같은 키 재저장은 덮어쓰기
+    reference.store(keys[7], np.ones(5), confidence=0.3)
+    memory.store(keys[7], np.ones(5), confidence=0.3)
+    assert len(memory) == 300 and memory.capacity >= 300
+    assert memory.version == 301
+
+    hits = 0
+    for query in np.vstack([keys[:20] + rng.normal(0, 0.01, (20, 5)), rng.normal(0, 0.1, (200, 5))]):
+        expected = reference.retrieve(query)
+        actual = memory.retrieve(query)
+        assert len(actual) == len(expected)
+        if expected:
+            hits += 1
+            assert np.array_equal(actual[0]['bias'], expected[0]['bias'])
+            assert abs(actual[0]['confidence'] - expected[0]['confidence']) < 1e-12
+    assert hits >= 20
+    assert memory.retrieve(keys[7])[0]['confidence'] == 0.3
+
+    # 반환된 bias는 복사본 (덮어써도 바뀌지 않음)
+    bias = memory.retrieve(keys[7])[0]['bias']
+    memory.store(keys[7], np.zeros(5))
+    assert np.array_equal(bias, np.ones(5))
+
+    # 엔진에서 MockMemory 대신 사용
+    states, targets = make_trajectory(200, seed=18)
+    engine_ref = CerebellumEngine(memory_dim=5, memory=reference)
+    engine = CerebellumEngine(memory_dim=5, memory=memory)
+    reference.store(keys[7], np.zeros(5))
+    for t in range(200):
+        expected = engine_ref.compute_correction(keys[t % 300], targets[t], dt=0.001)
+        assert np.allclose(engine.compute_correction(keys[t % 300], targets[t], dt=0.001), expected,
+                           rtol=1e-12, atol=1e-15)
+
+    # 여러 스레드의 동시 검색 (작업 버퍼가 스레드별이므로 서로의 거리를 덮어쓰지 않음)
+    shared_keys = rng.normal(0, 1.0, (50000, 5))
+    probes = shared_keys[:32] + rng.normal(0, 0.01, (32, 5))
+    for shared in (ArrayMemory(), GridMemory(radius=1.0), TreeMemory(radius=1.0, rebuild_threshold=10 ** 9)):
+        for key in shared_keys:
+            shared.store(key, np.zeros(5))
+        expected = [shared.nearest(probe) for probe in probes]
+        wrong = []
+
+        def lookup():
+            for _ in range(10):
+                for probe, want in zip(probes, expected):
+                    if shared.nearest(probe) != want:
+                        wrong.append(want)
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not wrong, f"{type(shared).__name__}: 동시 검색 {len(wrong)}/{4 * 10 * len(probes)}개 오류"
+    print("   4개 스레드 동시 검색: Array/Grid/Tree 모두 단일 스레드 결과와 일치")
+
+    # 검색 시간 (저장 20000개)
+    big_reference = MockMemory()
+    big = ArrayMemory()
+    for key in rng.normal(0, 1.0, (20000, 5)):
+        big_reference.store(key, np.zeros(5))
+        big.store(key, np.zeros(5))
+    query = np.zeros(5)
+    start = time.perf_counter()
+    for _ in range(3):
+        big_reference.retrieve(query)
+    reference_us = (time.perf_counter() - start) / 3 * 1e6
+    start = time.perf_counter()
+    for _ in range(200):
+        big.retrieve(query)
+    array_us = (time.perf_counter() - start) / 200 * 1e6
+    print(f"   저장 20000개 검색: MockMemory {reference_us:.0f}us, ArrayMemory {array_us:.0f}us")
+    assert array_us < reference_us
+    print("✅ 배열 기반 메모리 확인!")
+
+
+def test_grid_memory():
+    """GridMemory가 ArrayMemory와 같은 결과를 내고 검색 시간이 저장 개수에 무관한지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 19: 해시 격자 메모리")
+    print("=" * 70)
+
+    rng = np.random.default_rng(19)
+    keys = rng.normal(0, 0.1, (2000, 5))
+    values = rng.normal(0, 0.001, (2000, 5))
+    queries = np.vstack([keys[:200] + rng.normal(0, 0.02, (200, 5)), rng.normal(0, 0.1, (300, 5))])
+    for cell_size in (None, 0.04, 0.25):
+        grid = GridMemory(cell_size=cell_size, initial_capacity=16)
+        reference = ArrayMemory()
+        for key, value in zip(keys, values):
+            grid.store(key, value, confidence=0.8)
+            reference.store(key, value, confidence=0.8)
+        # 삭제 (마지막 행 이동 포함) 후에도 색인 일치
+        for key in keys[::3]:
+            assert grid.remove(key) and reference.remove(key)
+        assert not grid.remove(keys[0])
+        assert len(grid) == len(reference) and grid.version == reference.version
+        for query in queries:
+            expected = reference.retrieve(query)
+            actual = grid.retrieve(query)
+            assert len(actual) == len(expected)
+            if expected:
+                assert np.array_equal(actual[0]['bias'], expected[0]['bias'])
+                assert abs(actual[0]['confidence'] - expected[0]['confidence']) < 1e-12
+        print(f"   cell_size={grid.cell_size:.2f}: 이웃 범위 {grid.reach}, 셀 {grid.n_cells}개")
+
+    grid.clear()
+    assert len(grid) == 0 and grid.n_cells == 0 and grid.retrieve(keys[0]) == []
+
+    # 저장 개수를 10배로 늘려도 검색 시간은 거의 같아야 함 (같은 밀도)
+    timings = []
+    for n_entries in (10000, 100000):
+        grid = GridMemory()
+        for key in rng.uniform(-5, 5, (n_entries, 5)):
+            grid.store(key, np.zeros(5))
+        probes = rng.uniform(-5, 5, (300, 5))
+        start = time.perf_counter()
+        for probe in probes:
+            grid.retrieve(probe)
+        timings.append((time.perf_counter() - start) / len(probes) * 1e6)
+        print(f"   저장 {n_entries}개: 검색 {timings[-1]:.1f}us")
+    assert timings[1] < timings[0] * 3
+    print("✅ 해시 격자 메모리 확인!")
+
+
+def test_tree_memory():
+    """TreeMemory가 삽입/삭제와 트리 재생성 중에도 ArrayMemory와 같은 결과를 내는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 20: KD-tree 메모리")
+    print("=" * 70)
+
+    rng = np.random.default_rng(20)
+    keys = rng.normal(0, 0.1, (4000, 5))
+    for background in (False, True):
+        tree = TreeMemory(leaf_size=16, rebuild_threshold=100, background=background)
+        reference = ArrayMemory()
+        for i, key in enumerate(keys):
+            value = rng.normal(0, 0.001, 5)
+            tree.store(key, value, confidence=0.8)
+            reference.store(key, value, confidence=0.8)
+            if i % 7 == 3:
+                removed = keys[rng.integers(0, i + 1)]
+                assert tree.remove(removed) == reference.remove(removed)
+            if i % 25 == 0:
+                query = keys[rng.integers(0, i + 1)] + rng.normal(0, 0.02, 5)
+                expected = reference.retrieve(query)
+                actual = tree.retrieve(query)
+                assert len(actual) == len(expected)
+                if expected:
+                    assert np.array_equal(actual[0]['bias'], expected[0]['bias'])
+                    assert abs(actual[0]['confidence'] - expected[0]['confidence']) < 1e-12
+        tree.rebuild()
+        assert tree.buffer_size == 0 and len(tree.tree) == len(reference) and not tree.rebuilding
+        for query in rng.normal(0, 0.1, (300, 5)):
+            expected = reference.retrieve(query)
+            actual = tree.retrieve(query)
+            assert len(actual) == len(expected)
+            if expected:
+                assert np.array_equal(actual[0]['bias'], expected[0]['bias'])
+        print(f"   background={background}: 재생성 {tree.rebuilds}회, 트리 {len(tree.tree)}개")
+        tree.close()
+
+    # 반경 제한 없는 최근접 이웃 (고차원)
+    points = rng.normal(0, 1.0, (3000, 12))
+    tree = TreeMemory(radius=np.inf, background=False)
+    for point in points:
+        tree.store(point, point[:3])
+    tree.rebuild()
+    for query in rng.normal(0, 1.0, (50, 12)):
+        expected = int(np.argmin(np.linalg.norm(points - query, axis=1)))
+        assert np.array_equal(tree.retrieve(query)[0]['bias'], points[expected, :3])
+
+    # 다른 스레드가 검색(→ 트리 교체)하는 동안 store해도 항목이 빠지지 않음
+    tree = TreeMemory(leaf_size=8, rebuild_threshold=20, rebuild_ratio=0.0)
+    stored_keys = rng.normal(0, 1.0, (4000, 5))
+    stop = threading.Event()
+
+    def searcher(seed):
+        probe_rng = np.random.default_rng(seed)
+        while not stop.is_set():
+            tree.nearest(probe_rng.normal(0, 1.0, 5))
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    threads = [threading.Thread(target=searcher, args=(seed,)) for seed in range(3)]
+    for thread in threads:
+        thread.start()
+    try:
+        for i, key in enumerate(stored_keys):
+            tree.store(key, np.full(3, float(i)))
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(switch_interval)
+    indexed = tree.buffer_size + (len(tree.tree.positions) if tree.tree is not None else 0)
+    missing = sum(1 for i, key in enumerate(stored_keys) if tree.nearest(key) != (i, 0.0))
+    print(f"   store 중 동시 검색: 재생성 {tree.rebuilds}회, 색인 {indexed}/{len(tree)}개")
+    assert indexed == len(tree) == len(stored_keys) and missing == 0
+    tree.close()
+
+    # 검색 시간 (저장 100000개, ArrayMemory 대비)
+    big_tree = TreeMemory()
+    big_array = ArrayMemory()
+    for key in rng.uniform(-5, 5, (100000, 5)):
+        big_tree.store(key, np.zeros(5))
+        big_array.store(key, np.zeros(5))
+    big_tree.rebuild()
+    probes = rng.uniform(-5, 5, (200, 5))
+    timings = {}
+    for name, memory in (('ArrayMemory', big_array), ('TreeMemory', big_tree)):
+        start = time.perf_counter()
+        for probe in probes:
+            memory.retrieve(probe)
+        timings[name] = (time.perf_counter() - start) / len(probes) * 1e6
+    big_tree.close()
+    print(f"   저장 100000개 검색: ArrayMemory {timings['ArrayMemory']:.0f}us, TreeMemory {timings['TreeMemory']:.0f}us")
+    assert timings['TreeMemory'] < timings['ArrayMemory']
+    print("✅ KD-tree 메모리 확인!")
+
+
+def test_bounded_memory():
+    """BoundedMemory가 정책대로 퇴출하고 근접 기억을 통합하는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 21: 용량 제한 메모리")
+    print("=" * 70)
+
+    keys = [np.array([float(i), 0.0, 0.0]) for i in range(4)]
+
+    # LRU: 검색된 항목은 남고 가장 오래 안 쓰인 항목이 퇴출
+    lru = BoundedMemory(max_entries=3, eviction='lru')
+    for key in keys[:3]:
+        lru.store(key, key)
+    lru.retrieve(keys[0])
+    lru.store(keys[3], keys[3])
+    assert len(lru) == 3 and lru.retrieve(keys[1]) == [] and lru.retrieve(keys[0])
+
+    # oldest: 검색과 무관하게 먼저 삽입된 항목이 퇴출
+    oldest = BoundedMemory(max_entries=3, eviction='oldest')
+    for key in keys[:3]:
+        oldest.store(key, key)
+    oldest.retrieve(keys[0])
+    oldest.store(keys[3], keys[3])
+    assert oldest.retrieve(keys[0]) == [] and oldest.retrieve(keys[1])
+
+    # lowest_confidence: confidence가 가장 낮은 항목이 퇴출
+    lowest = BoundedMemory(max_entries=3, eviction='lowest_confidence')
+    for key, confidence in zip(keys[:3], (0.9, 0.2, 0.7)):
+        lowest.store(key, key, confidence=confidence)
+    lowest.store(keys[3], keys[3], confidence=0.5)
+    assert lowest.retrieve(keys[1]) == [] and lowest.retrieve(keys[2])
+    assert lowest.get_stats()['evictions'] == 1
+
+    # 같은 키 재저장은 퇴출 없이 덮어쓰기
+    lowest.store(keys[3], keys[0], confidence=0.6)
+    assert len(lowest) == 3 and lowest.evictions == 1
+
+    try:
+        BoundedMemory(eviction='random')
+        raise AssertionError("알 수 없는 퇴출 정책이 허용됨")
+    except ValueError:
+        pass
+
+    # 통합: confidence 가중 평균
+    merged = BoundedMemory(consolidation_radius=0.05)
+    merged.store(np.zeros(3), np.array([1.0, 0.0, 0.0]), confidence=0.6)
+    merged.store(np.array([0.03, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]), confidence=0.2)
+    assert len(merged) == 1 and merged.merges == 1
+    assert np.allclose(merged.keys[0], [0.0075, 0.0, 0.0])
+    result = merged.retrieve(np.array([0.0075, 0.0, 0.0]))[0]
+    assert np.allclose(result['bias'], [0.75, 0.25, 0.0]) and abs(result['confidence'] - 0.6) < 1e-12
+    merged.store(np.array([0.5, 0.0, 0.0]), np.zeros(3))
+    assert len(merged) == 2
+
+    # 저장 개수와 검색 시간이 일정 수준에서 멈춤
+    rng = np.random.default_rng(21)
+    memory = BoundedMemory(max_entries=2000, consolidation_radius=0.005)
+    probes = rng.normal(0, 0.1, (200, 5))
+    timings = []
+    for _ in range(2):
+        for key in rng.normal(0, 0.1, (10000, 5)):
+            memory.store(key, np.zeros(5), confidence=0.8)
+        start = time.perf_counter()
+        for probe in probes:
+            memory.retrieve(probe)
+        timings.append((time.perf_counter() - start) / len(probes) * 1e6)
+    stats = memory.get_stats()
+    assert stats['entries'] == 2000 and stats['capacity'] == 2000
+    print(f"   20000회 저장 후: 항목 {stats['entries']}개, 퇴출 {stats['evictions']}, 통합 {stats['merges']}")
+    print(f"   검색 시간: 10000회 저장 후 {timings[0]:.1f}us, 20000회 저장 후 {timings[1]:.1f}us")
+    print("✅ 용량 제한 메모리 확인!")
+
+
+def test_retrieve_many():
+    """retrieve_many가 키별 retrieve와 같고, 엔진이 이를 사용해도 결과가 같은지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 22: 일괄 기억 검색 retrieve_many")
+    print("=" * 70)
+
+    rng = np.random.default_rng(22)
+    stored = rng.normal(0, 0.05, (3000, 5))
+    values = rng.normal(0, 0.001, (3000, 5))
+    queries = np.concatenate([stored[:200] + rng.normal(0, 0.01, (200, 5)), rng.normal(1.0, 0.05, (50, 5))])
+
+    tree = TreeMemory(background=False)
+    backends = [ArrayMemory(), GridMemory(), tree, BoundedMemory(max_entries=2500)]
+    for memory in backends:
+        for key, value in zip(stored, values):
+            memory.store(key, value, confidence=0.8)
+    assert tree.tree is not None and tree.buffer_size > 0  # 트리 + 버퍼 모두 검색
+
+    for memory in backends:
+        name = type(memory).__name__
+        biases, confidences = memory.retrieve_many(queries)
+        assert biases.shape == (len(queries), 5) and confidences.shape == (len(queries),)
+        for query, bias, confidence in zip(queries, biases, confidences):
+            result = memory.retrieve(query)
+            if result:
+                assert np.array_equal(bias, result[0]['bias'])
+                assert abs(confidence - result[0]['confidence']) < 1e-12
+            else:
+                assert np.isnan(confidence) and not bias.any()  # 미적중은 nan
+        hits = int((~np.isnan(confidences)).sum())
+
+        start = time.perf_counter()
+        for query in queries:
+            memory.retrieve(query)
+        loop_us = (time.perf_counter() - start) * 1e6
+        start = time.perf_counter()
+        memory.retrieve_many(queries)
+        batch_us = (time.perf_counter() - start) * 1e6
+        print(f"   {name:>13}: 적중 {hits}/{len(queries)}, 키별 {loop_us:8.0f}us, retrieve_many {batch_us:8.0f}us")
+    tree.close()
+
+    # 트리 버퍼가 클 때: 질의를 나눠 (N, B, D) 차이 배열을 한 번에 만들지 않음
+    buffered = TreeMemory(background=False, rebuild_threshold=10 ** 9)
+    for key in rng.normal(0, 1.0, (20000, 5)):
+        buffered.store(key, key)
+    assert buffered.tree is None and buffered.buffer_size == 20000
+    bulk = rng.normal(0, 1.0, (2000, 5))
+    tracemalloc.start()
+    bulk_rows, bulk_distances = buffered.nearest_many(bulk)
+    peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    for i in range(0, len(bulk), 100):
+        assert (bulk_rows[i], bulk_distances[i]) == buffered.nearest(bulk[i])
+    assert peak_mb < 200  # 나누지 않으면 2000 × 20000 × 5 × 8B = 1.6GB
+    print(f"   버퍼 20000개 × 질의 2000개: 최대 할당 {peak_mb:.0f}MB")
+    buffered.close()
+
+    empty_biases, empty_confidences = ArrayMemory().retrieve_many(queries[:3])
+    assert not empty_biases.any() and np.isnan(empty_confidences).all()
+
+    # LRU: retrieve_many로 찾은 항목도 사용 시각 갱신
+    lru = BoundedMemory(max_entries=3, eviction='lru')
+    keys = [np.array([float(i), 0.0]) for i in range(4)]
+    for key in keys[:3]:
+        lru.store(key, key)
+    lru.retrieve_many(np.array([keys[0]]))
+    lru.store(keys[3], keys[3])
+    assert lru.retrieve(keys[1]) == [] and lru.retrieve(keys[0])
+
+    # 오프라인 모드: retrieve_many 사용 결과가 단계별 compute_correction과 동일
+    memory = ArrayMemory()
+    for key, value in zip(stored[:50], values[:50]):
+        memory.store(key, value, confidence=0.8)
+    config = CerebellumConfig(min_confidence=0.85)
+    states, targets = make_trajectory(200, seed=22)
+    states[::4] = stored[:50]  # 일부 스텝은 기억 적중
+    stepwise = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+    offline = CerebellumEngine(memory_dim=5, config=config, memory=memory)
+    expected = np.array([stepwise.compute_correction(s, t, dt=0.001) for s, t in zip(states, targets)])
+    actual = offline.compute_corrections(states, targets, dt=0.001)
+    assert np.max(np.abs(actual - expected)) < 1e-9
+
+    # Batch 엔진: 공유 메모리 일괄 검색 결과가 독립 엔진과 동일
+    configs = [CerebellumConfig(), CerebellumConfig(min_confidence=0.9), CerebellumConfig(memory_gain=0.8)]
+    engines = [CerebellumEngine(memory_dim=5, config=c, memory=memory) for c in configs]
+    batch = BatchCerebellumEngine(len(configs), memory_dim=5, configs=configs, memory=memory)
+    for step in range(100):
+        current = np.stack([states[step] + 0.002 * i for i in range(len(configs))])
+        target = np.stack([targets[step]] * len(configs))
+        expected = np.stack([e.compute_correction(current[i], target[i], dt=0.001) for i, e in enumerate(engines)])
+        actual = batch.compute_correction(current, target, dt=0.001)
+        assert np.max(np.abs(actual - expected)) < 1e-12
+
+    # confidence 0으로 저장된 항목도 적중 (min_confidence로 클리핑) - 일괄/단계별 경로 동일
+    weak = ArrayMemory()
+    weak.store(np.zeros(5), np.full(5, 0.5), confidence=0.0)
+    weak_biases, weak_confidences = weak.retrieve_many(np.zeros((1, 5)))
+    assert weak_confidences[0] == 0.0 and np.array_equal(weak_biases[0], np.full(5, 0.5))
+    states, targets = np.zeros((20, 5)), np.full((20, 5), 0.01)
+    stepwise = CerebellumEngine(memory_dim=5, memory=weak)
+    offline = CerebellumEngine(memory_dim=5, memory=weak)
+    expected = np.array([stepwise.compute_correction(s, t, dt=0.001) for s, t in zip(states, targets)])
+    actual = offline.compute_corrections(states, targets, dt=0.001)
+    assert np.max(np.abs(actual - expected)) < 1e-9
+    no_memory = CerebellumEngine(memory_dim=5).compute_corrections(states, targets, dt=0.001)
+    assert np.max(np.abs(actual - no_memory)) > 0.01  # 기억이 실제로 적용됨
+    weak_engines = [CerebellumEngine(memory_dim=5, memory=weak) for _ in range(2)]
+    weak_batch = BatchCerebellumEngine(2, memory_dim=5, memory=weak)
+    for s, t in zip(states, targets):
+        expected = np.stack([e.compute_correction(s, t, dt=0.001) for e in weak_engines])
+        actual = weak_batch.compute_correction(np.stack([s, s]), np.stack([t, t]), dt=0.001)
+        assert np.max(np.abs(actual - expected)) < 1e-12
+
+    # 공유 메모리 retrieve_many 실패는 행별 회로 차단기에 기록
+    class FailingBatchMemory(ArrayMemory):
+        def retrieve_many(self, keys, contexts=None):
+            raise ConnectionError("memory backend unavailable")
+
+    failing_batch = BatchCerebellumEngine(2, memory_dim=5, memory=FailingBatchMemory())
+    for _ in range(5):
+        failing_batch.compute_correction(np.zeros((2, 5)), np.zeros((2, 5)), dt=0.001)
+    assert all(b.state == 'open' and 'ConnectionError' in b.last_error for b in failing_batch.memory_breakers)
+    print("✅ 일괄 기억 검색 확인!")
+
+
+def _read_mapped_snapshot(path):
+    """다른 프로세스에서 읽기 전용으로 열어 스냅샷 (테스트 23)"""
+    keys, biases, confidences = MappedMemory(path, readonly=True).snapshot()
+    return len(keys), float(biases.sum()), float(confidences.sum())
+
+
+def test_mapped_memory():
+    """MappedMemory가 파일에서 바로 열리고, 확장/덮어쓰기/다른 프로세스 읽기가 되는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 23: 파일 매핑 메모리")
+    print("=" * 70)
+
+    rng = np.random.default_rng(23)
+    n = 200000
+    keys = rng.normal(0, 1.0, (n, 5))
+    values = rng.normal(0, 0.001, (n, 5))
+    queries = keys[:100] + rng.normal(0, 0.01, (100, 5))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'map.cbmm')
+
+        # 기준: store() 반복으로 다시 채우는 시간
+        reference = ArrayMemory()
+        start = time.perf_counter()
+        for key, value in zip(keys, values):
+            reference.store(key, value, confidence=0.8)
+        rebuild_ms = (time.perf_counter() - start) * 1e3
+
+        with MappedMemory(path, initial_capacity=1000) as writer:
+            writer.extend(keys[:1000], values[:1000], 0.8)
+            for key, value in zip(keys[1000:2000], values[1000:2000]):
+                writer.store(key, value, confidence=0.8)
+            writer.extend(keys[2000:], values[2000:], 0.8)  # 파일 끝에 덧붙여 확장
+            assert len(writer) == n and writer.capacity >= n
+
+        start = time.perf_counter()
+        memory = MappedMemory(path)
+        open_ms = (time.perf_counter() - start) * 1e3
+        assert len(memory) == n and memory.radius == 0.1
+        assert memory._row_index is None  # 검색만 하면 색인을 만들지 않음
+        expected = reference.retrieve_many(queries)
+        actual = memory.retrieve_many(queries)
+        assert np.array_equal(actual[0], expected[0]) and np.allclose(actual[1], expected[1], equal_nan=True)
+        result = memory.retrieve(keys[5])[0]
+        assert type(result['bias']) is np.ndarray and np.array_equal(result['bias'], values[5])
+        print(f"   {n}개: store() 재구성 {rebuild_ms:.0f}ms, 파일 열기 {open_ms:.2f}ms")
+
+        # 덮어쓰기/삭제 (첫 쓰기에서 색인 생성)
+        memory.store(keys[5], np.ones(5), confidence=0.9)
+        assert len(memory) == n and np.array_equal(memory.retrieve(keys[5])[0]['bias'], np.ones(5))
+        assert memory.remove(keys[6]) and len(memory) == n - 1 and memory.retrieve(keys[6]) == []
+
+        # 읽기 전용: refresh() 전에는 확정된 행만, 이후 새 행 반영
+        reader = MappedMemory(path, readonly=True)
+        try:
+            reader.store(keys[0], values[0])
+            raise AssertionError("읽기 전용 메모리에 저장됨")
+        except ValueError:
+            pass
+        version = reader.version
+        memory.extend(rng.normal(5.0, 1.0, (70000, 5)), np.zeros((70000, 5)), 0.5)
+        assert len(reader) == n - 1
+        assert reader.refresh() and len(reader) == n - 1 + 70000 and reader.version > version
+        assert not reader.refresh()
+
+        # 기록 중(세대 번호 홀수)에는 스냅샷이 기다렸다가 완료된 상태를 복사
+        memory._begin_write()
+        threading.Timer(0.02, memory._end_write).start()
+        snapshot_keys, _, snapshot_confidences = reader.snapshot()
+        assert len(snapshot_keys) == len(memory) and memory.generation % 2 == 0
+        memory._begin_write()
+        try:
+            reader.snapshot(timeout=0.01)
+            raise AssertionError("기록 중인 파일의 스냅샷이 반환됨")
+        except TimeoutError:
+            pass
+        memory._end_write()
+        memory.flush()
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            size, bias_sum, confidence_sum = pool.submit(_read_mapped_snapshot, path).result()
+        assert size == len(memory) and abs(bias_sum - float(memory.biases.sum())) < 1e-6
+        assert abs(confidence_sum - float(memory.confidences.sum())) < 1e-6
+        print(f"   다른 프로세스 스냅샷: {size}행")
+        reader.close()
+        memory.close()
+
+        # 닫은 뒤 쓰기는 ValueError (첫 쓰기 경로로 파일을 다시 만들어 자르지 않음)
+        for write in (lambda: memory.store(keys[0], values[0]), lambda: memory.extend(keys[:2], values[:2])):
+            try:
+                write()
+                raise AssertionError("닫힌 메모리에 저장됨")
+            except ValueError:
+                pass
+        with MappedMemory(path) as reopened:
+            assert len(reopened) == size
+
+        # 만든 뒤에 다른 쓰기 쪽이 파일을 생성했으면 첫 쓰기는 그 파일을 매핑
+        late_path = os.path.join(directory, 'late.cbmm')
+        late = MappedMemory(late_path)
+        with MappedMemory(late_path) as other:
+            other.extend(keys[:10], values[:10], 0.8)
+        late.store(keys[10], values[10])
+        assert len(late) == 11 and np.array_equal(late.retrieve(keys[3])[0]['bias'], values[3])
+        late.close()
+
+        # 용량 확장은 기록 구간(세대 홀수) 안에서, 그동안 refresh()는 반영하지 않음
+        grow_path = os.path.join(directory, 'grow.cbmm')
+        growing = MappedMemory(grow_path, initial_capacity=4)
+        growing.extend(keys[:4], values[:4], 0.8)
+        watcher = MappedMemory(grow_path, readonly=True)
+        parities = []
+        original_grow = growing._grow
+
+        def checked_grow():
+            parities.append(growing.generation % 2)
+            original_grow()
+            assert not watcher.refresh()  # 기록 중에는 새 용량/size를 반영하지 않음
+
+        growing._grow = checked_grow
+        growing.extend(keys[4:20], values[4:20], 0.8)
+        assert parities and all(parities)
+        assert watcher.refresh() and len(watcher) == 20 and watcher.capacity == growing.capacity
+        watcher.close()
+        growing.close()
+
+        try:
+            MappedMemory(os.path.join(directory, 'missing.cbmm'), readonly=True)
+            raise AssertionError("없는 파일이 열림")
+        except FileNotFoundError:
+            pass
+        bad_path = os.path.join(directory, 'bad.cbmm')
+        with open(bad_path, 'wb') as f:
+            f.write(b'\0' * 128)
+        try:
+            MappedMemory(bad_path)
+            raise AssertionError("잘못된 파일이 열림")
+        except ValueError:
+            pass
+    print("✅ 파일 매핑 메모리 확인!")
+
+
+def test_context_memory():
+    """ContextMemory가 맥락 분할만 검색하고, 엔진이 반환된 맥락 일치도를 쓰는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 24: 맥락 분할 메모리")
+    print("=" * 70)
+
+    memory = ContextMemory(partition_keys=('tool', 'altitude'), bands={'altitude': 100.0})
+    key = np.zeros(3)
+    memory.store(key, np.full(3, 1.0), confidence=0.8, context={'tool': 'A', 'altitude': 250.0})
+    memory.store(key, np.full(3, 2.0), confidence=0.8, context={'tool': 'B', 'altitude': 250.0})
+    assert memory.n_partitions == 2 and len(memory) == 2
+
+    # 같은 분할: 분할별 기억, match = 1 (분할 키에 없는 맥락 키는 무시)
+    result = memory.retrieve(key, {'tool': 'A', 'altitude': 210.0, 'airspeed': 50.0})[0]
+    assert np.array_equal(result['bias'], np.full(3, 1.0)) and result['match'] == 1.0
+    assert np.array_equal(memory.retrieve(key, {'tool': 'B', 'altitude': 299.0})[0]['bias'], np.full(3, 2.0))
+
+    # 이웃 구간 대체: 구간 하나 차이 → neighbour_score, 두 구간 이상/다른 도구 → 없음
+    result = memory.retrieve(key, {'tool': 'A', 'altitude': 320.0})[0]
+    assert np.array_equal(result['bias'], np.full(3, 1.0)) and result['match'] == 0.5
+    assert memory.retrieve(key, {'tool': 'A', 'altitude': 450.0}) == []
+    assert memory.retrieve(key, {'tool': 'C', 'altitude': 250.0}) == []
+    strict = ContextMemory(partition_keys=('tool', 'altitude'), bands={'altitude': 100.0}, fallback=False)
+    strict.store(key, np.ones(3), context={'tool': 'A', 'altitude': 250.0})
+    assert strict.retrieve(key, {'tool': 'A', 'altitude': 320.0}) == []
+    stats = memory.get_stats()
+    assert (stats['exact_hits'], stats['fallback_hits'], stats['misses']) == (2, 1, 2)
+
+    # 일괄 검색: 행마다 retrieve와 같은 bias/confidence/match (미적중 nan)
+    probe_contexts = [{'tool': 'A', 'altitude': 210.0}, {'tool': 'A', 'altitude': 320.0},
+                      {'tool': 'B', 'altitude': 250.0}, {'tool': 'C', 'altitude': 250.0}]
+    biases, confidences, matches = memory.retrieve_many(np.zeros((4, 3)), probe_contexts)
+    for i, context in enumerate(probe_contexts):
+        result = memory.retrieve(key, context)
+        if result:
+            assert np.array_equal(biases[i], result[0]['bias']) and confidences[i] == result[0]['confidence']
+            assert matches[i] == result[0]['match']
+        else:
+            assert np.isnan(confidences[i]) and np.isnan(matches[i]) and not biases[i].any()
+    assert list(matches[:3]) == [1.0, 0.5, 1.0]
+
+    assert memory.remove(key, {'tool': 'B', 'altitude': 250.0}) and len(memory) == 1
+    assert not memory.remove(key, {'tool': 'D'})
+
+    # 엔진: match를 맥락 가중치로 사용 (기준 엔진은 맥락 없음 → 근사 가중치 0.5 = match)
+    rng = np.random.default_rng(24)
+    stored = rng.normal(0, 0.05, (40, 5))
+    values = rng.normal(0, 0.01, (40, 5))
+    partitioned = ContextMemory(partition_keys=('tool', 'altitude'), bands={'altitude': 100.0})
+    flat = ArrayMemory()
+    for state, value in zip(stored, values):
+        partitioned.store(state, value, confidence=0.8, context={'tool': 'A', 'altitude': 150.0})
+        flat.store(state, value, confidence=0.8)
+    states, targets = make_trajectory(120, seed=24)
+    states[::3] = stored  # 일부 스텝은 기억 적중
+    neighbour_context = {'tool': 'A', 'altitude': 260.0, 'airspeed': 40.0}  # 근사였다면 0.8
+
+    engine = CerebellumEngine(memory_dim=5, memory=partitioned)
+    reference = CerebellumEngine(memory_dim=5, memory=flat)
+    expected = np.array([reference.compute_correction(s, t, context=None, dt=0.001) for s, t in zip(states, targets)])
+    actual = np.array([
+        engine.compute_correction(s, t, context=neighbour_context, dt=0.001) for s, t in zip(states, targets)
+    ])
+    assert np.max(np.abs(actual - expected)) < 1e-12
+
+    offline = CerebellumEngine(memory_dim=5, memory=partitioned)
+    corrections = offline.compute_corrections(states, targets, contexts=[neighbour_context] * 120, dt=0.001)
+    assert np.max(np.abs(corrections - expected)) < 1e-9
+
+    batch = BatchCerebellumEngine(2, memory_dim=5, memory=partitioned)
+    reference_batch = BatchCerebellumEngine(2, memory_dim=5, memory=flat)
+    for s, t in zip(states[:60], targets[:60]):
+        pair, target_pair = np.stack([s, s + 0.001]), np.stack([t, t])
+        actual = batch.compute_correction(pair, target_pair, contexts=neighbour_context, dt=0.001)
+        expected = reference_batch.compute_correction(pair, target_pair, contexts=None, dt=0.001)
+        assert np.max(np.abs(actual - expected)) < 1e-12
+
+    # 분할 검색: 도구 20개 × 5000개 중 해당 도구만 검색
+    tools = [f'T{i}' for i in range(20)]
+    by_tool = ContextMemory(partition_keys=('tool',))
+    everything = ArrayMemory()
+    for index, tool in enumerate(tools):
+        for state in rng.normal(0, 1.0, (5000, 5)):
+            by_tool.store(state, np.zeros(5), context={'tool': tool})
+            everything.store(state + index * 10.0, np.zeros(5))
+    probes = rng.normal(0, 1.0, (200, 5))
+    timings = []
+    for memory_under_test, context in ((everything, None), (by_tool, {'tool': 'T7'})):
+        start = time.perf_counter()
+        for probe in probes:
+            memory_under_test.retrieve(probe, context)
+        timings.append((time.perf_counter() - start) / len(probes) * 1e6)
+    print(f"   100000개 (도구 20개): 전체 검색 {timings[0]:.1f}us, 분할 검색 {timings[1]:.1f}us")
+    print("✅ 맥락 분할 메모리 확인!")
+
+
+def test_context_registry():
+    """ContextRegistry ID가 dict 맥락과 같은 보정을 내고, ContextMemory 분할 키로 쓰이는지 테스트"""
+    print("\n" + "=" * 70)
+    print("테스트 25: 맥락 ID 등록부")
+    print("=" * 70)
+
+    registry = ContextRegistry(fields=('altitude', 'airspeed', 'mode'), quantize={'altitude': 500.0})
+    first = registry.intern({'altitude': 10100.0, 'airspeed': 250.0, 'mode': 'autopilot'})
+    # 키 순서와 무관, 같은 양자화 구간이면 같은 ID
+    assert registry.intern({'mode': 'autopilot', 'airspeed': 250.0, 'altitude': 10400.0}) == first
+    assert registry.intern({'altitude': 10600.0, 'airspeed': 250.0, 'mode': 'autopilot'}) != first
+    assert registry.intern_values(10200.0, 250.0, 'autopilot') == first
+    assert registry.intern(first) == first
+    assert registry.intern(None) == registry.intern({}) == NO_CONTEXT
+    assert registry.weight(first) == 0.8 and registry.weight(NO_CONTEXT) == 0.5
+    assert registry.context(first)['altitude'] == 10100.0 and len(registry) == 3
+    try:
+        registry.intern(99)
+        assert False, "등록되지 않은 ID는 ValueError여야 함"
+    except ValueError:
+        pass
+
+    # 엔진: ID 입력 = dict 입력 (단일 스텝, 오프라인, 일괄)
+    rng = np.random.default_rng(25)
+    memory = ArrayMemory()
+    stored = rng.normal(0, 0.05, (40, 5))
+    for state, value in zip(stored, rng.normal(0, 0.01, (40, 5))):
+        memory.store(state, value, confidence=0.8)
+    states, targets = make_trajectory(120, seed=25)
+    states[::3] = stored
+    context = {'altitude': 10100.0, 'airspeed': 250.0, 'mode': 'autopilot'}
+
+    by_dict = CerebellumEngine(memory_dim=5, memory=memory)
+    by_id = CerebellumEngine(memory_dim=5, memory=memory)
+    by_id.set_context_registry(registry)
+    expected = np.array([by_dict.compute_correction(s, t, context=context, dt=0.001) for s, t in zip(states, targets)])
+    actual = np.array([by_id.compute_correction(s, t, context=first, dt=0.001) for s, t in zip(states, targets)])
+    assert np.array_equal(actual, expected)
+
+    offline = CerebellumEngine(memory_dim=5, memory=memory)
+    offline.set_context_registry(registry)
+    assert np.max(np.abs(offline.compute_corrections(states, targets, contexts=[first] * 120, dt=0.001)
+                         - expected)) < 1e-9
+
+    batch_dict = BatchCerebellumEngine(2, memory_dim=5, memory=memory)
+    batch_id = BatchCerebellumEngine(2, memory_dim=5, memory=memory)
+    batch_id.set_context_registry(registry)
+    for s, t in zip(states[:60], targets[:60]):
+        pair, target_pair = np.stack([s, s + 0.001]), np.stack([t, t])
+        expected_pair = batch_dict.compute_correction(pair, target_pair, contexts=[context, None], dt=0.001)
+        actual_pair = batch_id.compute_correction(pair, target_pair, contexts=[first, NO_CONTEXT], dt=0.001)
+        assert np.array_equal(actual_pair, expected_pair)
+
+    # 등록부 없이 ID → ValueError
+    try:
+        CerebellumEngine(memory_dim=5).compute_correction(states[0], targets[0], context=first)
+        assert False, "등록부 없는 ID는 ValueError여야 함"
+    except ValueError:
+        pass
+
+    # ContextMemory: 같은 등록부의 ID를 분할 키로 사용
+    partitioned = ContextMemory(partition_keys=('mode',), context_registry=registry)
+    key = np.zeros(3)
+    partitioned.store(key, np.ones(3), context=first)
+    manual = registry.intern({'mode': 'manual'})
+    assert partitioned.retrieve(key, first)[0]['match'] == 1.0
+    assert partitioned.retrieve(key, {'mode': 'autopilot'})[0]['match'] == 1.0
+    assert partitioned.retrieve(key, manual) == []
+    partitioned.store(key, np.full(3, 2.0), context={'mode': 'manual'})
+    assert np.array_equal(partitioned.retrieve(key, manual)[0]['bias'], np.full(3, 2.0))
+
+    # 분할 조회 비용: 틱마다 새 dict (분할 키 계산) vs intern_values (캐시된 분할)
+    by_context = ContextMemory(partition_keys=('altitude', 'airspeed', 'mode'),
+                               bands={'altitude': 500.0}, context_registry=registry)
+    for state in rng.normal(0, 1.0, (200, 5)):
+        by_context.store(state, np.zeros(5), context=first)
+    probes = rng.normal(0, 1.0, (20000, 5))
+    timings = []
+    for make_context in (
+        lambda: {'altitude': 10100.0, 'airspeed': 250.0, 'mode': 'autopilot'},
+        lambda: registry.intern_values(10100.0, 250.0, 'autopilot'),
+    ):
+        start = time.perf_counter()
+        for _ in range(len(probes)):
+            by_context.memory_for(make_context())
+        timings.append((time.perf_counter() - start) / len(probes) * 1e6)
+    assert by_context.retrieve(probes[0], first) == by_context.retrieve(probes[0], context)
+    print(f"   분할 조회: dict 맥락 {timings[0]:.2f}us, 맥락 ID {timings[1]:.2f}us")
+    print("✅ 맥락 ID 등록부 확인!")
+
+
+def main():
+    """메인 테스트 함수"""
+    print("\n" + "=" * 70)
+    print("v0.7 성능 기능 테스트")
+    print("=" * 70)
+
+    try:
+        test_ring_buffer_moving_average()
+        test_batch_engine_equivalence()
+        test_offline_trajectory_mode()
+        test_allocation_free_correction()
+        test_fused_kernel_recompile()
+        test_stage_profiling()
+        test_deadline_mode()
+        test_async_prefetch()
+        test_memory_bias_cache()
+        test_memory_circuit_breaker()
+        test_iir_low_pass_filter()
+        test_derivative_estimators()
+        test_multi_rate_stages()
+        test_snapshot_restore()
+        test_scalar_backend()
+        test_engine_registry()
+        test_config_sweep()
+        test_array_memory()
+        test_grid_memory()
+        test_tree_memory()
+        test_bounded_memory()
+        test_retrieve_many()
+        test_mapped_memory()
+        test_context_memory()
+        test_context_registry()
+
+        print("\n" + "=" * 70)
+        print("✅ 모든 v0.7 성능 기능 테스트 완료!")
+        print("=" * 70)
+
+    except Exception as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -13,37 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import numpy as np
 from cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig
-
-
-class MockMemory:
-    """해마 메모리 모의 객체 (confidence 포함)"""
-    def __init__(self):
-        self.memories = {}
-    
-    def retrieve(self, key, context=None):
-        """기억 검색 (confidence 포함)"""
-        if len(self.memories) == 0:
-            return []
-        
-        best_match = None
-        best_distance = float('inf')
-        
-        for stored_key, (value, conf) in self.memories.items():
-            distance = np.linalg.norm(key - stored_key)
-            if distance < best_distance:
-                best_distance = distance
-                best_match = {
-                    'bias': value,
-                    'confidence': conf * (1.0 / (1.0 + distance))  # 거리에 따라 confidence 감소
-                }
-        
-        if best_match and best_distance < 0.1:
-            return [best_match]
-        return []
-    
-    def store(self, key, value, confidence=0.9, context=None):
-        """기억 저장 (confidence 포함)"""
-        self.memories[tuple(key)] = (value, confidence)
+from cerebellum.array_memory import ArrayMemory
 
 
 def test_confidence_based_gain():
@@ -58,7 +28,7 @@ def test_confidence_based_gain():
     )
     
     # 높은 confidence 메모리
-    memory_high = MockMemory()
+    memory_high = ArrayMemory()
     memory_high.store(
         np.array([1.0, 0.5, 0.3, 10.0, 5.0]),
         np.array([0.001, 0.002, 0.0, 0.0, 0.0]),
@@ -67,7 +37,7 @@ def test_confidence_based_gain():
     engine_high = CerebellumEngine(memory_dim=5, config=config, memory=memory_high)
     
     # 낮은 confidence 메모리
-    memory_low = MockMemory()
+    memory_low = ArrayMemory()
     memory_low.store(
         np.array([1.0, 0.5, 0.3, 10.0, 5.0]),
         np.array([0.001, 0.002, 0.0, 0.0, 0.0]),
@@ -148,7 +118,7 @@ def test_context_weight():
         memory_gain=0.4
     )
     
-    memory = MockMemory()
+    memory = ArrayMemory()
     memory.store(
         np.array([1.0, 0.5, 0.3, 10.0, 5.0]),
         np.array([0.001, 0.002, 0.0, 0.0, 0.0]),